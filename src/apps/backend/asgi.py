@@ -0,0 +1,113 @@
+import asyncio
+from typing import Optional
+
+from hypercorn.middleware import AsyncioWSGIMiddleware, ProxyFixMiddleware
+from hypercorn.typing import ASGIFramework, ASGIReceiveCallable, ASGISendCallable, Scope
+from quart import Blueprint, Quart, Response, jsonify, request
+from quart.typing import ResponseReturnValue
+from werkzeug.exceptions import HTTPException
+
+from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
+from modules.application.application_service import ApplicationService
+from modules.application.common.blocking_call_executor import BlockingCallExecutor
+from modules.application.common.constants import CAUSAL_TOKEN_HEADER
+from modules.application.errors import AppError
+from modules.config.config_service import ConfigService
+from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
+from server import app
+
+# Importing the Flask app runs the startup work (logger, bootstrap, Temporal) once for both apps
+async_app = Quart(__name__)
+
+CORS_ORIGIN = "http://localhost:3000"
+
+# Register account and task apis
+async_api_blueprint = Blueprint("api", __name__, url_prefix="/api")
+async_api_blueprint.register_blueprint(AccountRestApiServer.create_async())
+async_api_blueprint.register_blueprint(TaskRestApiServer.create_async())
+async_app.register_blueprint(async_api_blueprint)
+
+
+@async_app.before_serving
+async def share_blocking_call_executor() -> None:
+    # Requests handed to the Flask app run on the loop's default executor; sharing it keeps one bound on the threads
+    asyncio.get_running_loop().set_default_executor(BlockingCallExecutor.get_executor())
+
+
+@async_app.after_request
+async def add_cors_headers(response: Response) -> Response:
+    # Preflight requests are answered by the Flask app, which also handles the OPTIONS method of these routes
+    if request.headers.get("Origin") == CORS_ORIGIN:
+        response.headers["Access-Control-Allow-Origin"] = CORS_ORIGIN
+        response.headers.add("Vary", "Origin")
+        response.headers["Access-Control-Expose-Headers"] = CAUSAL_TOKEN_HEADER
+
+    result = response
+    return result
+
+
+# The blocking calls of a request run in copies of its context, which all share the scope started here
+@async_app.before_request
+async def start_causal_session_scope() -> None:
+    ApplicationService.start_causal_session_scope(causal_token=request.headers.get(CAUSAL_TOKEN_HEADER))
+
+
+@async_app.after_request
+async def add_causal_token_header(response: Response) -> Response:
+    causal_token = ApplicationService.get_causal_token()
+    if causal_token is not None:
+        response.headers[CAUSAL_TOKEN_HEADER] = causal_token
+
+    result = response
+    return result
+
+
+@async_app.teardown_request
+async def end_causal_session_scope(exc: Optional[BaseException]) -> None:
+    # Ending a session only returns it to the client's pool, so it does not block the loop
+    ApplicationService.end_causal_session_scope()
+
+
+@async_app.errorhandler(AppError)
+async def handle_error(exc: AppError) -> ResponseReturnValue:
+    result = jsonify({"message": exc.message, "code": exc.code}), exc.http_code or 500
+    return result
+
+
+class ServingModeDispatcher:
+    """
+    Serves the routes registered on the async app on the event loop and hands every other request, i.e. the
+    authentication APIs, the frontend and CORS preflights, to the Flask app, which hypercorn runs on the loop's
+    executor. Lifespan events go to the async app so its serving hooks run.
+    """
+
+    def __init__(self, *, async_app: Quart, wsgi_app: AsyncioWSGIMiddleware) -> None:
+        self.async_app: ASGIFramework = async_app
+        self.wsgi_app = wsgi_app
+        self.url_adapter = async_app.url_map.bind("localhost")
+
+        if ConfigService.has_value("is_server_running_behind_proxy") and ConfigService[bool].get_value(
+            "is_server_running_behind_proxy"
+        ):
+            self.async_app = ProxyFixMiddleware(async_app)
+
+    def is_async_route(self, *, path: str, method: str) -> bool:
+        if method == "OPTIONS":
+            return False
+
+        try:
+            self.url_adapter.match(path, method)
+        except HTTPException:
+            return False
+
+        return True
+
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        if scope["type"] == "http" and not self.is_async_route(path=scope["path"], method=scope["method"]):
+            await self.wsgi_app(scope, receive, send)
+            return
+
+        await self.async_app(scope, receive, send)
+
+
+application = ServingModeDispatcher(async_app=async_app, wsgi_app=AsyncioWSGIMiddleware(app))
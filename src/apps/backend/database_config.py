@@ -0,0 +1,27 @@
+from typing import List, Type
+
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.application.repository import ApplicationRepository
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.task.internal.store.comment_repository import CommentRepository
+from modules.task.internal.store.task_repository import TaskRepository
+
+
+class DatabaseConfig:
+    # Repositories whose indexes and validator scripts/sync_database_schema.py applies
+    REPOSITORIES: List[Type[ApplicationRepository]] = [
+        AccountRepository,
+        AccountNotificationPreferencesRepository,
+        CommentRepository,
+        NotificationOutboxRepository,
+        OTPRepository,
+        PasswordResetTokenRepository,
+        TaskRepository,
+    ]
@@ -1,5 +1,10 @@
 import multiprocessing
 
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+
+from modules.config.config_service import ConfigService
+
 # Server Socket
 bind = "0.0.0.0:8080"
 
@@ -8,6 +13,10 @@ workers = multiprocessing.cpu_count() * 2 + 1
 worker_class = "gthread"
 threads = 2 * multiprocessing.cpu_count()
 
+# Import the app, and run its startup work, once in the master and fork the workers from it so they share its memory
+# copy-on-write. A preloaded app is not reloaded by --reload, so it stays off where code changes while serving.
+preload_app = ConfigService[bool].get_value(key="server.preload_app", default=False)
+
 # Logging
 loglevel = "info"
 accesslog = "-"
@@ -17,3 +26,18 @@ errorlog = "-"
 # Timeout
 timeout = 30
 keepalive = 2
+
+
+def post_fork(server: Arbiter, worker: Worker) -> None:
+    if not server.cfg.preload_app:
+        return
+
+    # Clients and background threads created while preloading belong to the master; every worker needs its own
+    from modules.application.application_service import ApplicationService
+    from modules.logger.logger_manager import LoggerManager
+    from modules.notification.notification_service import NotificationService
+
+    LoggerManager.reset_after_fork()
+    ConfigService.reset_after_fork()
+    ApplicationService.reset_after_fork()
+    NotificationService.reset_provider_clients()
@@ -0,0 +1,20 @@
+import multiprocessing
+
+# Server Socket
+bind = ["0.0.0.0:8080"]
+
+# Worker Processes
+# Workers are spawned, not forked, so each imports the app and runs its startup work itself. A worker serves all of its
+# connections on one event loop, so one per core is enough; blocking calls run on its BlockingCallExecutor threads.
+workers = multiprocessing.cpu_count()
+worker_class = "asyncio"
+
+# Logging
+loglevel = "info"
+accesslog = "-"
+access_log_format = "app - request - %(h)s - %(s)s - %(m)s - %(L)ss - %(U)s - %(a)s"
+errorlog = "-"
+
+# Timeout
+graceful_timeout = 30
+keep_alive_timeout = 2
@@ -1,3 +1,4 @@
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
@@ -11,6 +12,7 @@ from modules.account.types import (
     ResetPasswordParams,
     UpdateAccountProfileParams,
 )
+from modules.application.common.types import CacheStats
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreateOTPParams
 from modules.notification.notification_service import NotificationService
@@ -86,7 +88,8 @@ class AccountService:
 
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
-        result = AccountReader.get_account_by_username_and_password(params=params)
+        account = AccountReader.get_account_by_username_and_password(params=params)
+        result = AccountWriter.rehash_password_if_needed(account=account, password=params.password)
         return result
 
     @staticmethod
@@ -111,3 +114,8 @@ class AccountService:
     def delete_account(*, account_id: str) -> AccountDeletionResult:
         result = AccountWriter.delete_account(account_id=account_id)
         return result
+
+    @staticmethod
+    def get_account_cache_stats() -> CacheStats:
+        result = AccountCache.get_stats()
+        return result
@@ -0,0 +1,72 @@
+from modules.account.account_service import AccountService
+from modules.account.types import (
+    Account,
+    AccountDeletionResult,
+    AccountSearchByIdParams,
+    CreateAccountByPhoneNumberParams,
+    CreateAccountByUsernameAndPasswordParams,
+    ResetPasswordParams,
+    UpdateAccountProfileParams,
+)
+from modules.application.common.blocking_call_executor import BlockingCallExecutor
+from modules.notification.types import (
+    AccountNotificationPreferences,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+)
+
+
+class AsyncAccountService:
+    """
+    AccountService for the async (ASGI) app. Calls that send an OTP or email run with their queries on the
+    BlockingCallExecutor, so a slow provider holds one of its threads rather than the event loop.
+    """
+
+    @staticmethod
+    async def create_account_by_username_and_password(*, params: CreateAccountByUsernameAndPasswordParams) -> Account:
+        result = await BlockingCallExecutor.run(AccountService.create_account_by_username_and_password, params=params)
+        return result
+
+    @staticmethod
+    async def get_or_create_account_by_phone_number(*, params: CreateAccountByPhoneNumberParams) -> Account:
+        result = await BlockingCallExecutor.run(AccountService.get_or_create_account_by_phone_number, params=params)
+        return result
+
+    @staticmethod
+    async def reset_account_password(*, params: ResetPasswordParams) -> Account:
+        result = await BlockingCallExecutor.run(AccountService.reset_account_password, params=params)
+        return result
+
+    @staticmethod
+    async def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
+        result = await BlockingCallExecutor.run(AccountService.get_account_by_id, params=params)
+        return result
+
+    @staticmethod
+    async def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams) -> Account:
+        result = await BlockingCallExecutor.run(
+            AccountService.update_account_profile, account_id=account_id, params=params
+        )
+        return result
+
+    @staticmethod
+    async def create_or_update_account_notification_preferences(
+        *, account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
+    ) -> AccountNotificationPreferences:
+        result = await BlockingCallExecutor.run(
+            AccountService.create_or_update_account_notification_preferences,
+            account_id=account_id,
+            preferences=preferences,
+        )
+        return result
+
+    @staticmethod
+    async def get_account_notification_preferences_by_account_id(*, account_id: str) -> AccountNotificationPreferences:
+        result = await BlockingCallExecutor.run(
+            AccountService.get_account_notification_preferences_by_account_id, account_id=account_id
+        )
+        return result
+
+    @staticmethod
+    async def delete_account(*, account_id: str) -> AccountDeletionResult:
+        result = await BlockingCallExecutor.run(AccountService.delete_account, account_id=account_id)
+        return result
@@ -0,0 +1,91 @@
+import threading
+from typing import Optional
+
+from flask import g, has_app_context
+
+from modules.account.types import Account
+from modules.application.common.config_ttl_cache import ConfigTTLCache
+from modules.application.common.types import CacheStats
+
+
+class AccountCache:
+    """
+    Two-level cache of accounts keyed by id.
+
+    The first level is an identity map on flask.g, so an account is read at most once per request. The second level
+    is an optional process-wide TTL/LRU cache enabled with accounts.cache.enabled; writes in this process invalidate
+    it, writes in other processes become visible once the TTL expires.
+    """
+
+    _process_cache: ConfigTTLCache[Account] = ConfigTTLCache(
+        config_key="accounts.cache", enabled_by_default=False, ttl_in_seconds=30
+    )
+    _lock = threading.Lock()
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def get(cls, *, account_id: str) -> Optional[Account]:
+        request_accounts = cls._get_request_accounts()
+        account = request_accounts.get(account_id) if request_accounts is not None else None
+
+        if account is None:
+            account = cls._process_cache.get(account_id)
+            if account is not None and request_accounts is not None:
+                request_accounts[account_id] = account
+
+        with cls._lock:
+            if account is None:
+                cls._misses += 1
+            else:
+                cls._hits += 1
+
+        result = account
+        return result
+
+    @classmethod
+    def set(cls, *, account: Account) -> None:
+        request_accounts = cls._get_request_accounts()
+        if request_accounts is not None:
+            request_accounts[account.id] = account
+
+        cls._process_cache.set(account.id, account)
+
+    @classmethod
+    def invalidate(cls, *, account_id: str) -> None:
+        request_accounts = cls._get_request_accounts()
+        if request_accounts is not None:
+            request_accounts.pop(account_id, None)
+
+        cls._process_cache.invalidate(account_id)
+
+    @classmethod
+    def clear(cls) -> None:
+        request_accounts = cls._get_request_accounts()
+        if request_accounts is not None:
+            request_accounts.clear()
+
+        cls._process_cache.clear()
+        with cls._lock:
+            cls._hits = 0
+            cls._misses = 0
+
+    @classmethod
+    def get_stats(cls) -> CacheStats:
+        size = cls._process_cache.get_stats().size
+
+        with cls._lock:
+            result = CacheStats(hits=cls._hits, misses=cls._misses, size=size)
+            return result
+
+    @staticmethod
+    def _get_request_accounts() -> Optional[dict[str, Account]]:
+        # flask.g lives for one application context, which Flask pushes per request
+        if not has_app_context():
+            return None
+
+        if "account_identity_map" not in g:
+            g.account_identity_map = {}
+
+        result: dict[str, Account] = g.account_identity_map
+        return result
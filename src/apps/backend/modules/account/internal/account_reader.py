@@ -11,6 +11,7 @@ from modules.account.errors import (
     AccountWithUserNameExistsError,
     AccountWithUsernameNotFoundError,
 )
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
@@ -43,11 +44,19 @@ class AccountReader:
 
     @staticmethod
     def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
+        cached_account = AccountCache.get(account_id=params.id)
+        if cached_account is not None:
+            result = cached_account
+            return result
+
         account_bson = AccountRepository.collection().find_one({"_id": ObjectId(params.id), "active": True})
         if account_bson is None:
             raise AccountWithIdNotFoundError(id=params.id)
 
-        result = AccountUtil.convert_account_bson_to_account(account_bson)
+        account = AccountUtil.convert_account_bson_to_account(account_bson)
+        AccountCache.set(account=account)
+
+        result = account
         return result
 
     @staticmethod
@@ -1,20 +1,24 @@
 from typing import Any
 
-import bcrypt
-
 from modules.account.internal.store.account_model import AccountModel
 from modules.account.types import Account
+from modules.application.common.password_hasher import PasswordHasher
 
 
 class AccountUtil:
     @staticmethod
     def hash_password(*, password: str) -> str:
-        result = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        result = PasswordHasher.hash(value=password)
         return result
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        result = bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        result = PasswordHasher.verify(value=password, hashed_value=hashed_password)
+        return result
+
+    @staticmethod
+    def password_needs_rehash(*, hashed_password: str) -> bool:
+        result = PasswordHasher.needs_rehash(hashed_value=hashed_password)
         return result
 
     @staticmethod
@@ -6,6 +6,7 @@ from phonenumbers import is_valid_number, parse
 from pymongo import ReturnDocument
 
 from modules.account.errors import AccountWithIdNotFoundError
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_model import AccountModel
@@ -36,8 +37,7 @@ class AccountWriter:
             phone_number=None,
             username=params.username,
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_bson = AccountRepository.insert_one_and_return(account_bson)
 
         result = AccountUtil.convert_account_bson_to_account(account_bson)
         return result
@@ -55,8 +55,7 @@ class AccountWriter:
         account_bson = AccountModel(
             first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_bson = AccountRepository.insert_one_and_return(account_bson)
 
         result = AccountUtil.convert_account_bson_to_account(account_bson)
         return result
@@ -69,12 +68,23 @@ class AccountWriter:
             {"$set": {"hashed_password": hashed_password}},
             return_document=ReturnDocument.AFTER,
         )
+        AccountCache.invalidate(account_id=account_id)
         if updated_account is None:
             raise AccountWithIdNotFoundError(id=account_id)
 
         result = AccountUtil.convert_account_bson_to_account(updated_account)
         return result
 
+    @staticmethod
+    def rehash_password_if_needed(*, account: Account, password: str) -> Account:
+        # Hashes created with an older cost factor are upgraded transparently while the plain password is at hand
+        if not AccountUtil.password_needs_rehash(hashed_password=account.hashed_password):
+            result = account
+            return result
+
+        result = AccountWriter.update_password_by_account_id(account_id=account.id, password=password)
+        return result
+
     @staticmethod
     def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams) -> Account:
         update_fields = {}
@@ -88,6 +98,7 @@ class AccountWriter:
         updated_account = AccountRepository.collection().find_one_and_update(
             {"_id": ObjectId(account_id)}, {"$set": update_fields}, return_document=ReturnDocument.AFTER
         )
+        AccountCache.invalidate(account_id=account_id)
         if updated_account is None:
             raise AccountWithIdNotFoundError(id=account_id)
 
@@ -103,6 +114,7 @@ class AccountWriter:
             return_document=ReturnDocument.AFTER,
         )
 
+        AccountCache.invalidate(account_id=account_id)
         if updated_account is None:
             raise AccountWithIdNotFoundError(id=account_id)
 
@@ -0,0 +1,78 @@
+from typing import Any, Optional, Union
+
+from modules.account.errors import AccountBadRequestError
+from modules.account.types import (
+    CreateAccountByPhoneNumberParams,
+    CreateAccountByUsernameAndPasswordParams,
+    CreateAccountParams,
+    PhoneNumber,
+    ResetPasswordParams,
+    UpdateAccountProfileParams,
+)
+from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+
+
+class AccountRequestParser:
+    """Validates account requests into service params, shared by the sync and the async views"""
+
+    @staticmethod
+    def parse_create_account_params(*, request_data: dict[str, Any]) -> CreateAccountParams:
+        result: CreateAccountParams
+        if "phone_number" in request_data:
+            phone_number_data = request_data["phone_number"]
+            phone_number_obj = PhoneNumber(**phone_number_data)
+            result = CreateAccountByPhoneNumberParams(phone_number=phone_number_obj)
+            return result
+
+        elif "username" in request_data and "password" in request_data:
+            result = CreateAccountByUsernameAndPasswordParams(**request_data)
+            return result
+
+        raise AccountBadRequestError("Invalid request data")
+
+    @staticmethod
+    def parse_update_account_params(
+        *, account_id: str, request_data: dict[str, Any]
+    ) -> Union[ResetPasswordParams, UpdateAccountProfileParams]:
+        result: Union[ResetPasswordParams, UpdateAccountProfileParams]
+        if "token" in request_data and "new_password" in request_data:
+            result = ResetPasswordParams(account_id=account_id, **request_data)
+            return result
+
+        elif "first_name" in request_data or "last_name" in request_data:
+            result = UpdateAccountProfileParams(
+                first_name=request_data.get("first_name"), last_name=request_data.get("last_name")
+            )
+            return result
+
+        raise AccountBadRequestError("Invalid request data")
+
+    @staticmethod
+    def parse_notification_preferences_params(
+        *, request_data: Optional[dict[str, Any]]
+    ) -> CreateOrUpdateAccountNotificationPreferencesParams:
+        if request_data is None:
+            raise AccountBadRequestError("Request body is required")
+
+        for field in ["email_enabled", "push_enabled", "sms_enabled"]:
+            if field in request_data and not isinstance(request_data[field], bool):
+                raise AccountBadRequestError(f"{field} must be a boolean")
+
+        preferences_kwargs = {}
+
+        if "email_enabled" in request_data:
+            preferences_kwargs["email_enabled"] = request_data["email_enabled"]
+
+        if "push_enabled" in request_data:
+            preferences_kwargs["push_enabled"] = request_data["push_enabled"]
+
+        if "sms_enabled" in request_data:
+            preferences_kwargs["sms_enabled"] = request_data["sms_enabled"]
+
+        if not preferences_kwargs:
+            raise AccountBadRequestError(
+                "At least one preference field (email_enabled, push_enabled, sms_enabled) must be provided"
+            )
+
+        result = CreateOrUpdateAccountNotificationPreferencesParams(**preferences_kwargs)
+        return result
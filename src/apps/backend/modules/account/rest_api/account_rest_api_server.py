@@ -1,6 +1,8 @@
+import quart
 from flask import Blueprint
 
 from modules.account.rest_api.account_router import AccountRouter
+from modules.account.rest_api.async_account_router import AsyncAccountRouter
 
 
 class AccountRestApiServer:
@@ -9,3 +11,9 @@ class AccountRestApiServer:
         account_api_blueprint = Blueprint("account", __name__)
         result = AccountRouter.create_route(blueprint=account_api_blueprint)
         return result
+
+    @staticmethod
+    def create_async() -> quart.Blueprint:
+        account_api_blueprint = quart.Blueprint("account", __name__)
+        result = AsyncAccountRouter.create_route(blueprint=account_api_blueprint)
+        return result
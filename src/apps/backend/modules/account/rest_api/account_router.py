@@ -4,11 +4,13 @@ from modules.account.rest_api.account_view import AccountView
 
 
 class AccountRouter:
+    ACCOUNTS_URL = "/accounts"
     ACCOUNT_BY_ID_URL = "/accounts/<id>"
+    NOTIFICATION_PREFERENCES_URL = "/accounts/<account_id>/notification-preferences"
 
     @staticmethod
     def create_route(*, blueprint: Blueprint) -> Blueprint:
-        blueprint.add_url_rule("/accounts", view_func=AccountView.as_view("account_view"))
+        blueprint.add_url_rule(AccountRouter.ACCOUNTS_URL, view_func=AccountView.as_view("account_view"))
         blueprint.add_url_rule(
             AccountRouter.ACCOUNT_BY_ID_URL, view_func=AccountView.as_view("account_view_by_id"), methods=["GET"]
         )
@@ -20,7 +22,7 @@ class AccountRouter:
         )
 
         blueprint.add_url_rule(
-            "/accounts/<account_id>/notification-preferences",
+            AccountRouter.NOTIFICATION_PREFERENCES_URL,
             view_func=AccountView.update_account_notification_preferences,
             methods=["PATCH"],
         )
@@ -0,0 +1,30 @@
+from quart import Blueprint
+
+from modules.account.rest_api.account_router import AccountRouter
+from modules.account.rest_api.async_account_view import AsyncAccountView
+
+
+class AsyncAccountRouter:
+    """Registers the async views under the URLs and endpoint names of AccountRouter"""
+
+    @staticmethod
+    def create_route(*, blueprint: Blueprint) -> Blueprint:
+        blueprint.add_url_rule(AccountRouter.ACCOUNTS_URL, view_func=AsyncAccountView.as_view("account_view"))
+        blueprint.add_url_rule(
+            AccountRouter.ACCOUNT_BY_ID_URL, view_func=AsyncAccountView.as_view("account_view_by_id"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            AccountRouter.ACCOUNT_BY_ID_URL, view_func=AsyncAccountView.as_view("account_update"), methods=["PATCH"]
+        )
+        blueprint.add_url_rule(
+            AccountRouter.ACCOUNT_BY_ID_URL, view_func=AsyncAccountView.as_view("account_delete"), methods=["DELETE"]
+        )
+
+        blueprint.add_url_rule(
+            AccountRouter.NOTIFICATION_PREFERENCES_URL,
+            view_func=AsyncAccountView.update_account_notification_preferences,
+            methods=["PATCH"],
+        )
+
+        result = blueprint
+        return result
@@ -0,0 +1,76 @@
+from dataclasses import asdict
+
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.account.async_account_service import AsyncAccountService
+from modules.account.rest_api.account_request_parser import AccountRequestParser
+from modules.account.types import AccountSearchByIdParams, CreateAccountByPhoneNumberParams, ResetPasswordParams
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+
+
+class AsyncAccountView(MethodView):
+    async def post(self) -> ResponseReturnValue:
+        account_params = AccountRequestParser.parse_create_account_params(request_data=await request.get_json())
+        if isinstance(account_params, CreateAccountByPhoneNumberParams):
+            account = await AsyncAccountService.get_or_create_account_by_phone_number(params=account_params)
+        else:
+            account = await AsyncAccountService.create_account_by_username_and_password(params=account_params)
+        account_dict = asdict(account)
+        result = jsonify(account_dict), 201
+        return result
+
+    @async_access_auth_middleware
+    async def get(self, id: str) -> ResponseReturnValue:
+        account_params = AccountSearchByIdParams(id=id)
+        account = await AsyncAccountService.get_account_by_id(params=account_params)
+        account_dict = asdict(account)
+
+        include_notification_preferences = request.args.get("include_notification_preferences", "").lower() == "true"
+
+        if include_notification_preferences:
+            try:
+                notification_preferences = await AsyncAccountService.get_account_notification_preferences_by_account_id(
+                    account_id=account.id
+                )
+                account_dict["notification_preferences"] = asdict(notification_preferences)
+            except AccountNotificationPreferencesNotFoundError:
+                pass
+
+        result = jsonify(account_dict), 200
+        return result
+
+    async def patch(self, id: str) -> ResponseReturnValue:
+        update_params = AccountRequestParser.parse_update_account_params(
+            account_id=id, request_data=await request.get_json()
+        )
+
+        if isinstance(update_params, ResetPasswordParams):
+            account = await AsyncAccountService.reset_account_password(params=update_params)
+        else:
+            account = await AsyncAccountService.update_account_profile(account_id=id, params=update_params)
+
+        account_dict = asdict(account)
+        result = jsonify(account_dict), 200
+        return result
+
+    @async_access_auth_middleware
+    async def delete(self, id: str) -> ResponseReturnValue:
+        await AsyncAccountService.delete_account(account_id=id)
+        result = "", 204
+        return result
+
+    @staticmethod
+    async def update_account_notification_preferences(account_id: str) -> ResponseReturnValue:
+        preferences_params = AccountRequestParser.parse_notification_preferences_params(
+            request_data=await request.get_json()
+        )
+
+        updated_preferences = await AsyncAccountService.create_or_update_account_notification_preferences(
+            account_id=account_id, preferences=preferences_params
+        )
+
+        result = jsonify(asdict(updated_preferences)), 200
+        return result
@@ -1,6 +1,10 @@
-from typing import Any, Tuple, Type
+from typing import Any, Optional, Tuple, Type
 
+from modules.application.common.blocking_call_executor import BlockingCallExecutor
+from modules.application.common.password_hasher import PasswordHasher
+from modules.application.common.types import ConnectionPoolStats
 from modules.application.internal.worker_manager import WorkerManager
+from modules.application.repository import ApplicationRepository, ApplicationRepositoryClient
 from modules.application.types import BaseWorker, Worker
 
 
@@ -34,3 +38,33 @@ class ApplicationService:
     def terminate_worker(*, worker_id: str) -> None:
         result = WorkerManager.terminate_worker(worker_id=worker_id)
         return result
+
+    @staticmethod
+    def reset_after_fork() -> None:
+        """
+        Drops the database and Temporal clients, the blocking call threads and the password hashing pool inherited from
+        the parent process, which are recreated on first use
+        """
+        ApplicationRepositoryClient.reset_after_fork()
+        ApplicationRepository.reset_collections()
+        WorkerManager.reset_after_fork()
+        BlockingCallExecutor.reset_after_fork()
+        PasswordHasher.reset_after_fork()
+
+    @staticmethod
+    def start_causal_session_scope(*, causal_token: Optional[str] = None) -> None:
+        ApplicationRepository.start_causal_session_scope(causal_token=causal_token)
+
+    @staticmethod
+    def get_causal_token() -> Optional[str]:
+        result = ApplicationRepository.get_causal_token()
+        return result
+
+    @staticmethod
+    def end_causal_session_scope() -> None:
+        ApplicationRepository.end_causal_session_scope()
+
+    @staticmethod
+    def get_database_connection_pool_stats() -> ConnectionPoolStats:
+        result = ApplicationRepositoryClient.get_connection_pool_stats()
+        return result
@@ -1,9 +1,14 @@
+import base64
+import binascii
 from dataclasses import asdict, dataclass
 from typing import Any, Optional, Tuple
 
+from bson import json_util
+from bson.errors import BSONError
+from bson.objectid import ObjectId
 from pymongo.cursor import Cursor
 
-from modules.application.common.types import PaginationParams, SortParams
+from modules.application.common.types import PaginationParams, SortDirection, SortParams
 
 
 @dataclass
@@ -29,8 +34,8 @@ class BaseModel:
 
     @staticmethod
     def calculate_pagination_values(
-        pagination_params: PaginationParams, total_count: int
-    ) -> Tuple[PaginationParams, int, int]:
+        pagination_params: PaginationParams, total_count: Optional[int]
+    ) -> Tuple[PaginationParams, int, Optional[int]]:
         page = pagination_params.page
         size = pagination_params.size
         offset = pagination_params.offset
@@ -39,10 +44,12 @@ class BaseModel:
         skip = 0
         skip = (page - 1) * size + offset
 
-        # Calculate total pages (avoid divide by zero)
-        total_pages = 0
-        if size > 0:
-            total_pages = (total_count + size - 1) // size
+        # Calculate total pages (avoid divide by zero), unknown when the count was skipped
+        total_pages: Optional[int] = None
+        if total_count is not None:
+            total_pages = 0
+            if size > 0:
+                total_pages = (total_count + size - 1) // size
 
         result = pagination_params, skip, total_pages
         return result
@@ -62,3 +69,40 @@ class BaseModel:
 
         result = cursor.sort(sort_list)
         return result
+
+    @staticmethod
+    def encode_pagination_cursor(document: dict[str, Any], sort_params: SortParams) -> str:
+        # The cursor is the (sort value, _id) pair of the last document on the page
+        cursor_data = {"value": document.get(sort_params.sort_by), "_id": document["_id"]}
+        encoded_cursor = base64.urlsafe_b64encode(json_util.dumps(cursor_data).encode("utf-8"))
+
+        result = encoded_cursor.decode("ascii")
+        return result
+
+    @staticmethod
+    def decode_pagination_cursor(cursor: str) -> Tuple[Any, ObjectId]:
+        try:
+            cursor_data = json_util.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        except (ValueError, UnicodeError, binascii.Error, BSONError) as e:
+            # e.g. bad base64, bad JSON, or an extended JSON value bson cannot build like {"$oid": "zzz"}
+            raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+        if not isinstance(cursor_data, dict) or not isinstance(cursor_data.get("_id"), ObjectId):
+            raise ValueError(f"Invalid pagination cursor: {cursor}")
+
+        result = cursor_data.get("value"), cursor_data["_id"]
+        return result
+
+    @staticmethod
+    def build_cursor_filter(cursor: str, sort_params: SortParams) -> dict[str, Any]:
+        sort_value, last_id = BaseModel.decode_pagination_cursor(cursor)
+        operator = "$gt" if sort_params.sort_direction == SortDirection.ASC else "$lt"
+
+        # Range predicate matching the (sort_by, _id) sort applied by apply_sort_params
+        result = {
+            "$or": [
+                {sort_params.sort_by: {operator: sort_value}},
+                {sort_params.sort_by: sort_value, "_id": {operator: last_id}},
+            ]
+        }
+        return result
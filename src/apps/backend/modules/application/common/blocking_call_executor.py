@@ -0,0 +1,47 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from modules.config.config_service import ConfigService
+
+T = TypeVar("T")
+
+
+class BlockingCallExecutor:
+    """
+    Runs blocking calls, i.e. PyMongo queries and provider requests, for the async (ASGI) app so they never block its
+    event loop. It has one thread per connection the MongoDB pool may open, so calls queue here rather than on a
+    connection checkout, and threads are only started as concurrent calls need them.
+    """
+
+    EXECUTOR: Optional[ThreadPoolExecutor] = None
+    EXECUTOR_LOCK = threading.Lock()
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        if cls.EXECUTOR is None:
+            with cls.EXECUTOR_LOCK:
+                if cls.EXECUTOR is None:
+                    max_workers = ConfigService[int].get_value(key="mongodb.max_pool_size", default=100)
+                    cls.EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="blocking-call")
+
+        result = cls.EXECUTOR
+        return result
+
+    @classmethod
+    async def run(cls, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        # Copy the context so the call sees the same context variables as the request awaiting it
+        context = contextvars.copy_context()
+
+        def call() -> T:
+            return context.run(func, *args, **kwargs)
+
+        result = await asyncio.get_running_loop().run_in_executor(cls.get_executor(), call)
+        return result
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # The parent's threads do not exist in the child
+        cls.EXECUTOR = None
@@ -0,0 +1,79 @@
+import threading
+from typing import Generic, Optional, TypeVar
+
+from modules.application.common.ttl_cache import TTLCache
+from modules.application.common.types import CacheStats
+from modules.config.config_service import ConfigService
+
+V = TypeVar("V")
+
+
+class ConfigTTLCache(Generic[V]):
+    """
+    Process-wide TTLCache configured by the section at config_key: enabled, max_entries and ttl_in_seconds.
+
+    The cache is built on first use and dropped when the section changes on a config reload, so that it is rebuilt with
+    the new size and TTL. While the section is disabled every lookup misses and nothing is stored.
+    """
+
+    def __init__(
+        self, *, config_key: str, enabled_by_default: bool, ttl_in_seconds: float, max_entries: int = 10000
+    ) -> None:
+        self.config_key = config_key
+        self.enabled_by_default = enabled_by_default
+        self.ttl_in_seconds = ttl_in_seconds
+        self.max_entries = max_entries
+        self._cache: Optional[TTLCache[V]] = None
+        self._lock = threading.Lock()
+
+        ConfigService.subscribe(config_key, self.reset)
+
+    def get(self, key: str) -> Optional[V]:
+        cache = self.get_cache()
+        result = cache.get(key) if cache is not None else None
+        return result
+
+    def set(self, key: str, value: V) -> None:
+        cache = self.get_cache()
+        if cache is not None:
+            cache.set(key, value)
+
+    def invalidate(self, key: str) -> None:
+        cache = self.get_cache()
+        if cache is not None:
+            cache.invalidate(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._cache is not None:
+                self._cache.clear()
+
+    def reset(self) -> None:
+        """
+        Drops the cache so it is rebuilt with the current size and TTL
+        """
+        with self._lock:
+            self._cache = None
+
+    def get_stats(self) -> CacheStats:
+        cache = self.get_cache()
+        result = cache.get_stats() if cache is not None else CacheStats(hits=0, misses=0, size=0)
+        return result
+
+    def get_cache(self) -> Optional[TTLCache[V]]:
+        if not ConfigService[bool].get_value(key=f"{self.config_key}.enabled", default=self.enabled_by_default):
+            return None
+
+        with self._lock:
+            if self._cache is None:
+                self._cache = TTLCache(
+                    max_entries=ConfigService[int].get_value(
+                        key=f"{self.config_key}.max_entries", default=self.max_entries
+                    ),
+                    ttl_in_seconds=ConfigService[float].get_value(
+                        key=f"{self.config_key}.ttl_in_seconds", default=self.ttl_in_seconds
+                    ),
+                )
+
+            result = self._cache
+            return result
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+)
+
+from modules.application.common.types import ConnectionPoolStats
+
+
+class ConnectionPoolMetrics(ConnectionPoolListener):
+    """
+    Connection pool listener counting the connections and checkouts of every MongoClient it is registered with.
+
+    The driver publishes no durations for checkouts, so the wait time is measured from the check out started event to
+    the checked out or failed event, which the driver publishes on the thread asking for the connection. Counters are
+    per process; call reset() in a forked child so it does not report the parent's numbers as its own.
+    """
+
+    def __init__(self, *, on_checked_in: Callable[[], None] = lambda: None) -> None:
+        self._on_checked_in = on_checked_in
+        self._lock = threading.Lock()
+        self._checkout_started_at = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._connections_open = 0
+            self._connections_in_use = 0
+            self._checkouts = 0
+            self._checkout_failures_by_reason: dict[str, int] = {}
+            self._total_checkout_wait_time_in_ms = 0.0
+            self._max_checkout_wait_time_in_ms = 0.0
+        self._checkout_started_at = threading.local()
+
+    def get_stats(self) -> ConnectionPoolStats:
+        with self._lock:
+            average_checkout_wait_time_in_ms = (
+                self._total_checkout_wait_time_in_ms / self._checkouts if self._checkouts else 0.0
+            )
+            result = ConnectionPoolStats(
+                pid=os.getpid(),
+                connections_open=self._connections_open,
+                connections_in_use=self._connections_in_use,
+                checkouts=self._checkouts,
+                checkout_failures=sum(self._checkout_failures_by_reason.values()),
+                checkout_failures_by_reason=dict(self._checkout_failures_by_reason),
+                average_checkout_wait_time_in_ms=average_checkout_wait_time_in_ms,
+                max_checkout_wait_time_in_ms=self._max_checkout_wait_time_in_ms,
+            )
+        return result
+
+    def _get_checkout_wait_time_in_ms(self) -> float:
+        started_at: Optional[float] = getattr(self._checkout_started_at, "value", None)
+        self._checkout_started_at.value = None
+        result = (time.monotonic() - started_at) * 1000 if started_at is not None else 0.0
+        return result
+
+    def connection_check_out_started(self, event: ConnectionCheckOutStartedEvent) -> None:
+        self._checkout_started_at.value = time.monotonic()
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        wait_time_in_ms = self._get_checkout_wait_time_in_ms()
+        with self._lock:
+            self._connections_in_use += 1
+            self._checkouts += 1
+            self._total_checkout_wait_time_in_ms += wait_time_in_ms
+            self._max_checkout_wait_time_in_ms = max(self._max_checkout_wait_time_in_ms, wait_time_in_ms)
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        self._get_checkout_wait_time_in_ms()
+        with self._lock:
+            self._checkout_failures_by_reason[event.reason] = self._checkout_failures_by_reason.get(event.reason, 0) + 1
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._connections_in_use = max(self._connections_in_use - 1, 0)
+        self._on_checked_in()
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._connections_open += 1
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._connections_open = max(self._connections_open - 1, 0)
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None:
+        pass
+
+    def pool_created(self, event: PoolCreatedEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: PoolClosedEvent) -> None:
+        pass
@@ -1,4 +1,13 @@
-from modules.application.common.types import PaginationParams
+from modules.application.common.types import PaginationParams, SortDirection, SortParams
 
 # Default pagination parameters
 DEFAULT_PAGINATION_PARAMS = PaginationParams(page=1, size=10, offset=0)
+
+# Default sort parameters, newest first
+DEFAULT_SORT_PARAMS = SortParams(sort_by="created_at", sort_direction=SortDirection.DESC)
+
+# Maximum number of items accepted by a single batch request
+MAX_BATCH_SIZE = 1000
+
+# Header carrying the causal token between a client's requests, see ApplicationService.get_causal_token
+CAUSAL_TOKEN_HEADER = "X-Causal-Token"
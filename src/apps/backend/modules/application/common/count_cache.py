@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from modules.application.common.types import CountMode
+
+
+class CountCache:
+    """
+    Small in-process cache of per-account document counts used by paginated listings.
+
+    Entries are grouped by account so that a write can drop every count of that account at once, and accounts are
+    evicted in least-recently-used order once max_accounts is reached.
+    """
+
+    def __init__(self, *, max_accounts: int = 10000, ttl_in_seconds: float = 30) -> None:
+        self.max_accounts = max_accounts
+        self.ttl_in_seconds = ttl_in_seconds
+        self._entries: OrderedDict[str, dict[str, Tuple[float, int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, *, account_id: str, key: str) -> Optional[int]:
+        with self._lock:
+            account_entries = self._entries.get(account_id)
+            if account_entries is None or key not in account_entries:
+                return None
+
+            expires_at, count = account_entries[key]
+            if expires_at < time.monotonic():
+                del account_entries[key]
+                return None
+
+            self._entries.move_to_end(account_id)
+            result = count
+            return result
+
+    def set(self, *, account_id: str, key: str, count: int) -> None:
+        with self._lock:
+            account_entries = self._entries.setdefault(account_id, {})
+            account_entries[key] = (time.monotonic() + self.ttl_in_seconds, count)
+            self._entries.move_to_end(account_id)
+
+            while len(self._entries) > self.max_accounts:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *, account_id: str) -> None:
+        with self._lock:
+            self._entries.pop(account_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def count(self, *, account_id: str, key: str, count_mode: CountMode, counter: Callable[[], int]) -> Optional[int]:
+        if count_mode == CountMode.NONE:
+            return None
+
+        if count_mode == CountMode.ESTIMATED:
+            cached_count = self.get(account_id=account_id, key=key)
+            if cached_count is not None:
+                result = cached_count
+                return result
+
+        total_count = counter()
+        self.set(account_id=account_id, key=key, count=total_count)
+
+        result = total_count
+        return result
@@ -0,0 +1,128 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+import bcrypt
+
+from modules.application.errors import PasswordHasherBusyError
+from modules.config.config_service import ConfigService
+
+T = TypeVar("T")
+
+
+def _hash(value: bytes, rounds: int) -> bytes:
+    result = bcrypt.hashpw(value, bcrypt.gensalt(rounds=rounds))
+    return result
+
+
+def _verify(value: bytes, hashed_value: bytes) -> bool:
+    result = bcrypt.checkpw(value, hashed_value)
+    return result
+
+
+class PasswordHasher:
+    """
+    bcrypt hashing and verification run on a small process pool instead of the request thread.
+
+    The pool is sized by password_hashing.pool_size (0 runs bcrypt inline). A call that finds every pool process busy,
+    and password_hashing.max_queued calls already waiting, raises PasswordHasherBusyError (429) rather than blocking its
+    request thread, so that a login burst is shed instead of tying up every gunicorn thread.
+    """
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _lock = threading.Lock()
+    _pending = 0
+
+    @staticmethod
+    def get_rounds() -> int:
+        result = ConfigService[int].get_value(key="password_hashing.rounds", default=10)
+        return result
+
+    @staticmethod
+    def get_pool_size() -> int:
+        result = ConfigService[int].get_value(key="password_hashing.pool_size", default=0)
+        return result
+
+    @staticmethod
+    def hash(*, value: str) -> str:
+        hashed_value = PasswordHasher._run(_hash, value.encode("utf-8"), PasswordHasher.get_rounds())
+        result = hashed_value.decode()
+        return result
+
+    @staticmethod
+    def verify(*, value: str, hashed_value: str) -> bool:
+        result = PasswordHasher._run(_verify, value.encode("utf-8"), hashed_value.encode("utf-8"))
+        return result
+
+    @staticmethod
+    def needs_rehash(*, hashed_value: str) -> bool:
+        # bcrypt hashes look like $2b$<cost>$<salt and digest>
+        hash_parts = hashed_value.split("$")
+        if len(hash_parts) < 4 or not hash_parts[2].isdigit():
+            result = True
+            return result
+
+        result = int(hash_parts[2]) != PasswordHasher.get_rounds()
+        return result
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # A forked child inherits the pool object but not its management thread, so submitting to it never returns.
+        # The pool is dropped without shutdown, whose processes and queues belong to the parent.
+        cls._executor = None
+        cls._lock = threading.Lock()
+        cls._pending = 0
+
+    @classmethod
+    def _run(cls, function: Callable[..., T], *args: Any) -> T:
+        executor = cls._get_executor()
+        if executor is None:
+            result = function(*args)
+            return result
+
+        # Pending calls each hold a request thread, so they are capped at what the pool can run plus a short queue,
+        # well below the worker's thread count
+        max_queued = ConfigService[int].get_value(key="password_hashing.max_queued", default=0)
+        with cls._lock:
+            if cls._pending >= PasswordHasher.get_pool_size() + max_queued:
+                raise PasswordHasherBusyError()
+            cls._pending += 1
+
+        try:
+            result = executor.submit(function, *args).result()
+            return result
+        except BrokenProcessPool:
+            # A pool process died; start a fresh pool on the next call and serve this one inline
+            with cls._lock:
+                if cls._executor is executor:
+                    cls._executor = None
+            result = function(*args)
+            return result
+        finally:
+            with cls._lock:
+                cls._pending -= 1
+
+    @classmethod
+    def _get_executor(cls) -> Optional[ProcessPoolExecutor]:
+        pool_size = PasswordHasher.get_pool_size()
+        if pool_size <= 0:
+            return None
+
+        with cls._lock:
+            if cls._executor is None:
+                # spawn rather than fork, since the calling process already runs request and client threads
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=pool_size, mp_context=multiprocessing.get_context("spawn")
+                )
+
+            result = cls._executor
+            return result
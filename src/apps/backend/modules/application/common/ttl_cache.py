@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, TypeVar
+
+from modules.application.common.types import CacheStats
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe in-process cache with a per-entry time to live and least-recently-used eviction.
+
+    Hits and misses are counted so that the size and TTL can be tuned from get_stats().
+    """
+
+    def __init__(self, *, max_entries: int = 10000, ttl_in_seconds: float = 30) -> None:
+        self.max_entries = max_entries
+        self.ttl_in_seconds = ttl_in_seconds
+        self._entries: OrderedDict[str, Tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            result = entry[1]
+            return result
+
+    def set(self, key: str, value: V, ttl_in_seconds: Optional[float] = None) -> None:
+        if ttl_in_seconds is None:
+            ttl_in_seconds = self.ttl_in_seconds
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_in_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            result = CacheStats(hits=self._hits, misses=self._misses, size=len(self._entries))
+            return result
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Generic, List, TypeVar
+from typing import Any, Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -35,12 +35,52 @@ class SortParams:
     sort_direction: SortDirection
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass(frozen=True)
+class BulkWriteItemOutcome:
+    # The document as stored after the write, None if the operation matched nothing
+    document: Optional[dict[str, Any]] = None
+    write_error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    pid: int
+    connections_open: int
+    connections_in_use: int
+    checkouts: int
+    checkout_failures: int
+    checkout_failures_by_reason: dict[str, int]
+    average_checkout_wait_time_in_ms: float
+    max_checkout_wait_time_in_ms: float
+
+
+class CountMode(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 @dataclass(frozen=True)
 class PaginationResult(Generic[T]):
     items: List[T]
     pagination_params: PaginationParams
-    total_count: int
-    total_pages: int
+    total_count: Optional[int]
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 UNSET = object()
+
+
+@dataclass(frozen=True)
+class CausalPosition:
+    # The latest cluster and operation times a request's causal session has seen
+    cluster_time: Optional[dict[str, Any]] = None
+    operation_time: Optional[Any] = None
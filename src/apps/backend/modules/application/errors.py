@@ -101,3 +101,17 @@ class WorkerAlreadyTerminatedError(AppError):
             http_status_code=400,
             message=f"Worker with id: {worker_id} has already been terminated. Verify the worker ID and try again.",
         )
+
+
+@dataclass(frozen=True)
+class PasswordHasherErrorCode:
+    BUSY: str = "PASSWORD_HASHER_ERR_01"
+
+
+class PasswordHasherBusyError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=PasswordHasherErrorCode.BUSY,
+            http_status_code=429,
+            message="Too many password operations are in progress. Please try again shortly.",
+        )
@@ -1,10 +1,14 @@
 import asyncio
+import threading
+import time
 import uuid
-from typing import Any, Optional, Tuple, Type, cast
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import timedelta
+from typing import Any, Coroutine, Optional, Tuple, Type, TypeVar, cast
 
 from temporalio.client import Client, WorkflowExecutionStatus, WorkflowHandle
 from temporalio.exceptions import WorkflowAlreadyStartedError
-from temporalio.service import RetryConfig, RPCError
+from temporalio.service import RetryConfig, RPCError, RPCStatusCode
 
 from modules.application.errors import (
     WorkerAlreadyCancelledError,
@@ -20,25 +24,108 @@ from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from temporal_config import TemporalConfig
 
+T = TypeVar("T")
+
+HEALTH_CHECK_TIMEOUT_IN_SECONDS = 5
+
 
 class WorkerManager:
+    # The client and every call made through it live on one event loop per process, run by a daemon thread, so sync
+    # callers such as Flask request threads pay for the RPC only and never for starting and closing a loop
     CLIENT: Optional[Client] = None
+    LOOP: Optional[asyncio.AbstractEventLoop] = None
+    CLIENT_VERIFIED_AT: float = 0.0
+    LOOP_LOCK = threading.Lock()
+    CLIENT_LOCK: Optional[asyncio.Lock] = None
+
+    RPC_TIMEOUT_IN_SECONDS = ConfigService[float].get_accessor("temporal.rpc_timeout_in_seconds", default=30)
+    HEALTH_CHECK_INTERVAL_IN_SECONDS = ConfigService[float].get_accessor(
+        "temporal.health_check_interval_in_seconds", default=30
+    )
+
+    @staticmethod
+    def _get_loop() -> asyncio.AbstractEventLoop:
+        with WorkerManager.LOOP_LOCK:
+            if WorkerManager.LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="worker-manager-loop", daemon=True).start()
+                WorkerManager.CLIENT_LOCK = asyncio.Lock()
+                WorkerManager.LOOP = loop
+            result = WorkerManager.LOOP
+        return result
+
+    @staticmethod
+    def reset_after_fork() -> None:
+        # A forked child inherits the loop object but not the thread running it, nor a usable client connection
+        WorkerManager.CLIENT = None
+        WorkerManager.LOOP = None
+        WorkerManager.CLIENT_VERIFIED_AT = 0.0
+        WorkerManager.CLIENT_LOCK = None
+        WorkerManager.LOOP_LOCK = threading.Lock()
+
+    @staticmethod
+    def _run(coroutine: Coroutine[Any, Any, T]) -> T:
+        future = asyncio.run_coroutine_threadsafe(coroutine, WorkerManager._get_loop())
+        timeout_in_seconds = WorkerManager.RPC_TIMEOUT_IN_SECONDS()
+        try:
+            res = future.result(timeout=timeout_in_seconds)
+
+        except FutureTimeoutError:
+            future.cancel()
+            WorkerManager.CLIENT_VERIFIED_AT = 0.0
+            raise RPCError(
+                f"Temporal call did not complete within {timeout_in_seconds} seconds",
+                RPCStatusCode.DEADLINE_EXCEEDED,
+                b"",
+            )
+
+        except RPCError as e:
+            if e.status == RPCStatusCode.UNAVAILABLE:
+                # Makes the next call check the connection and reconnect before using it
+                WorkerManager.CLIENT_VERIFIED_AT = 0.0
+            raise
+
+        WorkerManager.CLIENT_VERIFIED_AT = time.monotonic()
+        result = res
+        return result
 
     @staticmethod
     async def _connect_temporal_server() -> None:
         server_address = ConfigService[str].get_value(key="temporal.server_address")
         try:
             WorkerManager.CLIENT = await Client.connect(server_address, retry_config=RetryConfig(max_retries=3))
+            WorkerManager.CLIENT_VERIFIED_AT = time.monotonic()
 
             Logger.info(message=f"Connected to temporal server at {server_address}")
 
         except RuntimeError:
             raise WorkerClientConnectionError(server_address=server_address)
 
+    @staticmethod
+    async def _is_client_healthy(client: Client) -> bool:
+        try:
+            result = await client.service_client.check_health(
+                timeout=timedelta(seconds=HEALTH_CHECK_TIMEOUT_IN_SECONDS)
+            )
+        except RPCError:
+            result = False
+        return result
+
     @staticmethod
     async def _get_client() -> Client:
-        if WorkerManager.CLIENT is None:
-            await WorkerManager._connect_temporal_server()
+        async with cast(asyncio.Lock, WorkerManager.CLIENT_LOCK):
+            client = WorkerManager.CLIENT
+            idle_time_in_seconds = time.monotonic() - WorkerManager.CLIENT_VERIFIED_AT
+            if client is not None and idle_time_in_seconds >= WorkerManager.HEALTH_CHECK_INTERVAL_IN_SECONDS():
+                if await WorkerManager._is_client_healthy(client):
+                    WorkerManager.CLIENT_VERIFIED_AT = time.monotonic()
+                else:
+                    Logger.warn(message="Temporal server health check failed, reconnecting")
+                    WorkerManager.CLIENT = None
+
+            if WorkerManager.CLIENT is None:
+                await WorkerManager._connect_temporal_server()
+
         return cast(
             Client, WorkerManager.CLIENT
         )  # Safe to cast since _connect_temporal_server will throw if connection fails
@@ -133,12 +220,18 @@ class WorkerManager:
 
     @staticmethod
     def connect_temporal_server() -> None:
-        asyncio.run(WorkerManager._connect_temporal_server())
+        try:
+            WorkerManager._run(WorkerManager._connect_temporal_server())
+
+        except RPCError:
+            # Includes a connect that did not finish within the RPC timeout, which _run raises as DEADLINE_EXCEEDED
+            server_address = ConfigService[str].get_value(key="temporal.server_address")
+            raise WorkerClientConnectionError(server_address=server_address)
 
     @staticmethod
     def get_worker_by_id(*, worker_id: str) -> Worker:
         try:
-            res = asyncio.run(WorkerManager._get_worker_by_id(worker_id=worker_id))
+            res = WorkerManager._run(WorkerManager._get_worker_by_id(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -149,7 +242,7 @@ class WorkerManager:
     @staticmethod
     def run_worker_immediately(*, cls: Type[BaseWorker], arguments: Tuple[Any, ...]) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._run_worker_immediately(cls=cls, arguments=arguments))
+            worker_id = WorkerManager._run(WorkerManager._run_worker_immediately(cls=cls, arguments=arguments))
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
@@ -160,7 +253,7 @@ class WorkerManager:
     @staticmethod
     def schedule_worker_as_cron(*, cls: Type[BaseWorker], cron_schedule: str) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule))
+            worker_id = WorkerManager._run(WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule))
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
@@ -171,7 +264,7 @@ class WorkerManager:
     @staticmethod
     def cancel_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._cancel_worker(worker_id=worker_id))
+            WorkerManager._run(WorkerManager._cancel_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -179,7 +272,7 @@ class WorkerManager:
     @staticmethod
     def terminate_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._terminate_worker(worker_id=worker_id))
+            WorkerManager._run(WorkerManager._terminate_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
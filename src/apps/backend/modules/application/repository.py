@@ -1,20 +1,39 @@
+import contextvars
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Optional
 
-from pymongo import MongoClient
+import bson
+from bson.timestamp import Timestamp
+from pymongo import IndexModel, MongoClient
+from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
 from pymongo.server_api import ServerApi
 
+from modules.application.common.connection_pool_metrics import ConnectionPoolMetrics
+from modules.application.common.count_cache import CountCache
+from modules.application.common.types import BulkWriteItemOutcome, CausalPosition, ConnectionPoolStats, CountMode
+from modules.application.types import CollectionSchemaChanges
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
 
 class ApplicationRepositoryClient:
     _client: Optional[MongoClient] = None
+    IS_CONNECTION_CACHING_ENABLED = ConfigService[bool].get_accessor("mongodb.connection_caching")
+    POOL_STATS_LOG_INTERVAL_IN_SECONDS = ConfigService[float].get_accessor(
+        "mongodb.pool_stats_log_interval_in_seconds", default=0
+    )
+    _pool_stats_logged_at: float = 0.0
 
     @classmethod
     def get_client(cls) -> MongoClient:
-        connection_caching = ConfigService[bool].get_value(key="mongodb.connection_caching")
+        connection_caching = cls.IS_CONNECTION_CACHING_ENABLED()
 
         if connection_caching:
             if cls._client is None:
@@ -27,19 +46,121 @@ class ApplicationRepositoryClient:
             result = cls._create_client()
             return result
 
+    @staticmethod
+    def _get_client_options() -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "maxPoolSize": ConfigService[int].get_value(key="mongodb.max_pool_size", default=100),
+            "minPoolSize": ConfigService[int].get_value(key="mongodb.min_pool_size", default=0),
+            "serverSelectionTimeoutMS": ConfigService[int].get_value(
+                key="mongodb.server_selection_timeout_in_ms", default=30000
+            ),
+            "connectTimeoutMS": ConfigService[int].get_value(key="mongodb.connect_timeout_in_ms", default=20000),
+        }
+
+        # 0 keeps the driver default, which for these options is no limit
+        optional_timeouts = {
+            "maxIdleTimeMS": "mongodb.max_idle_time_in_ms",
+            "waitQueueTimeoutMS": "mongodb.wait_queue_timeout_in_ms",
+            "socketTimeoutMS": "mongodb.socket_timeout_in_ms",
+        }
+        for option, key in optional_timeouts.items():
+            timeout_in_ms = ConfigService[int].get_value(key=key, default=0)
+            if timeout_in_ms:
+                options[option] = timeout_in_ms
+
+        compressors = ConfigService[str].get_value(key="mongodb.compressors", default="")
+        if compressors:
+            options["compressors"] = compressors
+
+        result = options
+        return result
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # MongoClient is not fork-safe; the child drops the parent's client, without closing its sockets, and connects
+        # again on first use
+        cls._client = None
+        cls._pool_stats_logged_at = 0.0
+        POOL_METRICS.reset()
+
+    @classmethod
+    def get_connection_pool_stats(cls) -> ConnectionPoolStats:
+        result = POOL_METRICS.get_stats()
+        return result
+
+    @classmethod
+    def _log_connection_pool_stats_if_due(cls) -> None:
+        log_interval_in_seconds = cls.POOL_STATS_LOG_INTERVAL_IN_SECONDS()
+        now = time.monotonic()
+        if not log_interval_in_seconds or now - cls._pool_stats_logged_at < log_interval_in_seconds:
+            return
+
+        cls._pool_stats_logged_at = now
+        Logger.info(message="mongodb connection pool stats", **asdict(cls.get_connection_pool_stats()))
+
     @staticmethod
     def _create_client() -> MongoClient:
         connection_uri = ConfigService[str].get_value(key="mongodb.uri")
-        Logger.info(message=f"connecting to database - {connection_uri}")
-        client = MongoClient(connection_uri, server_api=ServerApi("1"))
-        Logger.info(message=f"connected to database - {connection_uri}")
+        Logger.info(message="connecting to database - {connection_uri}", connection_uri=connection_uri)
+        client = MongoClient(
+            connection_uri,
+            server_api=ServerApi("1"),
+            event_listeners=[POOL_METRICS],
+            **ApplicationRepositoryClient._get_client_options(),
+        )
+        Logger.info(message="connected to database - {connection_uri}", connection_uri=connection_uri)
 
         result = client
         return result
 
 
+# Shared by every client this process creates, so the stats cover the whole process even without connection caching
+POOL_METRICS = ConnectionPoolMetrics(on_checked_in=ApplicationRepositoryClient._log_connection_pool_stats_if_due)
+
+COLLECTION_INIT_LOCK = threading.Lock()
+
+# Options the server adds to or keeps on an index that do not come from its declaration
+SERVER_INDEX_OPTIONS = {"v", "ns", "background", "key", "name"}
+
+
+class CausalSessionScope:
+    """
+    Holds the causally consistent session of one request, started by the first operation that asks for it. The
+    session starts after operation_time, the latest operation the client has seen in its earlier requests.
+    """
+
+    def __init__(self, *, operation_time: Optional[Timestamp] = None) -> None:
+        self.operation_time = operation_time
+        self.session: Optional[ClientSession] = None
+
+
+# Set by the server for the duration of a request. Blocking calls of the async app run in copies of the request's
+# context, so the session is kept on the scope object, which every copy shares, rather than in the variable itself.
+CAUSAL_SESSION_SCOPE: contextvars.ContextVar[Optional[CausalSessionScope]] = contextvars.ContextVar(
+    "causal_session_scope", default=None
+)
+
+
 class ApplicationRepository(ABC):
+    """
+    Indexes and validator are declared on each repository and applied by sync_schema, which
+    scripts/sync_database_schema.py runs once per deploy. With mongodb.sync_schema_on_first_use set, as it is outside
+    production and preview, each process also applies them the first time it uses the collection.
+    """
+
     _collection: Optional[Collection] = None
+    indexes: list[IndexModel] = []
+    validator: Optional[dict[str, Any]] = None
+
+    COUNT_CACHE: CountCache
+
+    SYNC_SCHEMA_ON_FIRST_USE = ConfigService[bool].get_accessor("mongodb.sync_schema_on_first_use", default=True)
+    LIST_READ_PREFERENCE = ConfigService[str].get_accessor("mongodb.list_read_preference", default="secondaryPreferred")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each repository caches the counts of its own collection
+        cls.COUNT_CACHE = CountCache()
 
     @property
     @abstractmethod
@@ -48,21 +169,280 @@ class ApplicationRepository(ABC):
         pass
 
     @classmethod
-    def collection(cls) -> Collection:
+    def collection(cls, read: Optional[str] = None) -> Collection:
+        """
+        Returns the collection, reading with the read preference mode named by read (e.g. "secondaryPreferred") if
+        given. Pass get_causal_session() as the session of each operation for it to see the request's earlier writes
+        even when it reads from a secondary.
+        """
         if cls._collection is None:
-            client = ApplicationRepositoryClient.get_client()
-            database = client.get_database()
-            collection = database[cls.collection_name]
+            with COLLECTION_INIT_LOCK:
+                if cls._collection is None:
+                    client = ApplicationRepositoryClient.get_client()
+                    database = client.get_database()
+                    collection = database[cls.collection_name]
+
+                    if cls.SYNC_SCHEMA_ON_FIRST_USE():
+                        cls.sync_schema(collection)
 
-            # init hook
-            cls.on_init_collection(collection)
+                    cls._collection = collection
 
-            cls._collection = collection
+        if read is not None:
+            result = cls._collection.with_options(
+                read_preference=make_read_preference(read_pref_mode_from_name(read), None)
+            )
+            return result
 
         result = cls._collection
         return result
 
     @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        result = False
+    def count_account_documents(
+        cls, filter_query: dict[str, Any], *, account_id: str, key: str, count_mode: CountMode
+    ) -> Optional[int]:
+        """
+        Counts the documents of a listing on the list read preference, reusing the account's cached count in estimated
+        mode. key tells apart listings of the same account, e.g. the comments of each task.
+        """
+        result = cls.COUNT_CACHE.count(
+            account_id=account_id,
+            key=key,
+            count_mode=count_mode,
+            counter=lambda: cls.collection(read=cls.LIST_READ_PREFERENCE()).count_documents(
+                filter_query, session=cls.get_causal_session()
+            ),
+        )
+        return result
+
+    @classmethod
+    def invalidate_account_counts(cls, *, account_id: str) -> None:
+        cls.COUNT_CACHE.invalidate(account_id=account_id)
+
+    @staticmethod
+    def start_causal_session_scope(*, causal_token: Optional[str] = None) -> None:
+        """
+        Starts the scope of a request's causal session. causal_token is the value get_causal_token() returned to the
+        client in an earlier request; a malformed one is ignored, which only loses the guarantee for that request.
+        """
+        operation_time = None
+        if causal_token:
+            try:
+                time_in_seconds, increment = causal_token.split(".")
+                operation_time = Timestamp(int(time_in_seconds), int(increment))
+            except (TypeError, ValueError):
+                pass
+
+        CAUSAL_SESSION_SCOPE.set(CausalSessionScope(operation_time=operation_time))
+
+    @staticmethod
+    def get_causal_token() -> Optional[str]:
+        """
+        Returns the operation time of the request's session for the client to send with its next request, so that
+        request reads everything this one wrote or read, or None if the request did not use the session
+        """
+        scope = CAUSAL_SESSION_SCOPE.get()
+        if scope is None or scope.session is None or scope.session.operation_time is None:
+            return None
+
+        operation_time = scope.session.operation_time
+        result = f"{operation_time.time}.{operation_time.inc}"
+        return result
+
+    @staticmethod
+    def end_causal_session_scope() -> None:
+        scope = CAUSAL_SESSION_SCOPE.get()
+        CAUSAL_SESSION_SCOPE.set(None)
+        if scope is not None and scope.session is not None:
+            scope.session.end_session()
+
+    @staticmethod
+    def get_causal_session() -> Optional[ClientSession]:
+        """
+        Returns the causally consistent session of the current request, or None outside of a request. Without
+        connection caching every operation may use a different client, which cannot share a session, so there is none.
+        """
+        scope = CAUSAL_SESSION_SCOPE.get()
+        if scope is None or not ApplicationRepositoryClient.IS_CONNECTION_CACHING_ENABLED():
+            return None
+
+        if scope.session is None:
+            scope.session = ApplicationRepositoryClient.get_client().start_session(causal_consistency=True)
+            if scope.operation_time is not None:
+                scope.session.advance_operation_time(scope.operation_time)
+
+        result = scope.session
+        return result
+
+    @staticmethod
+    def get_causal_position() -> Optional[CausalPosition]:
+        """
+        Returns how far the request's causal session has got, or None without one. Unlike the session itself it can be
+        kept past the end of the request, to start a detached session from.
+        """
+        request_session = ApplicationRepository.get_causal_session()
+        if request_session is None:
+            return None
+
+        result = CausalPosition(
+            cluster_time=request_session.cluster_time, operation_time=request_session.operation_time
+        )
+        return result
+
+    @staticmethod
+    def start_detached_causal_session(*, causal_position: Optional[CausalPosition]) -> Optional[ClientSession]:
+        """
+        Starts a session that follows on from causal_position, taken from a request by get_causal_position(), for a
+        cursor that outlives the request, e.g. a streamed export. The caller ends it.
+        """
+        if causal_position is None:
+            return None
+
+        session = ApplicationRepositoryClient.get_client().start_session(causal_consistency=True)
+        if causal_position.cluster_time is not None:
+            session.advance_cluster_time(causal_position.cluster_time)
+        if causal_position.operation_time is not None:
+            session.advance_operation_time(causal_position.operation_time)
+
+        result = session
+        return result
+
+    @classmethod
+    def reset_collections(cls) -> None:
+        """
+        Drops the cached collection handles of every repository, which belong to the client they were taken from
+        """
+        for repository in cls.__subclasses__():
+            repository._collection = None
+            repository.reset_collections()
+
+    @staticmethod
+    def _is_index_changed(declared_index: dict[str, Any], existing_index: dict[str, Any]) -> bool:
+        declared_options = {key: value for key, value in declared_index.items() if key not in SERVER_INDEX_OPTIONS}
+        existing_options = {key: value for key, value in existing_index.items() if key not in SERVER_INDEX_OPTIONS}
+        result = (
+            list(declared_index["key"].items()) != list(existing_index["key"]) or declared_options != existing_options
+        )
+        return result
+
+    @classmethod
+    def get_schema_changes(cls, collection: Collection) -> CollectionSchemaChanges:
+        collection_infos = list(collection.database.list_collections(filter={"name": collection.name}))
+        is_collection_missing = not collection_infos
+
+        existing_indexes: dict[str, Any] = {} if is_collection_missing else collection.index_information()
+        existing_options = {} if is_collection_missing else collection_infos[0].get("options", {})
+        is_validator_changed = not is_collection_missing and (
+            existing_options.get("validator") != cls.validator
+            or (cls.validator is not None and existing_options.get("validationLevel", "strict") != "strict")
+        )
+
+        indexes_to_create: list[str] = []
+        indexes_to_recreate: list[str] = []
+        for index in cls.indexes:
+            declared_index = index.document
+            existing_index = existing_indexes.get(declared_index["name"])
+            if existing_index is None:
+                indexes_to_create.append(declared_index["name"])
+            elif cls._is_index_changed(declared_index, existing_index):
+                indexes_to_recreate.append(declared_index["name"])
+
+        declared_index_names = {index.document["name"] for index in cls.indexes}
+        undeclared_indexes = [name for name in existing_indexes if name != "_id_" and name not in declared_index_names]
+
+        result = CollectionSchemaChanges(
+            collection_name=collection.name,
+            is_collection_missing=is_collection_missing,
+            is_validator_changed=is_validator_changed,
+            indexes_to_create=indexes_to_create,
+            indexes_to_recreate=indexes_to_recreate,
+            undeclared_indexes=undeclared_indexes,
+        )
+        return result
+
+    @classmethod
+    def sync_schema(cls, collection: Collection, *, dry_run: bool = False) -> CollectionSchemaChanges:
+        """
+        Creates the collection, validator and indexes that are missing and recreates indexes whose declaration
+        changed. Indexes that are not declared are only reported, never dropped.
+        """
+        changes = cls.get_schema_changes(collection)
+        if dry_run or not changes.has_changes:
+            return changes
+
+        database = collection.database
+        if changes.is_collection_missing:
+            if cls.validator is not None:
+                database.create_collection(collection.name, validator=cls.validator, validationLevel="strict")
+            else:
+                database.create_collection(collection.name)
+
+        elif changes.is_validator_changed:
+            database.command(
+                {"collMod": collection.name, "validator": cls.validator or {}, "validationLevel": "strict"}
+            )
+
+        for index_name in changes.indexes_to_recreate:
+            collection.drop_index(index_name)
+
+        index_names_to_apply = set(changes.indexes_to_create + changes.indexes_to_recreate)
+        indexes_to_apply = [index for index in cls.indexes if index.document["name"] in index_names_to_apply]
+        if indexes_to_apply:
+            collection.create_indexes(indexes_to_apply)
+
+        Logger.info(message="synced schema of collection {collection_name}", **asdict(changes))
+
+        result = changes
+        return result
+
+    @classmethod
+    def insert_one_and_return(cls, document: dict[str, Any]) -> dict[str, Any]:
+        query = cls.collection().insert_one(document, session=cls.get_causal_session())
+
+        # Round-trip through BSON so the result matches what find_one would have returned (e.g. datetimes truncated
+        # to milliseconds) without a second query
+        inserted_document: dict[str, Any] = bson.decode(bson.encode({**document, "_id": query.inserted_id}))
+
+        result = inserted_document
+        return result
+
+    @classmethod
+    def bulk_write_items(
+        cls, items: list[tuple[dict[str, Any], Any]], *, written_at: datetime
+    ) -> list[BulkWriteItemOutcome]:
+        """
+        Runs the operations of a batch in a single unordered bulk_write and reads the written documents back in one
+        query. Each item is the key of the document it writes, i.e. its _id and owner fields, and the operation, which
+        must set updated_at to written_at: bulk_write only reports aggregate counts, so a document with the item's key
+        and this updated_at is how the item is known to be written.
+        """
+        if not items:
+            result: list[BulkWriteItemOutcome] = []
+            return result
+
+        write_errors: dict[int, str] = {}
+        try:
+            cls.collection().bulk_write(
+                [operation for _, operation in items], ordered=False, session=cls.get_causal_session()
+            )
+        except BulkWriteError as error:
+            write_errors = {write_error["index"]: write_error["errmsg"] for write_error in error.details["writeErrors"]}
+
+        document_ids = list({document_key["_id"] for document_key, _ in items})
+        written_documents = cls.collection().find(
+            {"_id": {"$in": document_ids}, "updated_at": written_at}, session=cls.get_causal_session()
+        )
+        written_documents_by_id = {document["_id"]: document for document in written_documents}
+
+        outcomes = []
+        for index, (document_key, _) in enumerate(items):
+            if index in write_errors:
+                outcomes.append(BulkWriteItemOutcome(write_error=write_errors[index]))
+                continue
+
+            document = written_documents_by_id.get(document_key["_id"])
+            if document is not None and any(document.get(key) != value for key, value in document_key.items()):
+                document = None
+            outcomes.append(BulkWriteItemOutcome(document=document))
+
+        result = outcomes
         return result
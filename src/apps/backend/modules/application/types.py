@@ -57,3 +57,23 @@ class Worker:
     close_time: Optional[datetime]
     task_queue: str
     worker_type: str
+
+
+@dataclass(frozen=True)
+class CollectionSchemaChanges:
+    collection_name: str
+    is_collection_missing: bool
+    is_validator_changed: bool
+    indexes_to_create: list[str]
+    indexes_to_recreate: list[str]
+    undeclared_indexes: list[str]
+
+    @property
+    def has_changes(self) -> bool:
+        result = (
+            self.is_collection_missing
+            or self.is_validator_changed
+            or bool(self.indexes_to_create)
+            or bool(self.indexes_to_recreate)
+        )
+        return result
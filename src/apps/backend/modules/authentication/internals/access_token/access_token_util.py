@@ -1,18 +1,30 @@
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
+from typing import Optional
 
 import jwt
 
 from modules.account.types import Account
+from modules.application.common.ttl_cache import TTLCache
 from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError, OTPIncorrectError
 from modules.authentication.types import AccessToken, AccessTokenPayload, OTP, OTPStatus
 from modules.config.config_service import ConfigService
 
 
 class AccessTokenUtil:
+    # Payloads of already verified tokens keyed by token digest, each kept no longer than the token's exp
+    VERIFIED_TOKEN_CACHE: TTLCache[AccessTokenPayload] = TTLCache(max_entries=10000, ttl_in_seconds=300)
+    _verified_token_signing_key: Optional[str] = None
+    _verified_token_lock = threading.Lock()
+    TOKEN_SIGNING_KEY = ConfigService[str].get_accessor("accounts.token_signing_key")
+    TOKEN_EXPIRY_DAYS = ConfigService[int].get_accessor("accounts.token_expiry_days")
+
     @staticmethod
     def generate_access_token(*, account: Account) -> AccessToken:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
-        jwt_expiry = timedelta(days=ConfigService[int].get_value(key="accounts.token_expiry_days"))
+        jwt_signing_key = AccessTokenUtil.TOKEN_SIGNING_KEY()
+        jwt_expiry = timedelta(days=AccessTokenUtil.TOKEN_EXPIRY_DAYS())
         expiry_time = datetime.now() + jwt_expiry
 
         payload = {"account_id": account.id, "exp": expiry_time.timestamp()}
@@ -23,7 +35,15 @@ class AccessTokenUtil:
 
     @staticmethod
     def verify_access_token(*, token: str) -> AccessTokenPayload:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+        jwt_signing_key = AccessTokenUtil.TOKEN_SIGNING_KEY()
+        AccessTokenUtil._evict_verified_tokens_on_key_rotation(jwt_signing_key=jwt_signing_key)
+
+        # The signing key is part of the digest so an entry verified with a rotated key can never be served
+        token_digest = hashlib.sha256(f"{jwt_signing_key}.{token}".encode()).hexdigest()
+        cached_payload = AccessTokenUtil.VERIFIED_TOKEN_CACHE.get(token_digest)
+        if cached_payload is not None:
+            result = cached_payload
+            return result
 
         try:
             verified_token = jwt.decode(token, jwt_signing_key, algorithms=["HS256"])
@@ -32,9 +52,27 @@ class AccessTokenUtil:
         except jwt.ExpiredSignatureError:
             raise AccessTokenExpiredError(message="Access token has expired. Please login again.")
 
-        result = AccessTokenPayload(account_id=verified_token.get("account_id"))
+        payload = AccessTokenPayload(account_id=verified_token.get("account_id"))
+
+        ttl_in_seconds = AccessTokenUtil.VERIFIED_TOKEN_CACHE.ttl_in_seconds
+        if "exp" in verified_token:
+            ttl_in_seconds = min(ttl_in_seconds, verified_token["exp"] - time.time())
+        AccessTokenUtil.VERIFIED_TOKEN_CACHE.set(token_digest, payload, ttl_in_seconds=ttl_in_seconds)
+
+        result = payload
         return result
 
+    @staticmethod
+    def _evict_verified_tokens_on_key_rotation(*, jwt_signing_key: str) -> None:
+        # Entries of the previous key can no longer match, so drop them instead of waiting for LRU eviction
+        if AccessTokenUtil._verified_token_signing_key == jwt_signing_key:
+            return
+
+        with AccessTokenUtil._verified_token_lock:
+            if AccessTokenUtil._verified_token_signing_key != jwt_signing_key:
+                AccessTokenUtil.VERIFIED_TOKEN_CACHE.clear()
+                AccessTokenUtil._verified_token_signing_key = jwt_signing_key
+
     @staticmethod
     def validate_otp_for_access_token(*, otp: OTP) -> None:
         if otp.status != OTPStatus.SUCCESS:
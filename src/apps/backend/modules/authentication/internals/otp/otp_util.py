@@ -8,11 +8,16 @@ from modules.config.config_service import ConfigService
 
 
 class OTPUtil:
+    DEFAULT_OTP_CODE = ConfigService[str].get_accessor("public.default_otp.code")
+    IS_DEFAULT_OTP_ENABLED = ConfigService[bool].get_accessor("public.default_otp.enabled", default=False)
+    DEFAULT_OTP_WHITELISTED_PHONE_NUMBER = ConfigService[str].get_accessor(
+        "public.default_otp.whitelisted_phone_number", default=""
+    )
 
     @staticmethod
     def generate_otp(length: int, phone_number: str) -> str:
         if OTPUtil.should_use_default_otp_for_phone_number(phone_number):
-            default_otp = ConfigService[str].get_value(key="public.default_otp.code")
+            default_otp = OTPUtil.DEFAULT_OTP_CODE()
             result = default_otp
             return result
         result = "".join(secrets.choice(string.digits) for _ in range(length))
@@ -30,7 +35,7 @@ class OTPUtil:
 
     @staticmethod
     def should_use_default_otp_for_phone_number(phone_number: str) -> bool:
-        default_otp_enabled = ConfigService[bool].get_value(key="public.default_otp.enabled", default=False)
+        default_otp_enabled = OTPUtil.IS_DEFAULT_OTP_ENABLED()
 
         if not default_otp_enabled:
             result = False
@@ -42,9 +47,7 @@ class OTPUtil:
             result = True
             return result
 
-        whitelisted_phone_number = ConfigService[str].get_value(
-            key="public.default_otp.whitelisted_phone_number", default=""
-        )
+        whitelisted_phone_number = OTPUtil.DEFAULT_OTP_WHITELISTED_PHONE_NUMBER()
 
         if not whitelisted_phone_number:
             result = True
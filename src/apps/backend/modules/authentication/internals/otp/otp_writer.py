@@ -1,4 +1,5 @@
 from dataclasses import asdict
+from datetime import datetime
 
 from pymongo import ReturnDocument
 
@@ -14,30 +15,37 @@ class OTPWriter:
     @staticmethod
     def expire_previous_otps(phone_number: PhoneNumber) -> None:
         phone_number_dict = asdict(phone_number)
-        previous_otps = OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict})
-        for otp in previous_otps:
-            OTPRepository.collection().update_one(
-                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
-            )
+        OTPRepository.collection().update_many(
+            {"phone_number": phone_number_dict, "active": True},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED, "updated_at": datetime.now()}},
+        )
 
     @staticmethod
     def create_new_otp(*, params: CreateOTPParams) -> OTP:
         OTPWriter.expire_previous_otps(phone_number=params.phone_number)
         phone_number = PhoneNumber(**asdict(params)["phone_number"])
         otp_code = OTPUtil.generate_otp(length=4, phone_number=phone_number.phone_number)
+        created_at = datetime.now()
         otp_bson = OTPModel(
-            active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING)
+            active=True,
+            id=None,
+            phone_number=phone_number,
+            otp_code=otp_code,
+            status=str(OTPStatus.PENDING),
+            created_at=created_at,
+            updated_at=created_at,
         ).to_bson()
-        query = OTPRepository.collection().insert_one(otp_bson)
-        otp_bson = OTPRepository.collection().find_one({"_id": query.inserted_id})
+        otp_bson = OTPRepository.insert_one_and_return(otp_bson)
         result = OTPUtil.convert_otp_bson_to_otp(otp_bson)
         return result
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
         phone_number_dict = asdict(params.phone_number)
+        # Matching both values of active lets the (phone_number, active, _id) index serve the sort by merging two scans
         otp_bson = OTPRepository.collection().find_one(
-            {"otp_code": params.otp_code, "phone_number": phone_number_dict}, sort=[("_id", -1)]
+            {"phone_number": phone_number_dict, "active": {"$in": [True, False]}, "otp_code": params.otp_code},
+            sort=[("_id", -1)],
         )
         if otp_bson is None:
             raise OTPIncorrectError()
@@ -46,9 +54,13 @@ class OTPWriter:
             raise OTPExpiredError()
 
         updated_otp_bson = OTPRepository.collection().find_one_and_update(
-            {"_id": otp_bson["_id"]},
-            {"$set": {"active": False, "status": OTPStatus.SUCCESS}},
+            {"_id": otp_bson["_id"], "active": True},
+            {"$set": {"active": False, "status": OTPStatus.SUCCESS, "updated_at": datetime.now()}},
             return_document=ReturnDocument.AFTER,
         )
+        if updated_otp_bson is None:
+            # Used or expired by a concurrent request since it was read
+            raise OTPExpiredError()
+
         result = OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
         return result
@@ -1,9 +1,7 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.otp.store.otp_model import OTPModel
-from modules.logger.logger import Logger
 
 OTP_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -30,24 +28,17 @@ OTP_VALIDATION_SCHEMA = {
 }
 
 
+# OTPs are purged a day after creation, well past their useful life, which also absorbs the offset of created_at
+# being stored as naive local time
+OTP_RETENTION_IN_SECONDS = 24 * 60 * 60
+
+
 class OTPRepository(ApplicationRepository):
     collection_name = OTPModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-
-        collection.create_index("phone_number")
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": OTP_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:  # NamespaceNotFound MongoDB error code
-                collection.database.create_collection(cls.collection_name, validator=OTP_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection otp: {e.details}")
-        result = True
-        return result
+    indexes = [
+        IndexModel("phone_number"),
+        IndexModel([("phone_number", 1), ("active", 1), ("_id", -1)], name="phone_number_active_id_index"),
+        IndexModel("created_at", name="created_at_ttl_index", expireAfterSeconds=OTP_RETENTION_IN_SECONDS),
+    ]
+    validator = OTP_VALIDATION_SCHEMA
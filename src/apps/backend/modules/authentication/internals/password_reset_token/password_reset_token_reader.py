@@ -13,7 +13,10 @@ class PasswordResetTokenReader:
     @staticmethod
     def get_password_reset_token_by_account_id(account_id: str) -> PasswordResetToken:
         cursor = (
-            PasswordResetTokenRepository.collection().find({"account": ObjectId(account_id)}).sort("expires_at", -1)
+            PasswordResetTokenRepository.collection()
+            .find({"account": ObjectId(account_id)})
+            .sort("expires_at", -1)
+            .limit(1)
         )
 
         try:
@@ -43,8 +46,8 @@ class PasswordResetTokenReader:
                 f"Password reset is already used for accountId {account_id}. Please retry with new link"
             )
 
-        is_token_valid = PasswordResetTokenUtil.compare_password(
-            password=token, hashed_password=password_reset_token.token
+        is_token_valid = PasswordResetTokenUtil.compare_password_reset_token(
+            reset_token=token, hashed_reset_token=password_reset_token.token
         )
         if not is_token_valid:
             raise AccountBadRequestError(
@@ -1,27 +1,31 @@
 import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
-
+from modules.application.common.password_hasher import PasswordHasher
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
 from modules.authentication.types import PasswordResetToken
 from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+
+# Marks tokens stored as a keyed hash, anything else is a bcrypt hash
+HMAC_TOKEN_PREFIX = "hmac-sha256$"
 
 
 class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password(password: str) -> str:
-        result = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        result = PasswordHasher.hash(value=password)
         return result
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        result = bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        result = PasswordHasher.verify(value=password, hashed_value=hashed_password)
         return result
 
     @staticmethod
@@ -31,7 +35,53 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password_reset_token(reset_token: str) -> str:
-        result = bcrypt.hashpw(reset_token.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        hash_mode = ConfigService[str].get_value(key="accounts.password_reset_token_hash_mode", default="bcrypt")
+
+        if hash_mode == "hmac":
+            hmac_keys = PasswordResetTokenUtil._get_hmac_keys()
+            if hmac_keys:
+                result = HMAC_TOKEN_PREFIX + PasswordResetTokenUtil._get_hmac_digest(
+                    reset_token=reset_token, hmac_key=hmac_keys[0]
+                )
+                return result
+
+            Logger.warn(message="accounts.password_reset_token_hmac_key is not set, hashing reset token with bcrypt")
+
+        result = PasswordHasher.hash(value=reset_token)
+        return result
+
+    @staticmethod
+    def compare_password_reset_token(*, reset_token: str, hashed_reset_token: str) -> bool:
+        # Decided by the stored format, so tokens issued before a hash mode change keep working
+        if hashed_reset_token.startswith(HMAC_TOKEN_PREFIX):
+            result = any(
+                hmac.compare_digest(
+                    hashed_reset_token,
+                    HMAC_TOKEN_PREFIX
+                    + PasswordResetTokenUtil._get_hmac_digest(reset_token=reset_token, hmac_key=hmac_key),
+                )
+                for hmac_key in PasswordResetTokenUtil._get_hmac_keys()
+            )
+            return result
+
+        result = PasswordHasher.verify(value=reset_token, hashed_value=hashed_reset_token)
+        return result
+
+    @staticmethod
+    def _get_hmac_keys() -> list[str]:
+        # A dedicated key, so rotating the JWT signing key does not invalidate outstanding reset links. The previous key
+        # keeps links issued before a rotation of this key working until they expire.
+        hmac_keys = [
+            ConfigService[str].get_value(key="accounts.password_reset_token_hmac_key", default=""),
+            ConfigService[str].get_value(key="accounts.password_reset_token_previous_hmac_key", default=""),
+        ]
+
+        result = [hmac_key for hmac_key in hmac_keys if hmac_key]
+        return result
+
+    @staticmethod
+    def _get_hmac_digest(*, reset_token: str, hmac_key: str) -> str:
+        result = hmac.new(hmac_key.encode("utf-8"), reset_token.encode("utf-8"), hashlib.sha256).hexdigest()
         return result
 
     @staticmethod
@@ -1,11 +1,9 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
-from modules.logger.logger import Logger
 
 PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -22,25 +20,17 @@ PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
 }
 
 
+# Expired tokens are kept for a day before MongoDB purges them, which absorbs the offset of expires_at being stored
+# as naive local time
+EXPIRED_TOKEN_RETENTION_IN_SECONDS = 24 * 60 * 60
+
+
 class PasswordResetTokenRepository(ApplicationRepository):
     collection_name = PasswordResetTokenModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index("token")
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:  # NamespaceNotFound MongoDB error code
-                collection.database.create_collection(
-                    cls.collection_name, validator=PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA
-                )
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection PasswordResetToken: {e.details}")
-        result = True
-        return result
+    indexes = [
+        IndexModel("token"),
+        IndexModel([("account", 1), ("expires_at", -1)], name="account_expires_at_index"),
+        IndexModel("expires_at", name="expires_at_ttl_index", expireAfterSeconds=EXPIRED_TOKEN_RETENTION_IN_SECONDS),
+    ]
+    validator = PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA
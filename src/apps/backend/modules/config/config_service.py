@@ -1,13 +1,24 @@
-from typing import Generic, Optional, cast
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Generic, List, Optional, cast
+
+from dotenv import find_dotenv, load_dotenv
 
 from modules.config.errors import MissingKeyError
 from modules.config.internals.config_manager import ConfigManager
+from modules.config.internals.config_utils import ConfigUtil
+from modules.config.internals.config_watcher import ConfigWatcher
 from modules.config.types import ConfigType, ErrorCode
 
 
 class ConfigService(Generic[ConfigType]):
     config_manager: ConfigManager = ConfigManager()
 
+    _subscribers: Dict[str, List[Callable[[], None]]] = {}
+    _subscribers_lock = threading.Lock()
+    _watcher: Optional[ConfigWatcher] = None
+
     @classmethod
     def get_value(cls, key: str, default: Optional[ConfigType] = None) -> ConfigType:
         value: Optional[ConfigType] = cls.config_manager.get(key, default=default)
@@ -20,3 +31,120 @@ class ConfigService(Generic[ConfigType]):
     def has_value(cls, key: str) -> bool:
         result = cls.config_manager.has(key)
         return result
+
+    @classmethod
+    def get_accessor(cls, key: str, default: Optional[ConfigType] = None) -> "ConfigAccessor[ConfigType]":
+        """
+        Binds a key once, typically at import time, e.g. IS_SMS_ENABLED = ConfigService[bool].get_accessor("sms.enabled")
+        """
+        result: ConfigAccessor[ConfigType] = ConfigAccessor(key=key, default=default)
+        return result
+
+    @classmethod
+    def subscribe(cls, key: str, callback: Callable[[], None]) -> None:
+        """
+        Calls callback after a reload that changed the value of key; a section key such as "sendgrid" is notified
+        when any key below it changes
+        """
+        with cls._subscribers_lock:
+            cls._subscribers.setdefault(key, []).append(callback)
+
+    @classmethod
+    def reload(cls) -> List[str]:
+        """
+        Rebuilds the merged config from the config files and environment, swaps it in with a single assignment and
+        notifies the subscribers of the keys that changed
+        """
+        previous_config_manager = cls.config_manager
+        cls.config_manager = ConfigManager()
+
+        changed_keys = ConfigUtil.get_changed_keys(
+            previous_config_manager.config_index, cls.config_manager.config_index
+        )
+        with cls._subscribers_lock:
+            callbacks = [
+                callback
+                for key, key_callbacks in cls._subscribers.items()
+                if key in changed_keys
+                for callback in key_callbacks
+            ]
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                # Logger depends on the config module, so report through the standard logging module
+                logging.getLogger(__name__).exception("Config change subscriber failed")
+
+        result = sorted(changed_keys)
+        return result
+
+    @classmethod
+    def start_watching(cls, interval_in_seconds: Optional[float] = None) -> None:
+        """
+        Reloads the config whenever a file in the config directory or the .env file changes
+        """
+        if cls._watcher is not None:
+            return
+
+        if interval_in_seconds is None:
+            interval_in_seconds = ConfigService[float].get_value(key="config_reload.interval_in_seconds", default=5.0)
+
+        cls._watcher = ConfigWatcher(
+            get_paths=cls._get_watched_paths,
+            on_change=cls._reload_with_env_file,
+            interval_in_seconds=interval_in_seconds,
+        )
+        cls._watcher.start()
+
+    @classmethod
+    def stop_watching(cls) -> None:
+        if cls._watcher is not None:
+            cls._watcher.stop()
+            cls._watcher = None
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        """
+        The watcher thread does not survive fork, so a forked child of a watching process starts its own watcher
+        """
+        if cls._watcher is not None:
+            interval_in_seconds = cls._watcher.interval_in_seconds
+            cls._watcher = None
+            cls.start_watching(interval_in_seconds)
+
+    @staticmethod
+    def _get_watched_paths() -> List[Path]:
+        paths = ConfigUtil.get_config_file_paths()
+        env_file_path = find_dotenv(usecwd=True)
+        if env_file_path:
+            paths.append(Path(env_file_path))
+
+        result = paths
+        return result
+
+    @classmethod
+    def _reload_with_env_file(cls) -> None:
+        env_file_path = find_dotenv(usecwd=True)
+        if env_file_path:
+            load_dotenv(env_file_path, override=True)
+
+        changed_keys = cls.reload()
+        logging.getLogger(__name__).info("Config reloaded, %d keys changed", len(changed_keys))
+
+
+class ConfigAccessor(Generic[ConfigType]):
+    """
+    Callable returning the current value of a bound key. It skips building ConfigService[T] on every lookup and
+    still goes through ConfigService.get_value, so the value follows the loaded config.
+    """
+
+    __slots__ = ("key", "default")
+
+    def __init__(self, *, key: str, default: Optional[ConfigType] = None) -> None:
+        self.key = key
+        self.default = default
+
+    def __call__(self) -> ConfigType:
+        result: ConfigType = ConfigService.get_value(self.key, default=self.default)
+        return result
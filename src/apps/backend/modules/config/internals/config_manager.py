@@ -1,10 +1,11 @@
-from typing import Optional, cast
+from types import MappingProxyType
+from typing import Mapping, Optional, cast
 
 from modules.config.internals.config_files.app_env_config_file import AppEnvConfig
 from modules.config.internals.config_files.custom_env_config_file import CustomEnvConfig
 from modules.config.internals.config_files.default_config_file import DefaultConfig
 from modules.config.internals.config_utils import ConfigUtil
-from modules.config.internals.types import Config
+from modules.config.internals.types import AllowedConfigValueTypes, Config
 from modules.config.types import ConfigType
 
 
@@ -20,29 +21,16 @@ class ConfigManager:
         merged_content = ConfigUtil.deep_merge(default_content, app_env_content, os_env_content)
 
         self.config_store: Config = merged_content
+        # Built once so a lookup is a single dict access instead of splitting the key and walking nested sections
+        self.config_index: Mapping[str, AllowedConfigValueTypes] = MappingProxyType(
+            ConfigUtil.flatten_config(merged_content, self.CONFIG_KEY_SEPARATOR)
+        )
 
     def get(self, key: str, default: Optional[ConfigType] = None) -> Optional[ConfigType]:
-        value = self._traverse_config(key)
-        result = value if value is not None else default
+        value = self.config_index.get(key)
+        result = cast(ConfigType, value) if value is not None else default
         return result
 
     def has(self, key: str) -> bool:
-        result = self._traverse_config(key) is not None
-        return result
-
-    def _traverse_config(self, key: str) -> Optional[ConfigType]:
-        values = self.config_store
-        for k in key.split(self.CONFIG_KEY_SEPARATOR):
-            if not isinstance(values, dict) or k not in values:
-                return None
-
-            next_values = values[k]
-
-            if not isinstance(next_values, dict):
-                result = cast(ConfigType, next_values)
-                return result
-
-            values = next_values
-
-        result = cast(ConfigType, values)
+        result = self.config_index.get(key) is not None
         return result
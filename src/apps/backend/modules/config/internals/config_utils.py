@@ -1,10 +1,10 @@
 import os
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Mapping, cast
 
 import yaml
 
-from modules.config.internals.types import Config
+from modules.config.internals.types import AllowedConfigValueTypes, Config
 
 
 class ConfigUtil:
@@ -25,6 +25,41 @@ class ConfigUtil:
         result = merged_config
         return result
 
+    @staticmethod
+    def flatten_config(config: Config, separator: str = ".", prefix: str = "") -> dict[str, AllowedConfigValueTypes]:
+        """
+        Indexes every value, nested sections included, by its full dotted key
+        """
+        flattened_config: dict[str, AllowedConfigValueTypes] = {}
+
+        for key, value in config.items():
+            dotted_key = f"{prefix}{key}"
+            flattened_config[dotted_key] = value
+            if isinstance(value, dict):
+                flattened_config.update(
+                    ConfigUtil.flatten_config(cast(Config, value), separator, f"{dotted_key}{separator}")
+                )
+
+        result = flattened_config
+        return result
+
+    @staticmethod
+    def get_changed_keys(
+        previous_index: Mapping[str, AllowedConfigValueTypes], current_index: Mapping[str, AllowedConfigValueTypes]
+    ) -> set[str]:
+        result = {
+            key
+            for key in previous_index.keys() | current_index.keys()
+            if previous_index.get(key) != current_index.get(key)
+        }
+        return result
+
+    @staticmethod
+    def get_config_file_paths() -> list[Path]:
+        config_path = ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
+        result = sorted(config_path.glob("*.yml"))
+        return result
+
     @staticmethod
     def read_yml_from_config_dir(filename: str) -> dict[str, Any]:
         config_path = ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
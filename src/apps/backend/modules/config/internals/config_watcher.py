@@ -0,0 +1,55 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+class ConfigWatcher:
+    """
+    Polls the modification times of the config files from a daemon thread and calls on_change when any file is
+    modified, added or removed.
+    """
+
+    def __init__(
+        self, *, get_paths: Callable[[], List[Path]], on_change: Callable[[], None], interval_in_seconds: float
+    ) -> None:
+        self.get_paths = get_paths
+        self.on_change = on_change
+        self.interval_in_seconds = interval_in_seconds
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot: Dict[Path, int] = {}
+
+    def start(self) -> None:
+        self._snapshot = self._take_snapshot()
+        self._thread = threading.Thread(target=self._watch, name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_in_seconds + 1)
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self.interval_in_seconds):
+            snapshot = self._take_snapshot()
+            if snapshot == self._snapshot:
+                continue
+
+            self._snapshot = snapshot
+            try:
+                self.on_change()
+            except Exception:
+                # Logger depends on the config module, so report through the standard logging module
+                logging.getLogger(__name__).exception("Config reload failed, keeping the current config")
+
+    def _take_snapshot(self) -> Dict[Path, int]:
+        snapshot: Dict[Path, int] = {}
+        for path in self.get_paths():
+            try:
+                snapshot[path] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+
+        result = snapshot
+        return result
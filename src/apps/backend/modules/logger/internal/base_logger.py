@@ -1,18 +1,41 @@
+import logging
 from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.log_formatters import TEXT_LOG_FORMAT, JsonFormatter, StructuredTextFormatter
 
 
 class BaseLogger(ABC):
     @abstractmethod
-    def critical(self, *, message: str) -> None: ...
+    def critical(self, *, message: str, fields: Dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    def debug(self, *, message: str, fields: Dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    def error(self, *, message: str, fields: Dict[str, Any]) -> None: ...
 
     @abstractmethod
-    def debug(self, *, message: str) -> None: ...
+    def info(self, *, message: str, fields: Dict[str, Any]) -> None: ...
 
     @abstractmethod
-    def error(self, *, message: str) -> None: ...
+    def warn(self, *, message: str, fields: Dict[str, Any]) -> None: ...
 
     @abstractmethod
-    def info(self, *, message: str) -> None: ...
+    def is_enabled_for(self, level: int) -> bool: ...
 
     @abstractmethod
-    def warn(self, *, message: str) -> None: ...
+    def close(self) -> None: ...
+
+    def reset_after_fork(self) -> None:
+        pass
+
+    @staticmethod
+    def get_formatter(text_format: str = TEXT_LOG_FORMAT) -> logging.Formatter:
+        if ConfigService[str].get_value(key="logger.format", default="text") == "json":
+            result: logging.Formatter = JsonFormatter()
+            return result
+
+        result = StructuredTextFormatter(text_format)
+        return result
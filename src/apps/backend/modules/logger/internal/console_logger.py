@@ -1,31 +1,42 @@
 import logging
+from typing import Any, Dict
 
+from modules.config.config_service import ConfigService
 from modules.logger.internal.base_logger import BaseLogger
+from modules.logger.internal.log_message import LogMessage
+from modules.logger.internal.logger_enum import Levels
 
 
 class ConsoleLogger(BaseLogger):
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(Levels[ConfigService[str].get_value(key="logger.level", default="debug").lower()].value)
 
-        # Create a console handler and set the level to INFO
-        console_handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        console_handler.setFormatter(formatter)
+        # Create a console handler using the configured text or JSON format
+        self.handler = logging.StreamHandler()
+        self.handler.setFormatter(self.get_formatter())
 
-        self.logger.addHandler(console_handler)
+        self.logger.addHandler(self.handler)
 
-    def critical(self, *, message: str) -> None:
-        self.logger.critical(msg=message)
+    def critical(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.critical(msg=LogMessage(message, fields), extra={"fields": fields})
 
-    def debug(self, *, message: str) -> None:
-        self.logger.debug(msg=message)
+    def debug(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.debug(msg=LogMessage(message, fields), extra={"fields": fields})
 
-    def error(self, *, message: str) -> None:
-        self.logger.error(msg=message)
+    def error(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.error(msg=LogMessage(message, fields), extra={"fields": fields})
 
-    def info(self, *, message: str) -> None:
-        self.logger.info(msg=message)
+    def info(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.info(msg=LogMessage(message, fields), extra={"fields": fields})
 
-    def warn(self, *, message: str) -> None:
-        self.logger.warning(msg=message)
+    def warn(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.warning(msg=LogMessage(message, fields), extra={"fields": fields})
+
+    def is_enabled_for(self, level: int) -> bool:
+        result = self.logger.isEnabledFor(level)
+        return result
+
+    def close(self) -> None:
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
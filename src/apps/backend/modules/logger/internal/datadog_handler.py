@@ -1,18 +1,54 @@
+import atexit
 import logging
 import os
-from logging import LogRecord, StreamHandler
+import queue
+import sys
+import threading
+import time
+from logging import LogRecord
+from typing import List, Optional, Tuple
 
 from datadog_api_client import ApiClient, Configuration
 from datadog_api_client.v2.api.logs_api import LogsApi
 from datadog_api_client.v2.models import HTTPLog, HTTPLogItem
 
 from modules.config.config_service import ConfigService
+from modules.logger.internal.types import LogShippingStats
 
 
-class DatadogHandler(StreamHandler):
-    def __init__(self, ddsource: str) -> None:
-        StreamHandler.__init__(self)
+class DatadogHandler(logging.Handler):
+    """
+    Ships log records to Datadog without blocking the logging thread.
+
+    emit() only formats the record and puts it on a bounded queue; when the queue is full the record is dropped and
+    counted. A background thread drains the queue into HTTPLog batches of up to datadog.log_batch_size records, or
+    whatever arrived within datadog.log_flush_interval_in_seconds, and submits them with one reused client.
+    """
+
+    _STOP = None
+
+    def __init__(self, ddsource: str, host: Optional[str] = None) -> None:
         self.ddsource = ddsource
+        self.host = host
+        self.service = ConfigService[str].get_value(key="datadog.app_name")
+        self.ddtags = f"env : {os.environ.get('APP_NAME')}"
+        self.batch_size = ConfigService[int].get_value(key="datadog.log_batch_size", default=500)
+        self.flush_interval_in_seconds = ConfigService[float].get_value(
+            key="datadog.log_flush_interval_in_seconds", default=2
+        )
+        self._queue: queue.Queue[Optional[Tuple[str, str]]] = queue.Queue(
+            maxsize=ConfigService[int].get_value(key="datadog.log_queue_size", default=10000)
+        )
+        self._stats_lock = threading.Lock()
+        self._sent = 0
+        self._dropped = 0
+        self._failed = 0
+        self._is_closed = False
+        logging.Handler.__init__(self)
+
+        self._worker = threading.Thread(target=self.__ship_logs, name="datadog-log-shipper", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
 
     def __get_status(self, record: LogRecord) -> str:
         if record.levelno in [logging.NOTSET, logging.DEBUG, logging.INFO]:
@@ -26,27 +62,119 @@ class DatadogHandler(StreamHandler):
             return result
 
     def emit(self, record: LogRecord) -> None:
-        msg = self.format(record)
-        datadog_api_key = ConfigService[str].get_value(key="datadog.api_key")
-        datadog_host = ConfigService[str].get_value(key="datadog.site_name")
-        data_app_name = ConfigService[str].get_value(key="datadog.app_name")
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = datadog_api_key
-        config.server_variables["site"] = datadog_host
-        config.debug = True
-        with ApiClient(config) as api_client:
-            api_instance = LogsApi(api_client)
-            body = HTTPLog(
-                [
-                    HTTPLogItem(
-                        ddsource=self.ddsource,
-                        ddtags=f"env : {os.environ.get('APP_NAME')}",
-                        hostname="",
-                        message=msg,
-                        service=data_app_name,
-                        status=self.__get_status(record=record),
-                    )
-                ]
+        try:
+            self._queue.put_nowait((self.format(record), self.__get_status(record=record)))
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def flush(self, timeout_in_seconds: float = 5) -> None:
+        """
+        Waits until every record queued so far has been submitted, or the timeout expires
+        """
+        deadline = time.monotonic() + timeout_in_seconds
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        if not self._is_closed:
+            self._is_closed = True
+            try:
+                self._queue.put(self._STOP, timeout=1)
+            except queue.Full:
+                pass
+            self._worker.join(timeout=5)
+            # Handlers are replaced on every reset, so each drops its exit hook once closed instead of piling them up
+            atexit.unregister(self.close)
+        logging.Handler.close(self)
+
+    def reset_after_fork(self) -> None:
+        """
+        Gives a forked child its own queue and shipper thread. The parent's thread does not survive the fork, and the
+        records queued before it are left for the parent to ship.
+        """
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._stats_lock = threading.Lock()
+        self._sent = 0
+        self._dropped = 0
+        self._failed = 0
+        self._worker = threading.Thread(target=self.__ship_logs, name="datadog-log-shipper", daemon=True)
+        self._worker.start()
+
+    def get_stats(self) -> LogShippingStats:
+        with self._stats_lock:
+            result = LogShippingStats(
+                queued=self._queue.qsize(), sent=self._sent, dropped=self._dropped, failed=self._failed
             )
+            return result
+
+    def __create_api_client(self) -> ApiClient:
+        config = Configuration(host=self.host) if self.host else Configuration()
+        config.api_key["apiKeyAuth"] = ConfigService[str].get_value(key="datadog.api_key")
+        config.server_variables["site"] = ConfigService[str].get_value(key="datadog.site_name")
+        result = ApiClient(config)
+        return result
+
+    def __ship_logs(self) -> None:
+        with self.__create_api_client() as api_client:
+            logs_api = LogsApi(api_client)
+            is_stopping = False
+            while not is_stopping:
+                batch, is_stopping = self.__collect_batch()
+                if batch:
+                    self.__submit_batch(logs_api, batch)
+                for _ in range(len(batch) + (1 if is_stopping else 0)):
+                    self._queue.task_done()
+
+    def __collect_batch(self) -> Tuple[List[Tuple[str, str]], bool]:
+        batch: List[Tuple[str, str]] = []
+        entry = self._queue.get()
+        if entry is self._STOP:
+            return batch, True
+
+        batch.append(entry)
+        deadline = time.monotonic() + self.flush_interval_in_seconds
+        while len(batch) < self.batch_size:
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining_seconds)
+            except queue.Empty:
+                break
+            if entry is self._STOP:
+                return batch, True
+            batch.append(entry)
+
+        return batch, False
+
+    def __submit_batch(self, logs_api: LogsApi, batch: List[Tuple[str, str]]) -> None:
+        # Every field is a str built by this handler, so the client's per-field type checks are skipped
+        body = HTTPLog(
+            [
+                HTTPLogItem(
+                    ddsource=self.ddsource,
+                    ddtags=self.ddtags,
+                    hostname="",
+                    message=message,
+                    service=self.service,
+                    status=status,
+                    _check_type=False,
+                )
+                for message, status in batch
+            ],
+            _check_type=False,
+        )
+        try:
+            logs_api.submit_log(body)
+        except Exception as e:
+            # Logging the failure through the logger would feed it back into this handler
+            print(f"Failed to ship {len(batch)} log records to Datadog: {e}", file=sys.stderr)
+            with self._stats_lock:
+                self._failed += len(batch)
+            return
 
-            api_instance.submit_log(body)
+        with self._stats_lock:
+            self._sent += len(batch)
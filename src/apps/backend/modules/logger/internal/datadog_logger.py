@@ -1,8 +1,10 @@
 import logging
+from typing import Any, Dict
 
 from modules.logger.internal.base_logger import BaseLogger
 from modules.logger.internal.datadog_handler import DatadogHandler
 from modules.logger.internal.datadog_handler_level import LogLevel
+from modules.logger.internal.log_message import LogMessage
 
 
 class DatadogLogger(BaseLogger):
@@ -10,24 +12,35 @@ class DatadogLogger(BaseLogger):
         self.level = LogLevel.get_level()
         self.logger = logging.getLogger(__name__)
         self.format = "[%(asctime)s] - %(name)s - %(levelname)s - %(message)s"
-        self.formatter = logging.Formatter(self.format)
+        self.formatter = self.get_formatter(self.format)
         self.logger.setLevel(LogLevel.get_level())
         self.handler = DatadogHandler("flask")
         self.handler.setLevel(LogLevel.get_level())
         self.handler.setFormatter(self.formatter)
         self.logger.addHandler(self.handler)
 
-    def critical(self, *, message: str) -> None:
-        self.logger.critical(message)
+    def critical(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.critical(LogMessage(message, fields), extra={"fields": fields})
 
-    def debug(self, *, message: str) -> None:
-        self.logger.debug(message)
+    def debug(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.debug(LogMessage(message, fields), extra={"fields": fields})
 
-    def error(self, *, message: str) -> None:
-        self.logger.error(message)
+    def error(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.error(LogMessage(message, fields), extra={"fields": fields})
 
-    def info(self, *, message: str) -> None:
-        self.logger.info(message)
+    def info(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.info(LogMessage(message, fields), extra={"fields": fields})
 
-    def warn(self, *, message: str) -> None:
-        self.logger.warning(message)
+    def warn(self, *, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.warning(LogMessage(message, fields), extra={"fields": fields})
+
+    def is_enabled_for(self, level: int) -> bool:
+        result = self.logger.isEnabledFor(level)
+        return result
+
+    def close(self) -> None:
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+    def reset_after_fork(self) -> None:
+        self.handler.reset_after_fork()
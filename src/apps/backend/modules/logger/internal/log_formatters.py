@@ -0,0 +1,44 @@
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+TEXT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class StructuredTextFormatter(logging.Formatter):
+    """
+    Formats records as text, followed by their structured fields as key=value pairs
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        fields: Dict[str, Any] = getattr(record, "fields", None) or {}
+        if not fields:
+            return text
+
+        result = f"{text} " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return result
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line, with the structured fields as top level keys so they can be
+    indexed downstream
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields: Dict[str, Any] = getattr(record, "fields", None) or {}
+        for key, value in fields.items():
+            log_entry.setdefault(key, value)
+        if record.exc_info:
+            log_entry["exception"] = self.formatException(record.exc_info)
+
+        result = json.dumps(log_entry, default=str)
+        return result
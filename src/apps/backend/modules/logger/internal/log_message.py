@@ -0,0 +1,25 @@
+from typing import Any, Dict
+
+
+class LogMessage:
+    """
+    Message template rendered with its fields only when a handler formats the record, so records below the
+    logger level never pay for it.
+    """
+
+    __slots__ = ("template", "fields")
+
+    def __init__(self, template: str, fields: Dict[str, Any]) -> None:
+        self.template = template
+        self.fields = fields
+
+    def __str__(self) -> str:
+        if not self.fields:
+            return self.template
+
+        try:
+            result = self.template.format_map(self.fields)
+            return result
+        except (KeyError, IndexError, ValueError):
+            # Templates built as f-strings may contain braces from the interpolated values
+            return self.template
@@ -1,4 +1,5 @@
-from typing import Union
+import logging
+from typing import Any, Dict, Union
 
 from modules.config.config_service import ConfigService
 from modules.logger.internal.console_logger import ConsoleLogger
@@ -20,24 +21,52 @@ class Loggers:
                 Loggers._LOGGERS.append(Loggers.__get_datadog_logger())
 
     @staticmethod
-    def info(*, message: str) -> None:
-        [logger.info(message=message) for logger in Loggers._LOGGERS]
+    def reload_loggers() -> None:
+        previous_loggers = Loggers._LOGGERS
+        Loggers._LOGGERS = []
+        Loggers.initialize_loggers()
+        for logger in previous_loggers:
+            logger.close()
 
     @staticmethod
-    def debug(*, message: str) -> None:
-        [logger.debug(message=message) for logger in Loggers._LOGGERS]
+    def reset_after_fork() -> None:
+        for logger in Loggers._LOGGERS:
+            logger.reset_after_fork()
 
     @staticmethod
-    def error(*, message: str) -> None:
-        [logger.error(message=message) for logger in Loggers._LOGGERS]
+    def is_enabled_for(level: int) -> bool:
+        result = any(logger.is_enabled_for(level) for logger in Loggers._LOGGERS)
+        return result
+
+    @staticmethod
+    def info(*, message: str, fields: Dict[str, Any]) -> None:
+        for logger in Loggers._LOGGERS:
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(message=message, fields=fields)
+
+    @staticmethod
+    def debug(*, message: str, fields: Dict[str, Any]) -> None:
+        for logger in Loggers._LOGGERS:
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(message=message, fields=fields)
 
     @staticmethod
-    def warn(*, message: str) -> None:
-        [logger.warn(message=message) for logger in Loggers._LOGGERS]
+    def error(*, message: str, fields: Dict[str, Any]) -> None:
+        for logger in Loggers._LOGGERS:
+            if logger.is_enabled_for(logging.ERROR):
+                logger.error(message=message, fields=fields)
 
     @staticmethod
-    def critical(*, message: str) -> None:
-        [logger.critical(message=message) for logger in Loggers._LOGGERS]
+    def warn(*, message: str, fields: Dict[str, Any]) -> None:
+        for logger in Loggers._LOGGERS:
+            if logger.is_enabled_for(logging.WARNING):
+                logger.warn(message=message, fields=fields)
+
+    @staticmethod
+    def critical(*, message: str, fields: Dict[str, Any]) -> None:
+        for logger in Loggers._LOGGERS:
+            if logger.is_enabled_for(logging.CRITICAL):
+                logger.critical(message=message, fields=fields)
 
     @staticmethod
     def __get_console_logger() -> ConsoleLogger:
@@ -48,3 +77,8 @@ class Loggers:
     def __get_datadog_logger() -> DatadogLogger:
         result = DatadogLogger()
         return result
+
+
+# Rebuild the transports when their config is reloaded, e.g. a rotated Datadog API key
+ConfigService.subscribe("logger", Loggers.reload_loggers)
+ConfigService.subscribe("datadog", Loggers.reload_loggers)
@@ -5,3 +5,11 @@ from dataclasses import dataclass
 class LoggerTransports:
     CONSOLE: str = "console"
     DATADOG: str = "datadog"
+
+
+@dataclass(frozen=True)
+class LogShippingStats:
+    queued: int
+    sent: int
+    dropped: int
+    failed: int
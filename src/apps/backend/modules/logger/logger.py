@@ -1,23 +1,40 @@
+import logging
+from typing import Any
+
 from modules.logger.internal.loggers import Loggers
 
 
 class Logger:
+    """
+    Messages may be plain strings or templates such as "Task {task_id} created"; keyword fields fill the template
+    when the record is actually emitted and are attached to the record as structured fields, e.g.
+    Logger.info(message="Task {task_id} created", task_id=task.id, account_id=account_id)
+    """
+
+    @staticmethod
+    def critical(*, message: str, **fields: Any) -> None:
+        Loggers.critical(message=message, fields=fields)
+
     @staticmethod
-    def critical(*, message: str) -> None:
-        Loggers.critical(message=message)
+    def info(*, message: str, **fields: Any) -> None:
+        Loggers.info(message=message, fields=fields)
 
     @staticmethod
-    def info(*, message: str) -> None:
-        Loggers.info(message=message)
+    def debug(*, message: str, **fields: Any) -> None:
+        Loggers.debug(message=message, fields=fields)
 
     @staticmethod
-    def debug(*, message: str) -> None:
-        Loggers.debug(message=message)
+    def error(*, message: str, **fields: Any) -> None:
+        Loggers.error(message=message, fields=fields)
 
     @staticmethod
-    def error(*, message: str) -> None:
-        Loggers.error(message=message)
+    def warn(*, message: str, **fields: Any) -> None:
+        Loggers.warn(message=message, fields=fields)
 
     @staticmethod
-    def warn(*, message: str) -> None:
-        Loggers.warn(message=message)
+    def is_debug_enabled() -> bool:
+        """
+        For callers whose debug fields are themselves expensive to compute
+        """
+        result = Loggers.is_enabled_for(logging.DEBUG)
+        return result
@@ -5,3 +5,7 @@ class LoggerManager:
     @staticmethod
     def mount_logger() -> None:
         Loggers.initialize_loggers()
+
+    @staticmethod
+    def reset_after_fork() -> None:
+        Loggers.reset_after_fork()
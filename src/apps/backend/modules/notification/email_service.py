@@ -1,7 +1,16 @@
+from typing import List
+
 from modules.logger.logger import Logger
-from modules.notification.internals.sendgrid_service import SendGridService
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.types import SendEmailParams
+from modules.notification.internals.bulk_notification_sender import BulkNotificationSender
+from modules.notification.internals.notification_outbox import NotificationOutbox
+from modules.notification.internals.notification_transport import NotificationTransport
+from modules.notification.types import (
+    NotificationDeliveryResult,
+    NotificationDeliveryStatus,
+    SendBulkEmailParams,
+    SendEmailParams,
+)
 
 
 class EmailService:
@@ -13,11 +22,37 @@ class EmailService:
             )
             if not preferences.email_enabled:
                 Logger.info(
-                    message=f"Email notification skipped for {params.recipient.email} "
-                    f"(account {account_id}) using template {params.template_id}: "
-                    f"disabled by user preferences"
+                    message="Email notification skipped for {recipient_email} (account {account_id}) "
+                    "using template {template_id}: disabled by user preferences",
+                    recipient_email=params.recipient.email,
+                    account_id=account_id,
+                    template_id=params.template_id,
                 )
                 return
 
-        result = SendGridService.send_email(params)
+        if NotificationOutbox.is_enabled():
+            NotificationOutbox.enqueue_email(params)
+            return
+
+        result = NotificationTransport.send_email(params)
+        return result
+
+    @staticmethod
+    def send_bulk_email(*, params: SendBulkEmailParams) -> List[NotificationDeliveryResult]:
+        deliverable_indexes, results = BulkNotificationSender.apply_preferences(
+            account_ids=[item.account_id for item in params.items],
+            bypass_preferences=params.bypass_preferences,
+            is_channel_enabled=lambda preferences: preferences.email_enabled,
+        )
+
+        results.extend(
+            BulkNotificationSender.send_emails([(index, params.items[index]) for index in deliverable_indexes])
+        )
+        Logger.info(
+            message="Bulk email processed {recipient_count} recipients, {sent_count} sent",
+            recipient_count=len(params.items),
+            sent_count=sum(1 for result in results if result.status == NotificationDeliveryStatus.SENT),
+        )
+
+        result = sorted(results, key=lambda delivery_result: delivery_result.index)
         return result
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from modules.application.common.config_ttl_cache import ConfigTTLCache
+from modules.application.common.types import CacheStats
+from modules.notification.types import AccountNotificationPreferences
+
+
+class AccountNotificationPreferencesCache:
+    """
+    Process-wide TTL/LRU cache of notification preferences keyed by account id, enabled with
+    notification.preferences_cache.enabled. AccountNotificationPreferenceWriter invalidates entries it changes;
+    changes made by other processes become visible once the TTL expires.
+    """
+
+    _cache: ConfigTTLCache[AccountNotificationPreferences] = ConfigTTLCache(
+        config_key="notification.preferences_cache", enabled_by_default=True, ttl_in_seconds=60
+    )
+
+    @classmethod
+    def get(cls, *, account_id: str) -> Optional[AccountNotificationPreferences]:
+        result = cls._cache.get(account_id)
+        return result
+
+    @classmethod
+    def set(cls, *, preferences: AccountNotificationPreferences) -> None:
+        cls._cache.set(preferences.account_id, preferences)
+
+    @classmethod
+    def invalidate(cls, *, account_id: str) -> None:
+        cls._cache.invalidate(account_id)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def get_stats(cls) -> CacheStats:
+        result = cls._cache.get_stats()
+        return result
@@ -1,6 +1,9 @@
+from typing import Dict, List
+
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
 from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import AccountNotificationPreferences
@@ -9,6 +12,10 @@ from modules.notification.types import AccountNotificationPreferences
 class AccountNotificationPreferenceReader:
     @staticmethod
     def get_account_notification_preferences_by_account_id(account_id: str) -> AccountNotificationPreferences:
+        cached_preferences = AccountNotificationPreferencesCache.get(account_id=account_id)
+        if cached_preferences is not None:
+            return cached_preferences
+
         notification_preferences = AccountNotificationPreferencesRepository.collection().find_one(
             {"account_id": account_id, "active": True}
         )
@@ -16,6 +23,24 @@ class AccountNotificationPreferenceReader:
         if notification_preferences is None:
             raise AccountNotificationPreferencesNotFoundError(account_id=account_id)
 
-        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+        result = AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             notification_preferences
         )
+        AccountNotificationPreferencesCache.set(preferences=result)
+        return result
+
+    @staticmethod
+    def get_account_notification_preferences_by_account_ids(
+        account_ids: List[str],
+    ) -> Dict[str, AccountNotificationPreferences]:
+        # Bulk sends read past the cache so one digest run does not evict the entries hot for regular traffic
+        notification_preferences_bson = AccountNotificationPreferencesRepository.collection().find(
+            {"account_id": {"$in": list(set(account_ids))}, "active": True}
+        )
+        result = {}
+        for preferences_bson in notification_preferences_bson:
+            preferences = AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+                preferences_bson
+            )
+            result[preferences.account_id] = preferences
+        return result
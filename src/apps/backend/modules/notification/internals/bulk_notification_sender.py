@@ -0,0 +1,148 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+from modules.application.errors import AppError
+from modules.config.config_service import ConfigService
+from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.notification_transport import NotificationTransport
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.internals.sendgrid_service import SENDGRID_MAX_PERSONALIZATIONS
+from modules.notification.types import (
+    AccountNotificationPreferences,
+    BulkEmailItem,
+    BulkSMSItem,
+    NotificationDeliveryResult,
+    NotificationDeliveryStatus,
+    NotificationErrorCode,
+)
+
+
+class BulkNotificationSender:
+    @staticmethod
+    def apply_preferences(
+        *,
+        account_ids: List[str],
+        bypass_preferences: bool,
+        is_channel_enabled: Callable[[AccountNotificationPreferences], bool],
+    ) -> Tuple[List[int], List[NotificationDeliveryResult]]:
+        """
+        Returns the indexes of the recipients to deliver to, and results for the ones skipped or without preferences
+        """
+        if bypass_preferences:
+            result: Tuple[List[int], List[NotificationDeliveryResult]] = (list(range(len(account_ids))), [])
+            return result
+
+        preferences_by_account_id = (
+            AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(account_ids)
+        )
+        deliverable_indexes: List[int] = []
+        results: List[NotificationDeliveryResult] = []
+        for index, account_id in enumerate(account_ids):
+            preferences = preferences_by_account_id.get(account_id)
+            if preferences is None:
+                results.append(
+                    BulkNotificationSender._build_failed_result(
+                        index, account_id, AccountNotificationPreferencesNotFoundError(account_id=account_id)
+                    )
+                )
+            elif not is_channel_enabled(preferences):
+                results.append(
+                    NotificationDeliveryResult(
+                        index=index,
+                        account_id=account_id,
+                        status=NotificationDeliveryStatus.SKIPPED,
+                        message="Disabled by user preferences",
+                    )
+                )
+            else:
+                deliverable_indexes.append(index)
+
+        result = (deliverable_indexes, results)
+        return result
+
+    @staticmethod
+    def send_emails(items: List[Tuple[int, BulkEmailItem]]) -> List[NotificationDeliveryResult]:
+        results: List[NotificationDeliveryResult] = []
+        groups: Dict[Tuple[str, str, str], List[Tuple[int, BulkEmailItem]]] = {}
+        for index, item in items:
+            try:
+                EmailParams.validate(item.params)
+            except AppError as e:
+                results.append(BulkNotificationSender._build_failed_result(index, item.account_id, e))
+                continue
+
+            group_key = (item.params.template_id, item.params.sender.email, item.params.sender.name)
+            groups.setdefault(group_key, []).append((index, item))
+
+        chunks = [
+            group[start : start + SENDGRID_MAX_PERSONALIZATIONS]
+            for group in groups.values()
+            for start in range(0, len(group), SENDGRID_MAX_PERSONALIZATIONS)
+        ]
+        with ThreadPoolExecutor(max_workers=BulkNotificationSender._get_max_concurrency()) as executor:
+            for chunk_results in executor.map(BulkNotificationSender._send_email_chunk, chunks):
+                results.extend(chunk_results)
+
+        return results
+
+    @staticmethod
+    def send_sms(items: List[Tuple[int, BulkSMSItem]]) -> List[NotificationDeliveryResult]:
+        # Twilio has no multi-recipient send, so each message is its own request
+        with ThreadPoolExecutor(max_workers=BulkNotificationSender._get_max_concurrency()) as executor:
+            result = list(executor.map(BulkNotificationSender._send_single_sms, items))
+        return result
+
+    @staticmethod
+    def _send_email_chunk(chunk: List[Tuple[int, BulkEmailItem]]) -> List[NotificationDeliveryResult]:
+        try:
+            NotificationTransport.send_bulk_email([item.params for _, item in chunk])
+        except Exception as e:
+            result = [BulkNotificationSender._build_failed_result(index, item.account_id, e) for index, item in chunk]
+            return result
+
+        result = [
+            NotificationDeliveryResult(index=index, account_id=item.account_id, status=NotificationDeliveryStatus.SENT)
+            for index, item in chunk
+        ]
+        return result
+
+    @staticmethod
+    def _send_single_sms(indexed_item: Tuple[int, BulkSMSItem]) -> NotificationDeliveryResult:
+        index, item = indexed_item
+        try:
+            NotificationTransport.send_sms(item.params)
+        except Exception as e:
+            result = BulkNotificationSender._build_failed_result(index, item.account_id, e)
+            return result
+
+        result = NotificationDeliveryResult(
+            index=index, account_id=item.account_id, status=NotificationDeliveryStatus.SENT
+        )
+        return result
+
+    @staticmethod
+    def _build_failed_result(index: int, account_id: str, error: Exception) -> NotificationDeliveryResult:
+        if isinstance(error, AppError):
+            result = NotificationDeliveryResult(
+                index=index,
+                account_id=account_id,
+                status=NotificationDeliveryStatus.FAILED,
+                error_code=error.code,
+                message=error.message,
+            )
+            return result
+
+        result = NotificationDeliveryResult(
+            index=index,
+            account_id=account_id,
+            status=NotificationDeliveryStatus.FAILED,
+            error_code=NotificationErrorCode.SERVICE_ERROR,
+            message=str(error),
+        )
+        return result
+
+    @staticmethod
+    def _get_max_concurrency() -> int:
+        result = ConfigService[int].get_value(key="notification.bulk_max_concurrency", default=8)
+        return result
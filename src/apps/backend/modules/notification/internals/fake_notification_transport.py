@@ -0,0 +1,44 @@
+from typing import List
+
+from modules.logger.logger import Logger
+from modules.notification.types import SendEmailParams, SendSMSParams
+
+
+class FakeNotificationTransport:
+    """
+    Records notifications in memory instead of calling SendGrid or Twilio, for local development and tests
+    """
+
+    SENT_EMAILS: List[SendEmailParams] = []
+    SENT_EMAIL_BATCHES: List[List[SendEmailParams]] = []
+    SENT_SMS: List[SendSMSParams] = []
+
+    @staticmethod
+    def send_email(params: SendEmailParams) -> None:
+        FakeNotificationTransport.SENT_EMAILS.append(params)
+        Logger.info(
+            message="Fake transport recorded email using template {template_id}",
+            recipient_email=params.recipient.email,
+            template_id=params.template_id,
+        )
+
+    @staticmethod
+    def send_bulk_email(params_list: List[SendEmailParams]) -> None:
+        FakeNotificationTransport.SENT_EMAILS.extend(params_list)
+        FakeNotificationTransport.SENT_EMAIL_BATCHES.append(params_list)
+        Logger.info(
+            message="Fake transport recorded {email_count} emails using template {template_id}",
+            email_count=len(params_list),
+            template_id=params_list[0].template_id,
+        )
+
+    @staticmethod
+    def send_sms(params: SendSMSParams) -> None:
+        FakeNotificationTransport.SENT_SMS.append(params)
+        Logger.info(message="Fake transport recorded SMS", recipient_phone=str(params.recipient_phone))
+
+    @staticmethod
+    def clear() -> None:
+        FakeNotificationTransport.SENT_EMAILS.clear()
+        FakeNotificationTransport.SENT_EMAIL_BATCHES.clear()
+        FakeNotificationTransport.SENT_SMS.clear()
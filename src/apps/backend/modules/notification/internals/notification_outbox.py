@@ -0,0 +1,46 @@
+from dataclasses import asdict
+
+from modules.application.application_service import ApplicationService
+from modules.application.errors import AppError
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.types import NotificationChannel, OutboxNotification, SendEmailParams, SendSMSParams
+from modules.notification.workers.notification_dispatch_worker import NotificationDispatchWorker
+
+
+class NotificationOutbox:
+    DISPATCH_MODE = ConfigService[str].get_accessor("notification.dispatch_mode", default="sync")
+
+    @staticmethod
+    def is_enabled() -> bool:
+        result = NotificationOutbox.DISPATCH_MODE() == "outbox"
+        return result
+
+    @staticmethod
+    def enqueue_email(params: SendEmailParams) -> OutboxNotification:
+        result = NotificationOutbox._enqueue(channel=NotificationChannel.EMAIL, payload=asdict(params))
+        return result
+
+    @staticmethod
+    def enqueue_sms(params: SendSMSParams) -> OutboxNotification:
+        result = NotificationOutbox._enqueue(channel=NotificationChannel.SMS, payload=asdict(params))
+        return result
+
+    @staticmethod
+    def _enqueue(*, channel: NotificationChannel, payload: dict) -> OutboxNotification:
+        notification = NotificationOutboxWriter.create_notification(channel=channel, payload=payload)
+
+        try:
+            ApplicationService.run_worker_immediately(cls=NotificationDispatchWorker, arguments=(notification.id,))
+        except AppError as e:
+            Logger.warn(
+                message="Could not start delivery of notification {notification_id}, "
+                "it stays pending for the next sweep: {error}",
+                notification_id=notification.id,
+                attempts=notification.attempts,
+                error=e.message,
+            )
+
+        result = notification
+        return result
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+from modules.logger.logger import Logger
+from modules.notification.internals.notification_outbox_reader import NotificationOutboxReader
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.notification_transport import NotificationTransport
+from modules.notification.types import NotificationChannel, NotificationOutboxStatus, OutboxNotification
+
+# How long a delivery attempt owns a notification before another attempt may pick it up
+DISPATCH_LEASE_IN_SECONDS = 60
+
+# Pending notifications younger than this are left to the worker started when they were enqueued
+SWEEP_DELAY_IN_SECONDS = 60
+
+SWEEP_BATCH_SIZE = 100
+
+
+class NotificationOutboxDispatcher:
+    @staticmethod
+    def dispatch_notification(*, notification_id: str, max_attempts: int) -> None:
+        notification = NotificationOutboxWriter.claim_notification(
+            notification_id=notification_id, lease_in_seconds=DISPATCH_LEASE_IN_SECONDS
+        )
+        if notification is None:
+            Logger.info(
+                message="Notification {notification_id} is already processed or being delivered, skipping",
+                notification_id=notification_id,
+            )
+            return
+
+        try:
+            NotificationOutboxDispatcher._deliver(notification)
+
+        except Exception as e:
+            failed_notification = NotificationOutboxWriter.record_failed_attempt(
+                notification_id=notification_id, error=str(e), max_attempts=max_attempts
+            )
+            if failed_notification.status == NotificationOutboxStatus.FAILED:
+                Logger.error(
+                    message="Notification {notification_id} failed after {attempts} attempts: {error}",
+                    notification_id=notification_id,
+                    attempts=failed_notification.attempts,
+                    error=str(e),
+                )
+            else:
+                Logger.warn(
+                    message="Notification {notification_id} delivery attempt failed, will retry: {error}",
+                    notification_id=notification_id,
+                    error=str(e),
+                )
+            raise
+
+        NotificationOutboxWriter.mark_notification_sent(notification_id)
+
+    @staticmethod
+    def dispatch_pending_notifications(*, max_attempts: int) -> int:
+        notification_ids = NotificationOutboxReader.get_dispatchable_notification_ids(
+            created_before=datetime.now() - timedelta(seconds=SWEEP_DELAY_IN_SECONDS), limit=SWEEP_BATCH_SIZE
+        )
+
+        failed_count = 0
+        for notification_id in notification_ids:
+            try:
+                NotificationOutboxDispatcher.dispatch_notification(
+                    notification_id=notification_id, max_attempts=max_attempts
+                )
+            except Exception:
+                # The failure is recorded on the notification, the next sweep retries it until max_attempts
+                failed_count += 1
+
+        result = len(notification_ids) - failed_count
+        return result
+
+    @staticmethod
+    def _deliver(notification: OutboxNotification) -> None:
+        if notification.channel == NotificationChannel.EMAIL:
+            NotificationTransport.send_email(
+                NotificationOutboxUtil.convert_payload_to_send_email_params(notification.payload)
+            )
+        else:
+            NotificationTransport.send_sms(
+                NotificationOutboxUtil.convert_payload_to_send_sms_params(notification.payload)
+            )
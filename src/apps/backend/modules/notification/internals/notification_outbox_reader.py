@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import List
+
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.types import NotificationOutboxStatus
+
+
+class NotificationOutboxReader:
+    @staticmethod
+    def get_dispatchable_notification_ids(*, created_before: datetime, limit: int) -> List[str]:
+        notifications_bson = (
+            NotificationOutboxRepository.collection()
+            .find(
+                {
+                    "status": NotificationOutboxStatus.PENDING,
+                    "created_at": {"$lt": created_before},
+                    "$or": [{"locked_until": None}, {"locked_until": {"$lt": datetime.now()}}],
+                },
+                {"_id": 1},
+            )
+            .sort("created_at", 1)
+            .limit(limit)
+        )
+        result = [str(notification_bson["_id"]) for notification_bson in notifications_bson]
+        return result
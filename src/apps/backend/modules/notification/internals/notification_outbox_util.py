@@ -0,0 +1,38 @@
+from typing import Any
+
+from modules.account.types import PhoneNumber
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+from modules.notification.types import EmailRecipient, EmailSender, OutboxNotification, SendEmailParams, SendSMSParams
+
+
+class NotificationOutboxUtil:
+    @staticmethod
+    def convert_notification_outbox_bson_to_outbox_notification(
+        notification_bson: dict[str, Any]
+    ) -> OutboxNotification:
+        validated_notification_data = NotificationOutboxModel.from_bson(notification_bson)
+        return OutboxNotification(
+            id=str(validated_notification_data.id),
+            channel=validated_notification_data.channel,
+            payload=validated_notification_data.payload,
+            status=validated_notification_data.status,
+            attempts=validated_notification_data.attempts,
+            last_error=validated_notification_data.last_error,
+        )
+
+    @staticmethod
+    def convert_payload_to_send_email_params(payload: dict[str, Any]) -> SendEmailParams:
+        result = SendEmailParams(
+            recipient=EmailRecipient(**payload["recipient"]),
+            sender=EmailSender(**payload["sender"]),
+            template_id=payload["template_id"],
+            template_data=payload.get("template_data"),
+        )
+        return result
+
+    @staticmethod
+    def convert_payload_to_send_sms_params(payload: dict[str, Any]) -> SendSMSParams:
+        result = SendSMSParams(
+            message_body=payload["message_body"], recipient_phone=PhoneNumber(**payload["recipient_phone"])
+        )
+        return result
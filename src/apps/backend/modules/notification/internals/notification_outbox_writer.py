@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.types import NotificationChannel, NotificationOutboxStatus, OutboxNotification
+
+
+class NotificationOutboxWriter:
+    @staticmethod
+    def create_notification(*, channel: NotificationChannel, payload: dict[str, Any]) -> OutboxNotification:
+        created_at = datetime.now()
+        notification_bson = NotificationOutboxModel(
+            channel=str(channel),
+            status=str(NotificationOutboxStatus.PENDING),
+            payload=payload,
+            created_at=created_at,
+            updated_at=created_at,
+        ).to_bson()
+        notification_bson = NotificationOutboxRepository.insert_one_and_return(notification_bson)
+        result = NotificationOutboxUtil.convert_notification_outbox_bson_to_outbox_notification(notification_bson)
+        return result
+
+    @staticmethod
+    def claim_notification(*, notification_id: str, lease_in_seconds: int) -> Optional[OutboxNotification]:
+        # The lease keeps the sweep and the worker started at enqueue time from delivering the same notification
+        now = datetime.now()
+        notification_bson = NotificationOutboxRepository.collection().find_one_and_update(
+            {
+                "_id": ObjectId(notification_id),
+                "status": NotificationOutboxStatus.PENDING,
+                "$or": [{"locked_until": None}, {"locked_until": {"$lt": now}}],
+            },
+            {"$set": {"locked_until": now + timedelta(seconds=lease_in_seconds), "updated_at": now}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if notification_bson is None:
+            return None
+
+        result = NotificationOutboxUtil.convert_notification_outbox_bson_to_outbox_notification(notification_bson)
+        return result
+
+    @staticmethod
+    def mark_notification_sent(notification_id: str) -> None:
+        now = datetime.now()
+        NotificationOutboxRepository.collection().update_one(
+            {"_id": ObjectId(notification_id)},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.SENT,
+                    # The payload may carry secrets, e.g. a password reset link or an OTP, and is not needed once
+                    # processed
+                    "payload": {},
+                    "locked_until": None,
+                    "processed_at": now,
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+        )
+
+    @staticmethod
+    def record_failed_attempt(*, notification_id: str, error: str, max_attempts: int) -> OutboxNotification:
+        now = datetime.now()
+        notification_bson = NotificationOutboxRepository.collection().find_one_and_update(
+            {"_id": ObjectId(notification_id)},
+            {"$set": {"last_error": error, "locked_until": None, "updated_at": now}, "$inc": {"attempts": 1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if notification_bson["attempts"] >= max_attempts:
+            notification_bson = NotificationOutboxRepository.collection().find_one_and_update(
+                {"_id": ObjectId(notification_id)},
+                {"$set": {"status": NotificationOutboxStatus.FAILED, "payload": {}, "processed_at": now}},
+                return_document=ReturnDocument.AFTER,
+            )
+
+        result = NotificationOutboxUtil.convert_notification_outbox_bson_to_outbox_notification(notification_bson)
+        return result
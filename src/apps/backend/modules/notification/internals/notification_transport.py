@@ -0,0 +1,40 @@
+from typing import List
+
+from modules.config.config_service import ConfigService
+from modules.notification.internals.fake_notification_transport import FakeNotificationTransport
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import SendEmailParams, SendSMSParams
+
+
+class NotificationTransport:
+    TRANSPORT = ConfigService[str].get_accessor("notification.transport", default="live")
+
+    @staticmethod
+    def send_email(params: SendEmailParams) -> None:
+        if NotificationTransport._is_fake_transport():
+            FakeNotificationTransport.send_email(params)
+            return
+
+        SendGridService.send_email(params)
+
+    @staticmethod
+    def send_bulk_email(params_list: List[SendEmailParams]) -> None:
+        if NotificationTransport._is_fake_transport():
+            FakeNotificationTransport.send_bulk_email(params_list)
+            return
+
+        SendGridService.send_bulk_email(params_list)
+
+    @staticmethod
+    def send_sms(params: SendSMSParams) -> None:
+        if NotificationTransport._is_fake_transport():
+            FakeNotificationTransport.send_sms(params)
+            return
+
+        TwilioService.send_sms(params=params)
+
+    @staticmethod
+    def _is_fake_transport() -> bool:
+        result = NotificationTransport.TRANSPORT() == "fake"
+        return result
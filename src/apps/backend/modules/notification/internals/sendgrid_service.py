@@ -1,13 +1,16 @@
-from typing import Optional
+from typing import List, Optional
 
 import sendgrid
-from sendgrid.helpers.mail import From, Mail, TemplateId, To
+from sendgrid.helpers.mail import From, Mail, Personalization, TemplateId, To
 
 from modules.config.config_service import ConfigService
 from modules.notification.errors import ServiceError
 from modules.notification.internals.sendgrid_email_params import EmailParams
 from modules.notification.types import SendEmailParams
 
+# SendGrid rejects mail send requests with more personalizations than this
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
 
 class SendGridService:
     __client: Optional[sendgrid.SendGridAPIClient] = None
@@ -27,6 +30,34 @@ class SendGridService:
         except sendgrid.SendGridException as err:
             raise ServiceError(err)
 
+    @staticmethod
+    def send_bulk_email(params_list: List[SendEmailParams]) -> None:
+        """
+        Sends one request with a personalization per recipient; all params must share the sender and template
+        """
+        for params in params_list:
+            EmailParams.validate(params)
+
+        message = Mail(from_email=From(params_list[0].sender.email, params_list[0].sender.name))
+        message.template_id = TemplateId(params_list[0].template_id)
+        for params in params_list:
+            personalization = Personalization()
+            personalization.add_to(To(params.recipient.email))
+            if params.template_data:
+                personalization.dynamic_template_data = params.template_data
+            message.add_personalization(personalization)
+
+        try:
+            client = SendGridService.get_client()
+            client.send(message)
+
+        except sendgrid.SendGridException as err:
+            raise ServiceError(err)
+
+    @staticmethod
+    def reset_client() -> None:
+        SendGridService.__client = None
+
     @staticmethod
     def get_client() -> sendgrid.SendGridAPIClient:
         if not SendGridService.__client:
@@ -34,3 +65,6 @@ class SendGridService:
             SendGridService.__client = sendgrid.SendGridAPIClient(api_key=api_key)
         result = SendGridService.__client
         return result
+
+
+ConfigService.subscribe("sendgrid", SendGridService.reset_client)
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class NotificationOutboxModel(BaseModel):
+    channel: str
+    status: str
+    id: Optional[ObjectId | str] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    locked_until: Optional[datetime] = None
+    processed_at: Optional[datetime] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "NotificationOutboxModel":
+        return cls(
+            channel=bson_data.get("channel", ""),
+            status=bson_data.get("status", ""),
+            id=bson_data.get("_id"),
+            payload=bson_data.get("payload", {}),
+            attempts=bson_data.get("attempts", 0),
+            last_error=bson_data.get("last_error"),
+            created_at=bson_data.get("created_at"),
+            updated_at=bson_data.get("updated_at"),
+            locked_until=bson_data.get("locked_until"),
+            processed_at=bson_data.get("processed_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        result = "notification_outbox"
+        return result
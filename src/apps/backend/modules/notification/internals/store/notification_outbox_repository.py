@@ -0,0 +1,37 @@
+from pymongo import IndexModel
+
+from modules.application.repository import ApplicationRepository
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+
+NOTIFICATION_OUTBOX_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["channel", "payload", "status", "attempts", "created_at", "updated_at"],
+        "properties": {
+            "channel": {"bsonType": "string", "enum": ["EMAIL", "SMS"]},
+            "payload": {"bsonType": "object"},
+            "status": {"bsonType": "string", "enum": ["PENDING", "SENT", "FAILED"]},
+            "attempts": {"bsonType": "int"},
+            "last_error": {"bsonType": ["string", "null"]},
+            "created_at": {"bsonType": "date"},
+            "updated_at": {"bsonType": "date"},
+            "locked_until": {"bsonType": ["date", "null"]},
+            "processed_at": {"bsonType": ["date", "null"]},
+        },
+    }
+}
+
+
+# Notifications are kept for a week after they are created for troubleshooting, whatever their status, so one that is
+# never processed is purged too. Delivered and failed ones no longer have their payload by then.
+NOTIFICATION_RETENTION_IN_SECONDS = 7 * 24 * 60 * 60
+
+
+class NotificationOutboxRepository(ApplicationRepository):
+    collection_name = NotificationOutboxModel.get_collection_name()
+
+    indexes = [
+        IndexModel([("status", 1), ("created_at", 1)], name="status_created_at_index"),
+        IndexModel("created_at", name="created_at_ttl_index", expireAfterSeconds=NOTIFICATION_RETENTION_IN_SECONDS),
+    ]
+    validator = NOTIFICATION_OUTBOX_VALIDATION_SCHEMA
@@ -29,6 +29,10 @@ class TwilioService:
         except TwilioException as err:
             raise ServiceError(err)
 
+    @staticmethod
+    def reset_client() -> None:
+        TwilioService.__client = None
+
     @staticmethod
     def get_client() -> Client:
         if not TwilioService.__client:
@@ -40,3 +44,6 @@ class TwilioService:
 
         result = TwilioService.__client
         return result
+
+
+ConfigService.subscribe("twilio", TwilioService.reset_client)
@@ -1,8 +1,17 @@
+from typing import List
+
+from modules.application.common.types import CacheStats
 from modules.notification.email_service import EmailService
 from modules.notification.sms_service import SMSService
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
 from modules.notification.internals.account_notification_preferences_writer import AccountNotificationPreferenceWriter
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.twilio_service import TwilioService
 from modules.notification.types import (
+    NotificationDeliveryResult,
+    SendBulkEmailParams,
+    SendBulkSMSParams,
     SendEmailParams,
     SendSMSParams,
     CreateOrUpdateAccountNotificationPreferencesParams,
@@ -24,6 +33,16 @@ class NotificationService:
             account_id=account_id, bypass_preferences=bypass_preferences, params=params
         )
 
+    @staticmethod
+    def send_bulk_email(*, params: SendBulkEmailParams) -> List[NotificationDeliveryResult]:
+        result = EmailService.send_bulk_email(params=params)
+        return result
+
+    @staticmethod
+    def send_bulk_sms(*, params: SendBulkSMSParams) -> List[NotificationDeliveryResult]:
+        result = SMSService.send_bulk_sms(params=params)
+        return result
+
     @staticmethod
     def create_or_update_account_notification_preferences(
         *, account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
@@ -36,3 +55,13 @@ class NotificationService:
     def get_account_notification_preferences_by_account_id(*, account_id: str) -> AccountNotificationPreferences:
         result = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
         return result
+
+    @staticmethod
+    def get_account_notification_preferences_cache_stats() -> CacheStats:
+        result = AccountNotificationPreferencesCache.get_stats()
+        return result
+
+    @staticmethod
+    def reset_provider_clients() -> None:
+        SendGridService.reset_client()
+        TwilioService.reset_client()
@@ -1,16 +1,29 @@
+from typing import List
+
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
-from modules.notification.internals.twilio_service import TwilioService
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.types import SendSMSParams
+from modules.notification.internals.bulk_notification_sender import BulkNotificationSender
+from modules.notification.internals.notification_outbox import NotificationOutbox
+from modules.notification.internals.notification_transport import NotificationTransport
+from modules.notification.types import (
+    NotificationDeliveryResult,
+    NotificationDeliveryStatus,
+    SendBulkSMSParams,
+    SendSMSParams,
+)
 
 
 class SMSService:
+    IS_SMS_ENABLED = ConfigService[bool].get_accessor("sms.enabled")
+
     @staticmethod
     def send_sms_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendSMSParams) -> None:
-        is_sms_enabled = ConfigService[bool].get_value(key="sms.enabled")
+        is_sms_enabled = SMSService.IS_SMS_ENABLED()
         if not is_sms_enabled:
-            Logger.warn(message=f"SMS is disabled. Could not send message - {params.message_body}")
+            Logger.warn(
+                message="SMS is disabled. Could not send message - {message_body}", message_body=params.message_body
+            )
             return
 
         if not bypass_preferences:
@@ -19,9 +32,47 @@ class SMSService:
             )
             if not preferences.sms_enabled:
                 Logger.info(
-                    message=f"SMS notification skipped for {params.recipient_phone} "
-                    f"(account {account_id}): disabled by user preferences"
+                    message="SMS notification skipped for {recipient_phone} (account {account_id}): "
+                    "disabled by user preferences",
+                    recipient_phone=str(params.recipient_phone),
+                    account_id=account_id,
                 )
                 return
 
-        TwilioService.send_sms(params=params)
+        if NotificationOutbox.is_enabled():
+            NotificationOutbox.enqueue_sms(params)
+            return
+
+        NotificationTransport.send_sms(params)
+
+    @staticmethod
+    def send_bulk_sms(*, params: SendBulkSMSParams) -> List[NotificationDeliveryResult]:
+        is_sms_enabled = SMSService.IS_SMS_ENABLED()
+        if not is_sms_enabled:
+            Logger.warn(message="SMS is disabled. Could not send {count} bulk messages", count=len(params.items))
+            result = [
+                NotificationDeliveryResult(
+                    index=index,
+                    account_id=item.account_id,
+                    status=NotificationDeliveryStatus.SKIPPED,
+                    message="SMS is disabled",
+                )
+                for index, item in enumerate(params.items)
+            ]
+            return result
+
+        deliverable_indexes, results = BulkNotificationSender.apply_preferences(
+            account_ids=[item.account_id for item in params.items],
+            bypass_preferences=params.bypass_preferences,
+            is_channel_enabled=lambda preferences: preferences.sms_enabled,
+        )
+
+        results.extend(BulkNotificationSender.send_sms([(index, params.items[index]) for index in deliverable_indexes]))
+        Logger.info(
+            message="Bulk SMS processed {recipient_count} recipients, {sent_count} sent",
+            recipient_count=len(params.items),
+            sent_count=sum(1 for result in results if result.status == NotificationDeliveryStatus.SENT),
+        )
+
+        result = sorted(results, key=lambda delivery_result: delivery_result.index)
+        return result
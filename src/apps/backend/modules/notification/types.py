@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from enum import StrEnum
+from typing import Any, Dict, List, Optional
 
 from modules.account.types import PhoneNumber
 
@@ -44,6 +45,66 @@ class SendSMSParams:
     recipient_phone: PhoneNumber
 
 
+@dataclass(frozen=True)
+class BulkEmailItem:
+    account_id: str
+    params: SendEmailParams
+
+
+@dataclass(frozen=True)
+class SendBulkEmailParams:
+    items: List[BulkEmailItem]
+    bypass_preferences: bool = False
+
+
+@dataclass(frozen=True)
+class BulkSMSItem:
+    account_id: str
+    params: SendSMSParams
+
+
+@dataclass(frozen=True)
+class SendBulkSMSParams:
+    items: List[BulkSMSItem]
+    bypass_preferences: bool = False
+
+
+class NotificationDeliveryStatus(StrEnum):
+    SENT = "SENT"
+    SKIPPED = "SKIPPED"
+    FAILED = "FAILED"
+
+
+@dataclass(frozen=True)
+class NotificationDeliveryResult:
+    index: int
+    account_id: str
+    status: str
+    error_code: Optional[str] = None
+    message: Optional[str] = None
+
+
+class NotificationChannel(StrEnum):
+    EMAIL = "EMAIL"
+    SMS = "SMS"
+
+
+class NotificationOutboxStatus(StrEnum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+@dataclass(frozen=True)
+class OutboxNotification:
+    id: str
+    channel: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class NotificationErrorCode:
     PREFERENCES_NOT_FOUND = "NOTIFICATION_ERR_01"
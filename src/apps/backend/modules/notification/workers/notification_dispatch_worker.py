@@ -0,0 +1,33 @@
+import asyncio
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.notification.internals.notification_outbox_dispatcher import NotificationOutboxDispatcher
+
+
+class NotificationDispatchWorker(BaseWorker):
+    """
+    Delivers the outbox notification whose id is passed, or sweeps stale pending notifications when run without
+    arguments (as the cron does)
+    """
+
+    max_execution_time_in_seconds = 300
+    max_retries = 5
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        if args:
+            await asyncio.to_thread(
+                NotificationOutboxDispatcher.dispatch_notification,
+                notification_id=args[0],
+                max_attempts=NotificationDispatchWorker.max_retries,
+            )
+            return
+
+        await asyncio.to_thread(
+            NotificationOutboxDispatcher.dispatch_pending_notifications,
+            max_attempts=NotificationDispatchWorker.max_retries,
+        )
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
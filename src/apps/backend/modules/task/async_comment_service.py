@@ -0,0 +1,51 @@
+from modules.application.common.blocking_call_executor import BlockingCallExecutor
+from modules.application.common.types import PaginationResult
+from modules.task.comment_service import CommentService
+from modules.task.comment_types import (
+    BulkWriteCommentsParams,
+    BulkWriteCommentsResult,
+    Comment,
+    CommentDeletionResult,
+    CreateCommentParams,
+    DeleteCommentParams,
+    GetCommentParams,
+    GetPaginatedCommentsParams,
+    UpdateCommentParams,
+)
+
+
+class AsyncCommentService:
+    """
+    CommentService for the async (ASGI) app. The task lookup and the comment query run in the same call on the
+    BlockingCallExecutor.
+    """
+
+    @staticmethod
+    async def create_comment(*, params: CreateCommentParams) -> Comment:
+        result = await BlockingCallExecutor.run(CommentService.create_comment, params=params)
+        return result
+
+    @staticmethod
+    async def get_comment(*, params: GetCommentParams) -> Comment:
+        result = await BlockingCallExecutor.run(CommentService.get_comment, params=params)
+        return result
+
+    @staticmethod
+    async def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
+        result = await BlockingCallExecutor.run(CommentService.get_paginated_comments, params=params)
+        return result
+
+    @staticmethod
+    async def update_comment(*, params: UpdateCommentParams) -> Comment:
+        result = await BlockingCallExecutor.run(CommentService.update_comment, params=params)
+        return result
+
+    @staticmethod
+    async def delete_comment(*, params: DeleteCommentParams) -> CommentDeletionResult:
+        result = await BlockingCallExecutor.run(CommentService.delete_comment, params=params)
+        return result
+
+    @staticmethod
+    async def bulk_write(*, params: BulkWriteCommentsParams) -> BulkWriteCommentsResult:
+        result = await BlockingCallExecutor.run(CommentService.bulk_write, params=params)
+        return result
@@ -0,0 +1,93 @@
+import itertools
+import threading
+from typing import AsyncIterator, Generator
+
+from modules.application.common.blocking_call_executor import BlockingCallExecutor
+from modules.application.common.types import PaginationResult
+from modules.task.internal.task_reader import TaskReader
+from modules.task.task_service import TaskService
+from modules.task.types import (
+    BulkWriteTasksParams,
+    BulkWriteTasksResult,
+    CreateTaskParams,
+    DeleteTaskParams,
+    ExportTasksParams,
+    GetPaginatedTasksParams,
+    GetTaskParams,
+    Task,
+    TaskDeletionResult,
+    TaskExport,
+    UpdateTaskParams,
+)
+
+
+class AsyncTaskService:
+    """
+    TaskService for the async (ASGI) app. Each call runs the sync service on the BlockingCallExecutor, so caching,
+    invalidation and cascades stay in one place and a request takes a single thread hop rather than one per query.
+    """
+
+    @staticmethod
+    async def create_task(*, params: CreateTaskParams) -> Task:
+        result = await BlockingCallExecutor.run(TaskService.create_task, params=params)
+        return result
+
+    @staticmethod
+    async def get_task(*, params: GetTaskParams) -> Task:
+        result = await BlockingCallExecutor.run(TaskService.get_task, params=params)
+        return result
+
+    @staticmethod
+    async def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
+        result = await BlockingCallExecutor.run(TaskService.get_paginated_tasks, params=params)
+        return result
+
+    @staticmethod
+    async def export_tasks(*, params: ExportTasksParams) -> AsyncIterator[TaskExport]:
+        # Called while the request is open, since the export session follows on from the request's session
+        task_exports = await BlockingCallExecutor.run(TaskService.export_tasks, params=params)
+        result = AsyncTaskService._iterate_in_batches(task_exports)
+        return result
+
+    @staticmethod
+    async def _iterate_in_batches(task_exports: Generator[TaskExport, None, None]) -> AsyncIterator[TaskExport]:
+        # A cancelled stream leaves its last batch running on the executor, and a generator cannot be closed while it
+        # runs, so the close waits for it
+        task_exports_lock = threading.Lock()
+
+        def next_batch() -> list[TaskExport]:
+            with task_exports_lock:
+                return list(itertools.islice(task_exports, TaskReader.EXPORT_BATCH_SIZE))
+
+        def close() -> None:
+            with task_exports_lock:
+                task_exports.close()
+
+        # Advance the cursor a fetched batch at a time, so there is one thread hop per batch rather than per task
+        try:
+            while True:
+                task_exports_batch = await BlockingCallExecutor.run(next_batch)
+                if not task_exports_batch:
+                    return
+
+                for task_export in task_exports_batch:
+                    yield task_export
+
+        finally:
+            # A cancelled stream never exhausts the export, so close it to end its cursor and session
+            await BlockingCallExecutor.run(close)
+
+    @staticmethod
+    async def update_task(*, params: UpdateTaskParams) -> Task:
+        result = await BlockingCallExecutor.run(TaskService.update_task, params=params)
+        return result
+
+    @staticmethod
+    async def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
+        result = await BlockingCallExecutor.run(TaskService.delete_task, params=params)
+        return result
+
+    @staticmethod
+    async def bulk_write(*, params: BulkWriteTasksParams) -> BulkWriteTasksResult:
+        result = await BlockingCallExecutor.run(TaskService.bulk_write, params=params)
+        return result
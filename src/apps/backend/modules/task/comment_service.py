@@ -1,5 +1,13 @@
+from typing import Sequence
+
 from modules.application.common.types import PaginationResult
 from modules.task.comment_types import (
+    BulkCommentOperationResult,
+    BulkCreateCommentsParams,
+    BulkDeleteCommentsParams,
+    BulkUpdateCommentsParams,
+    BulkWriteCommentsParams,
+    BulkWriteCommentsResult,
     Comment,
     CommentDeletionResult,
     CreateCommentParams,
@@ -44,3 +52,41 @@ class CommentService:
         TaskReader.get_task(params=GetTaskParams(account_id=params.account_id, task_id=params.task_id))
         result = CommentWriter.delete_comment(params=params)
         return result
+
+    @staticmethod
+    def bulk_write(*, params: BulkWriteCommentsParams) -> BulkWriteCommentsResult:
+        CommentService._ensure_tasks_exist([*params.create.comments, *params.update.comments, *params.delete.comments])
+        result = CommentWriter.bulk_write_comments(params=params)
+        return result
+
+    @staticmethod
+    def bulk_create(*, params: BulkCreateCommentsParams) -> list[BulkCommentOperationResult]:
+        bulk_write_params = BulkWriteCommentsParams(
+            create=params, update=BulkUpdateCommentsParams(comments=[]), delete=BulkDeleteCommentsParams(comments=[])
+        )
+        result = CommentService.bulk_write(params=bulk_write_params).create
+        return result
+
+    @staticmethod
+    def bulk_update(*, params: BulkUpdateCommentsParams) -> list[BulkCommentOperationResult]:
+        bulk_write_params = BulkWriteCommentsParams(
+            create=BulkCreateCommentsParams(comments=[]), update=params, delete=BulkDeleteCommentsParams(comments=[])
+        )
+        result = CommentService.bulk_write(params=bulk_write_params).update
+        return result
+
+    @staticmethod
+    def bulk_delete(*, params: BulkDeleteCommentsParams) -> list[BulkCommentOperationResult]:
+        bulk_write_params = BulkWriteCommentsParams(
+            create=BulkCreateCommentsParams(comments=[]), update=BulkUpdateCommentsParams(comments=[]), delete=params
+        )
+        result = CommentService.bulk_write(params=bulk_write_params).delete
+        return result
+
+    @staticmethod
+    def _ensure_tasks_exist(
+        comments: Sequence[CreateCommentParams | UpdateCommentParams | DeleteCommentParams],
+    ) -> None:
+        # Batches usually target a single task, so this is one lookup per distinct task rather than per item
+        for account_id, task_id in {(comment.account_id, comment.task_id) for comment in comments}:
+            TaskReader.get_task(params=GetTaskParams(account_id=account_id, task_id=task_id))
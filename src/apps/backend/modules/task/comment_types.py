@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from modules.application.common.types import PaginationParams, SortParams
+from modules.application.common.types import CountMode, PaginationParams, SortParams
 
 
 @dataclass(frozen=True)
@@ -13,6 +13,18 @@ class Comment:
     content: str
 
 
+@dataclass(frozen=True)
+class CommentStats:
+    count: int
+    latest_comment: Optional[Comment] = None
+
+
+@dataclass(frozen=True)
+class GetCommentStatsParams:
+    account_id: str
+    task_ids: list[str]
+
+
 @dataclass(frozen=True)
 class GetCommentParams:
     account_id: str
@@ -26,6 +38,7 @@ class GetPaginatedCommentsParams:
     task_id: str
     pagination_params: PaginationParams
     sort_params: Optional[SortParams] = None
+    count_mode: CountMode = CountMode.EXACT
 
 
 @dataclass(frozen=True)
@@ -57,7 +70,47 @@ class CommentDeletionResult:
     success: bool
 
 
+@dataclass(frozen=True)
+class BulkCreateCommentsParams:
+    comments: list[CreateCommentParams]
+
+
+@dataclass(frozen=True)
+class BulkUpdateCommentsParams:
+    comments: list[UpdateCommentParams]
+
+
+@dataclass(frozen=True)
+class BulkDeleteCommentsParams:
+    comments: list[DeleteCommentParams]
+
+
+@dataclass(frozen=True)
+class BulkWriteCommentsParams:
+    create: BulkCreateCommentsParams
+    update: BulkUpdateCommentsParams
+    delete: BulkDeleteCommentsParams
+
+
+@dataclass(frozen=True)
+class BulkCommentOperationResult:
+    index: int
+    success: bool
+    comment_id: Optional[str] = None
+    comment: Optional[Comment] = None
+    error_code: Optional[str] = None
+    message: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BulkWriteCommentsResult:
+    create: list[BulkCommentOperationResult]
+    update: list[BulkCommentOperationResult]
+    delete: list[BulkCommentOperationResult]
+
+
 @dataclass(frozen=True)
 class CommentErrorCode:
     NOT_FOUND: str = "COMMENT_ERR_01"
     BAD_REQUEST: str = "COMMENT_ERR_02"
+    WRITE_FAILED: str = "COMMENT_ERR_03"
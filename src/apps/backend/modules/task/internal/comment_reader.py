@@ -3,7 +3,13 @@ from bson.objectid import ObjectId
 from modules.application.common.base_model import BaseModel
 from modules.application.common.types import PaginationResult
 from modules.task.errors import CommentNotFoundError
-from modules.task.comment_types import Comment, GetCommentParams, GetPaginatedCommentsParams
+from modules.task.comment_types import (
+    Comment,
+    CommentStats,
+    GetCommentParams,
+    GetCommentStatsParams,
+    GetPaginatedCommentsParams,
+)
 from modules.task.internal.comment_util import CommentUtil
 from modules.task.internal.store.comment_repository import CommentRepository
 
@@ -27,11 +33,15 @@ class CommentReader:
     @staticmethod
     def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
         filter_query = {"account_id": params.account_id, "task_id": params.task_id, "active": True}
-        total_count = CommentRepository.collection().count_documents(filter_query)
+        total_count = CommentRepository.count_account_documents(
+            filter_query, account_id=params.account_id, key=params.task_id, count_mode=params.count_mode
+        )
         pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
             params.pagination_params, total_count
         )
-        cursor = CommentRepository.collection().find(filter_query)
+        cursor = CommentRepository.collection(read=CommentRepository.LIST_READ_PREFERENCE()).find(
+            filter_query, session=CommentRepository.get_causal_session()
+        )
 
         if params.sort_params:
             cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
@@ -43,3 +53,23 @@ class CommentReader:
         return PaginationResult(
             items=comments, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
         )
+
+    @staticmethod
+    def get_comment_stats(*, params: GetCommentStatsParams) -> dict[str, CommentStats]:
+        # One aggregation for the whole page instead of a count and a find per task
+        comment_stats_bson = CommentRepository.collection(read=CommentRepository.LIST_READ_PREFERENCE()).aggregate(
+            [
+                {"$match": {"active": True, "account_id": params.account_id, "task_id": {"$in": params.task_ids}}},
+                {"$sort": {"created_at": -1, "_id": -1}},
+                {"$group": {"_id": "$task_id", "count": {"$sum": 1}, "latest_comment": {"$first": "$$ROOT"}}},
+            ],
+            session=CommentRepository.get_causal_session(),
+        )
+
+        result = {task_id: CommentStats(count=0) for task_id in params.task_ids}
+        for task_comment_stats_bson in comment_stats_bson:
+            result[task_comment_stats_bson["_id"]] = CommentStats(
+                count=task_comment_stats_bson["count"],
+                latest_comment=CommentUtil.convert_comment_bson_to_comment(task_comment_stats_bson["latest_comment"]),
+            )
+        return result
@@ -1,18 +1,22 @@
 from datetime import datetime
+from typing import Any, Optional
 
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import InsertOne, ReturnDocument, UpdateOne
 
+from modules.application.common.types import BulkWriteItemOutcome
 from modules.task.errors import CommentNotFoundError
 from modules.task.comment_types import (
+    BulkCommentOperationResult,
+    BulkWriteCommentsParams,
+    BulkWriteCommentsResult,
     Comment,
     CommentDeletionResult,
+    CommentErrorCode,
     CreateCommentParams,
     DeleteCommentParams,
-    GetCommentParams,
     UpdateCommentParams,
 )
-from modules.task.internal.comment_reader import CommentReader
 from modules.task.internal.comment_util import CommentUtil
 from modules.task.internal.store.comment_model import CommentModel
 from modules.task.internal.store.comment_repository import CommentRepository
@@ -25,8 +29,8 @@ class CommentWriter:
             account_id=params.account_id, task_id=params.task_id, content=params.content
         ).to_bson()
 
-        query = CommentRepository.collection().insert_one(comment_bson)
-        created_comment_bson = CommentRepository.collection().find_one({"_id": query.inserted_id})
+        created_comment_bson = CommentRepository.insert_one_and_return(comment_bson)
+        CommentRepository.invalidate_account_counts(account_id=params.account_id)
 
         result = CommentUtil.convert_comment_bson_to_comment(created_comment_bson)
         return result
@@ -42,6 +46,7 @@ class CommentWriter:
             },
             {"$set": {"content": params.content, "updated_at": datetime.now()}},
             return_document=ReturnDocument.AFTER,
+            session=CommentRepository.get_causal_session(),
         )
 
         if updated_comment_bson is None:
@@ -52,21 +57,128 @@ class CommentWriter:
 
     @staticmethod
     def delete_comment(*, params: DeleteCommentParams) -> CommentDeletionResult:
-        comment = CommentReader.get_comment(
-            params=GetCommentParams(
-                account_id=params.account_id, task_id=params.task_id, comment_id=params.comment_id
-            )
-        )
-
         deletion_time = datetime.now()
-        updated_comment_bson = CommentRepository.collection().find_one_and_update(
-            {"_id": ObjectId(comment.id)},
+        delete_result = CommentRepository.collection().update_one(
+            {
+                "_id": ObjectId(params.comment_id),
+                "account_id": params.account_id,
+                "task_id": params.task_id,
+                "active": True,
+            },
             {"$set": {"active": False, "updated_at": deletion_time}},
-            return_document=ReturnDocument.AFTER,
+            session=CommentRepository.get_causal_session(),
         )
 
-        if updated_comment_bson is None:
+        if delete_result.matched_count == 0:
             raise CommentNotFoundError(comment_id=params.comment_id)
 
+        CommentRepository.invalidate_account_counts(account_id=params.account_id)
+
         result = CommentDeletionResult(comment_id=params.comment_id, deleted_at=deletion_time, success=True)
         return result
+
+    @staticmethod
+    def bulk_write_comments(*, params: BulkWriteCommentsParams) -> BulkWriteCommentsResult:
+        written_at = datetime.now()
+        comments_bson = [
+            CommentModel(
+                account_id=comment_params.account_id,
+                task_id=comment_params.task_id,
+                content=comment_params.content,
+                id=ObjectId(),
+                created_at=written_at,
+                updated_at=written_at,
+            ).to_bson()
+            for comment_params in params.create.comments
+        ]
+
+        items: list[tuple[dict[str, Any], Any]] = [
+            (
+                {
+                    "_id": comment_bson["_id"],
+                    "account_id": comment_bson["account_id"],
+                    "task_id": comment_bson["task_id"],
+                },
+                InsertOne(comment_bson),
+            )
+            for comment_bson in comments_bson
+        ]
+        for update_params in params.update.comments:
+            comment_key = {
+                "_id": ObjectId(update_params.comment_id),
+                "account_id": update_params.account_id,
+                "task_id": update_params.task_id,
+            }
+            update = {"content": update_params.content, "updated_at": written_at}
+            items.append((comment_key, UpdateOne({**comment_key, "active": True}, {"$set": update})))
+        for delete_params in params.delete.comments:
+            comment_key = {
+                "_id": ObjectId(delete_params.comment_id),
+                "account_id": delete_params.account_id,
+                "task_id": delete_params.task_id,
+            }
+            delete = {"active": False, "updated_at": written_at}
+            items.append((comment_key, UpdateOne({**comment_key, "active": True}, {"$set": delete})))
+
+        outcomes = CommentRepository.bulk_write_items(items, written_at=written_at)
+        create_count = len(params.create.comments)
+        update_count = len(params.update.comments)
+        create_outcomes = outcomes[:create_count]
+        update_outcomes = outcomes[create_count : create_count + update_count]
+        delete_outcomes = outcomes[create_count + update_count :]
+
+        changed_account_ids = {comment_params.account_id for comment_params in params.create.comments} | {
+            comment_params.account_id for comment_params in params.delete.comments
+        }
+        for account_id in changed_account_ids:
+            CommentRepository.invalidate_account_counts(account_id=account_id)
+
+        result = BulkWriteCommentsResult(
+            create=[
+                CommentWriter._build_bulk_operation_result(
+                    index=index, comment_id=str(comment_bson["_id"]), outcome=outcome
+                )
+                for index, (comment_bson, outcome) in enumerate(zip(comments_bson, create_outcomes))
+            ],
+            update=[
+                CommentWriter._build_bulk_operation_result(
+                    index=index, comment_id=comment_params.comment_id, outcome=outcome
+                )
+                for index, (comment_params, outcome) in enumerate(zip(params.update.comments, update_outcomes))
+            ],
+            delete=[
+                CommentWriter._build_bulk_operation_result(
+                    index=index, comment_id=comment_params.comment_id, outcome=outcome, include_comment=False
+                )
+                for index, (comment_params, outcome) in enumerate(zip(params.delete.comments, delete_outcomes))
+            ],
+        )
+        return result
+
+    @staticmethod
+    def _build_bulk_operation_result(
+        *, index: int, comment_id: str, outcome: BulkWriteItemOutcome, include_comment: bool = True
+    ) -> BulkCommentOperationResult:
+        if outcome.write_error is not None:
+            result = BulkCommentOperationResult(
+                index=index,
+                success=False,
+                comment_id=comment_id,
+                error_code=CommentErrorCode.WRITE_FAILED,
+                message=outcome.write_error,
+            )
+            return result
+
+        if outcome.document is None:
+            result = BulkCommentOperationResult(
+                index=index,
+                success=False,
+                comment_id=comment_id,
+                error_code=CommentErrorCode.NOT_FOUND,
+                message=f"Comment with id {comment_id} not found.",
+            )
+            return result
+
+        comment = CommentUtil.convert_comment_bson_to_comment(outcome.document) if include_comment else None
+        result = BulkCommentOperationResult(index=index, success=True, comment_id=comment_id, comment=comment)
+        return result
@@ -1,8 +1,6 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
-from modules.logger.logger import Logger
 from modules.task.internal.store.comment_model import CommentModel
 
 COMMENT_VALIDATION_SCHEMA = {
@@ -24,26 +22,11 @@ COMMENT_VALIDATION_SCHEMA = {
 class CommentRepository(ApplicationRepository):
     collection_name = CommentModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index(
+    indexes = [
+        IndexModel(
             [("active", 1), ("account_id", 1), ("task_id", 1)],
             name="active_account_task_index",
             partialFilterExpression={"active": True},
         )
-
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": COMMENT_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:
-                collection.database.create_collection(cls.collection_name, validator=COMMENT_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection task_comments: {e.details}")
-        result = True
-        return result
+    ]
+    validator = COMMENT_VALIDATION_SCHEMA
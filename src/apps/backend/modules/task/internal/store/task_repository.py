@@ -1,9 +1,7 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
 from modules.task.internal.store.task_model import TaskModel
-from modules.logger.logger import Logger
 
 TASK_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -24,24 +22,14 @@ TASK_VALIDATION_SCHEMA = {
 class TaskRepository(ApplicationRepository):
     collection_name = TaskModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index(
+    indexes = [
+        IndexModel(
             [("active", 1), ("account_id", 1)], name="active_account_id_index", partialFilterExpression={"active": True}
-        )
-
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": TASK_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:
-                collection.database.create_collection(cls.collection_name, validator=TASK_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection tasks: {e.details}")
-        result = True
-        return result
+        ),
+        IndexModel(
+            [("account_id", 1), ("active", 1), ("created_at", -1), ("_id", -1)],
+            name="account_active_created_at_index",
+            partialFilterExpression={"active": True},
+        ),
+    ]
+    validator = TASK_VALIDATION_SCHEMA
@@ -1,14 +1,26 @@
+from dataclasses import replace
+from typing import Generator, Iterator, Optional
+
 from bson.objectid import ObjectId
+from pymongo.client_session import ClientSession
 
 from modules.application.common.base_model import BaseModel
-from modules.application.common.types import PaginationResult
-from modules.task.errors import TaskNotFoundError
+from modules.application.common.constants import DEFAULT_SORT_PARAMS
+from modules.application.common.types import CausalPosition, PaginationResult
+from modules.task.comment_types import Comment, GetCommentStatsParams
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError
+from modules.task.internal.comment_reader import CommentReader
+from modules.task.internal.comment_util import CommentUtil
+from modules.task.internal.store.comment_repository import CommentRepository
 from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.internal.task_util import TaskUtil
-from modules.task.types import GetPaginatedTasksParams, GetTaskParams, Task
+from modules.task.types import ExportTasksParams, GetPaginatedTasksParams, GetTaskParams, Task, TaskExport
 
 
 class TaskReader:
+    # Number of documents fetched per cursor round trip while exporting
+    EXPORT_BATCH_SIZE = 500
+
     @staticmethod
     def get_task(*, params: GetTaskParams) -> Task:
         task_bson = TaskRepository.collection().find_one(
@@ -22,19 +34,115 @@ class TaskReader:
     @staticmethod
     def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
         filter_query = {"account_id": params.account_id, "active": True}
-        total_count = TaskRepository.collection().count_documents(filter_query)
+        sort_params = params.sort_params or DEFAULT_SORT_PARAMS
+        total_count = TaskRepository.count_account_documents(
+            filter_query, account_id=params.account_id, key=TaskRepository.collection_name, count_mode=params.count_mode
+        )
         pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
             params.pagination_params, total_count
         )
-        cursor = TaskRepository.collection().find(filter_query)
 
-        if params.sort_params:
-            cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
-        else:
-            cursor = cursor.sort([("created_at", -1), ("_id", -1)])
+        find_query = filter_query
+        if params.after:
+            # Keyset mode: seek past the last seen document instead of skipping over preceding pages
+            try:
+                cursor_filter = BaseModel.build_cursor_filter(params.after, sort_params)
+            except ValueError:
+                raise TaskBadRequestError("Invalid pagination cursor")
+            find_query = {**filter_query, **cursor_filter}
+            skip = 0
+
+        cursor = TaskRepository.collection(read=TaskRepository.LIST_READ_PREFERENCE()).find(
+            find_query, session=TaskRepository.get_causal_session()
+        )
+        cursor = BaseModel.apply_sort_params(cursor, sort_params)
+
+        # Fetch one extra document to know whether a next page exists
+        tasks_bson = list(cursor.skip(skip).limit(pagination_params.size + 1))
+        has_next_page = len(tasks_bson) > pagination_params.size
+        tasks_bson = tasks_bson[: pagination_params.size]
+
+        next_cursor = None
+        if has_next_page:
+            next_cursor = BaseModel.encode_pagination_cursor(tasks_bson[-1], sort_params)
 
-        tasks_bson = list(cursor.skip(skip).limit(pagination_params.size))
         tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        if params.include_comment_stats and tasks:
+            comment_stats = CommentReader.get_comment_stats(
+                params=GetCommentStatsParams(account_id=params.account_id, task_ids=[task.id for task in tasks])
+            )
+            tasks = [replace(task, comment_stats=comment_stats[task.id]) for task in tasks]
+
         return PaginationResult(
-            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+            items=tasks,
+            pagination_params=pagination_params,
+            total_count=total_count,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def export_tasks(*, params: ExportTasksParams) -> Generator[TaskExport, None, None]:
+        # The export is streamed after the request's session has ended, so it gets a session of its own. Only the
+        # request's causal position is taken now, so the export still follows on from the request's writes, and the
+        # session is started inside the generator, whose finally ends it however the stream finishes
+        causal_position = TaskRepository.get_causal_position()
+        result = TaskReader._export_tasks(params=params, causal_position=causal_position)
+        return result
+
+    @staticmethod
+    def _export_tasks(
+        *, params: ExportTasksParams, causal_position: Optional[CausalPosition]
+    ) -> Generator[TaskExport, None, None]:
+        session = TaskRepository.start_detached_causal_session(causal_position=causal_position)
+        try:
+            cursor = TaskRepository.collection(read=TaskRepository.LIST_READ_PREFERENCE()).find(
+                {"account_id": params.account_id, "active": True}, session=session
+            )
+            cursor = BaseModel.apply_sort_params(cursor, DEFAULT_SORT_PARAMS).batch_size(TaskReader.EXPORT_BATCH_SIZE)
+
+            if not params.include_comments:
+                for task_bson in cursor:
+                    yield TaskExport(task=TaskUtil.convert_task_bson_to_task(task_bson))
+                return
+
+            # Comments are fetched with one query per batch of tasks, so memory is bounded by the batch size
+            tasks: list[Task] = []
+            for task_bson in cursor:
+                tasks.append(TaskUtil.convert_task_bson_to_task(task_bson))
+                if len(tasks) == TaskReader.EXPORT_BATCH_SIZE:
+                    yield from TaskReader._export_tasks_with_comments(
+                        account_id=params.account_id, tasks=tasks, session=session
+                    )
+                    tasks = []
+
+            if tasks:
+                yield from TaskReader._export_tasks_with_comments(
+                    account_id=params.account_id, tasks=tasks, session=session
+                )
+
+        finally:
+            if session is not None:
+                session.end_session()
+
+    @staticmethod
+    def _export_tasks_with_comments(
+        *, account_id: str, tasks: list[Task], session: Optional[ClientSession]
+    ) -> Generator[TaskExport, None, None]:
+        comments_by_task_id: dict[str, list[Comment]] = {task.id: [] for task in tasks}
+        comments_cursor = (
+            CommentRepository.collection(read=CommentRepository.LIST_READ_PREFERENCE())
+            .find(
+                {"account_id": account_id, "task_id": {"$in": list(comments_by_task_id)}, "active": True},
+                session=session,
+            )
+            .sort([("created_at", 1), ("_id", 1)])
+            .batch_size(TaskReader.EXPORT_BATCH_SIZE)
         )
+
+        for comment_bson in comments_cursor:
+            comment = CommentUtil.convert_comment_bson_to_comment(comment_bson)
+            comments_by_task_id[comment.task_id].append(comment)
+
+        for task in tasks:
+            yield TaskExport(task=task, comments=comments_by_task_id[task.id])
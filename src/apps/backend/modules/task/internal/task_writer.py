@@ -1,19 +1,24 @@
 from datetime import datetime
+from typing import Any, Optional
 
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import InsertOne, ReturnDocument, UpdateOne
 
+from modules.application.common.types import BulkWriteItemOutcome
 from modules.task.errors import TaskNotFoundError
+from modules.task.internal.store.comment_repository import CommentRepository
 from modules.task.internal.store.task_model import TaskModel
 from modules.task.internal.store.task_repository import TaskRepository
-from modules.task.internal.task_reader import TaskReader
 from modules.task.internal.task_util import TaskUtil
 from modules.task.types import (
+    BulkTaskOperationResult,
+    BulkWriteTasksParams,
+    BulkWriteTasksResult,
     CreateTaskParams,
     DeleteTaskParams,
-    GetTaskParams,
     Task,
     TaskDeletionResult,
+    TaskErrorCode,
     UpdateTaskParams,
 )
 
@@ -25,8 +30,8 @@ class TaskWriter:
             account_id=params.account_id, description=params.description, title=params.title
         ).to_bson()
 
-        query = TaskRepository.collection().insert_one(task_bson)
-        created_task_bson = TaskRepository.collection().find_one({"_id": query.inserted_id})
+        created_task_bson = TaskRepository.insert_one_and_return(task_bson)
+        TaskRepository.invalidate_account_counts(account_id=params.account_id)
 
         result = TaskUtil.convert_task_bson_to_task(created_task_bson)
         return result
@@ -37,6 +42,7 @@ class TaskWriter:
             {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
             {"$set": {"description": params.description, "title": params.title, "updated_at": datetime.now()}},
             return_document=ReturnDocument.AFTER,
+            session=TaskRepository.get_causal_session(),
         )
 
         if updated_task_bson is None:
@@ -47,17 +53,123 @@ class TaskWriter:
 
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
-        task = TaskReader.get_task(params=GetTaskParams(account_id=params.account_id, task_id=params.task_id))
-
         deletion_time = datetime.now()
-        updated_task_bson = TaskRepository.collection().find_one_and_update(
-            {"_id": ObjectId(task.id)},
+        delete_result = TaskRepository.collection().update_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
             {"$set": {"active": False, "updated_at": deletion_time}},
-            return_document=ReturnDocument.AFTER,
+            session=TaskRepository.get_causal_session(),
         )
 
-        if updated_task_bson is None:
+        if delete_result.matched_count == 0:
             raise TaskNotFoundError(task_id=params.task_id)
 
+        TaskRepository.invalidate_account_counts(account_id=params.account_id)
+
+        if params.cascade:
+            TaskWriter._delete_comments_of_tasks(
+                account_id=params.account_id, task_ids=[params.task_id], deletion_time=deletion_time
+            )
+
         result = TaskDeletionResult(task_id=params.task_id, deleted_at=deletion_time, success=True)
         return result
+
+    @staticmethod
+    def bulk_write_tasks(*, params: BulkWriteTasksParams) -> BulkWriteTasksResult:
+        written_at = datetime.now()
+        tasks_bson = [
+            TaskModel(
+                account_id=task_params.account_id,
+                description=task_params.description,
+                id=ObjectId(),
+                title=task_params.title,
+                created_at=written_at,
+                updated_at=written_at,
+            ).to_bson()
+            for task_params in params.create.tasks
+        ]
+
+        items: list[tuple[dict[str, Any], Any]] = [
+            ({"_id": task_bson["_id"], "account_id": task_bson["account_id"]}, InsertOne(task_bson))
+            for task_bson in tasks_bson
+        ]
+        for update_params in params.update.tasks:
+            task_key = {"_id": ObjectId(update_params.task_id), "account_id": update_params.account_id}
+            update = {"description": update_params.description, "title": update_params.title, "updated_at": written_at}
+            items.append((task_key, UpdateOne({**task_key, "active": True}, {"$set": update})))
+        for delete_params in params.delete.tasks:
+            task_key = {"_id": ObjectId(delete_params.task_id), "account_id": delete_params.account_id}
+            delete = {"active": False, "updated_at": written_at}
+            items.append((task_key, UpdateOne({**task_key, "active": True}, {"$set": delete})))
+
+        outcomes = TaskRepository.bulk_write_items(items, written_at=written_at)
+        create_outcomes = outcomes[: len(params.create.tasks)]
+        update_outcomes = outcomes[len(params.create.tasks) : len(params.create.tasks) + len(params.update.tasks)]
+        delete_outcomes = outcomes[len(params.create.tasks) + len(params.update.tasks) :]
+
+        changed_account_ids = {task_params.account_id for task_params in params.create.tasks} | {
+            task_params.account_id for task_params in params.delete.tasks
+        }
+        for account_id in changed_account_ids:
+            TaskRepository.invalidate_account_counts(account_id=account_id)
+
+        cascade_task_ids_by_account_id: dict[str, list[str]] = {}
+        for delete_params, outcome in zip(params.delete.tasks, delete_outcomes):
+            if delete_params.cascade and outcome.document is not None:
+                cascade_task_ids_by_account_id.setdefault(delete_params.account_id, []).append(delete_params.task_id)
+        for account_id, task_ids in cascade_task_ids_by_account_id.items():
+            TaskWriter._delete_comments_of_tasks(account_id=account_id, task_ids=task_ids, deletion_time=written_at)
+
+        result = BulkWriteTasksResult(
+            create=[
+                TaskWriter._build_bulk_operation_result(index=index, task_id=str(task_bson["_id"]), outcome=outcome)
+                for index, (task_bson, outcome) in enumerate(zip(tasks_bson, create_outcomes))
+            ],
+            update=[
+                TaskWriter._build_bulk_operation_result(index=index, task_id=task_params.task_id, outcome=outcome)
+                for index, (task_params, outcome) in enumerate(zip(params.update.tasks, update_outcomes))
+            ],
+            delete=[
+                TaskWriter._build_bulk_operation_result(
+                    index=index, task_id=task_params.task_id, outcome=outcome, include_task=False
+                )
+                for index, (task_params, outcome) in enumerate(zip(params.delete.tasks, delete_outcomes))
+            ],
+        )
+        return result
+
+    @staticmethod
+    def _delete_comments_of_tasks(*, account_id: str, task_ids: list[str], deletion_time: datetime) -> None:
+        CommentRepository.collection().update_many(
+            {"account_id": account_id, "task_id": {"$in": task_ids}, "active": True},
+            {"$set": {"active": False, "updated_at": deletion_time}},
+            session=CommentRepository.get_causal_session(),
+        )
+        CommentRepository.invalidate_account_counts(account_id=account_id)
+
+    @staticmethod
+    def _build_bulk_operation_result(
+        *, index: int, task_id: str, outcome: BulkWriteItemOutcome, include_task: bool = True
+    ) -> BulkTaskOperationResult:
+        if outcome.write_error is not None:
+            result = BulkTaskOperationResult(
+                index=index,
+                success=False,
+                task_id=task_id,
+                error_code=TaskErrorCode.WRITE_FAILED,
+                message=outcome.write_error,
+            )
+            return result
+
+        if outcome.document is None:
+            result = BulkTaskOperationResult(
+                index=index,
+                success=False,
+                task_id=task_id,
+                error_code=TaskErrorCode.NOT_FOUND,
+                message=f"Task with id {task_id} not found.",
+            )
+            return result
+
+        task = TaskUtil.convert_task_bson_to_task(outcome.document) if include_task else None
+        result = BulkTaskOperationResult(index=index, success=True, task_id=task_id, task=task)
+        return result
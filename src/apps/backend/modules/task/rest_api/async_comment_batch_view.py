@@ -0,0 +1,30 @@
+from dataclasses import asdict
+
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.task.async_comment_service import AsyncCommentService
+from modules.task.rest_api.comment_request_parser import CommentRequestParser
+
+
+class AsyncCommentBatchView(MethodView):
+    @async_access_auth_middleware
+    async def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        params = CommentRequestParser.parse_batch_params(
+            account_id=account_id, task_id=task_id, request_data=await request.get_json()
+        )
+
+        bulk_write_result = await AsyncCommentService.bulk_write(params=params)
+
+        response_data = {}
+        if params.create.comments:
+            response_data["create"] = [asdict(create_result) for create_result in bulk_write_result.create]
+        if params.update.comments:
+            response_data["update"] = [asdict(update_result) for update_result in bulk_write_result.update]
+        if params.delete.comments:
+            response_data["delete"] = [asdict(delete_result) for delete_result in bulk_write_result.delete]
+
+        result = jsonify(response_data), 200
+        return result
@@ -0,0 +1,66 @@
+from dataclasses import asdict
+from typing import Optional
+
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.task.async_comment_service import AsyncCommentService
+from modules.task.comment_types import DeleteCommentParams, GetCommentParams
+from modules.task.rest_api.comment_request_parser import CommentRequestParser
+
+
+class AsyncCommentView(MethodView):
+    @async_access_auth_middleware
+    async def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        create_comment_params = CommentRequestParser.parse_create_comment_params(
+            account_id=account_id, task_id=task_id, request_data=await request.get_json()
+        )
+
+        created_comment = await AsyncCommentService.create_comment(params=create_comment_params)
+        comment_dict = asdict(created_comment)
+
+        result = jsonify(comment_dict), 201
+        return result
+
+    @async_access_auth_middleware
+    async def get(self, account_id: str, task_id: str, comment_id: Optional[str] = None) -> ResponseReturnValue:
+        if comment_id:
+            comment_params = GetCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
+            comment = await AsyncCommentService.get_comment(params=comment_params)
+            comment_dict = asdict(comment)
+            result = jsonify(comment_dict), 200
+            return result
+        else:
+            comments_params = CommentRequestParser.parse_get_paginated_comments_params(
+                account_id=account_id, task_id=task_id, args=request.args
+            )
+
+            pagination_result = await AsyncCommentService.get_paginated_comments(params=comments_params)
+
+            response_data = asdict(pagination_result)
+
+            result = jsonify(response_data), 200
+            return result
+
+    @async_access_auth_middleware
+    async def patch(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
+        update_comment_params = CommentRequestParser.parse_update_comment_params(
+            account_id=account_id, task_id=task_id, comment_id=comment_id, request_data=await request.get_json()
+        )
+
+        updated_comment = await AsyncCommentService.update_comment(params=update_comment_params)
+        comment_dict = asdict(updated_comment)
+
+        result = jsonify(comment_dict), 200
+        return result
+
+    @async_access_auth_middleware
+    async def delete(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
+        delete_params = DeleteCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
+
+        await AsyncCommentService.delete_comment(params=delete_params)
+
+        result = "", 204
+        return result
@@ -0,0 +1,33 @@
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.task.async_task_service import AsyncTaskService
+from modules.task.rest_api.task_request_parser import TaskRequestParser
+from modules.task.rest_api.task_serializer import TaskSerializer
+
+
+class AsyncTaskBatchView(MethodView):
+    @async_access_auth_middleware
+    async def post(self, account_id: str) -> ResponseReturnValue:
+        params = TaskRequestParser.parse_batch_params(account_id=account_id, request_data=await request.get_json())
+
+        bulk_write_result = await AsyncTaskService.bulk_write(params=params)
+
+        response_data = {}
+        if params.create.tasks:
+            response_data["create"] = [
+                TaskSerializer.to_dict(create_result) for create_result in bulk_write_result.create
+            ]
+        if params.update.tasks:
+            response_data["update"] = [
+                TaskSerializer.to_dict(update_result) for update_result in bulk_write_result.update
+            ]
+        if params.delete.tasks:
+            response_data["delete"] = [
+                TaskSerializer.to_dict(delete_result) for delete_result in bulk_write_result.delete
+            ]
+
+        result = jsonify(response_data), 200
+        return result
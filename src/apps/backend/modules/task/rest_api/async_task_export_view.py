@@ -0,0 +1,25 @@
+from typing import AsyncIterator
+
+from quart import Response, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.task.async_task_service import AsyncTaskService
+from modules.task.rest_api.task_export_view import TaskExportView
+from modules.task.rest_api.task_request_parser import TaskRequestParser
+
+
+class AsyncTaskExportView(MethodView):
+    @async_access_auth_middleware
+    async def get(self, account_id: str) -> ResponseReturnValue:
+        export_params = TaskRequestParser.parse_export_tasks_params(account_id=account_id, args=request.args)
+
+        task_exports = await AsyncTaskService.export_tasks(params=export_params)
+
+        async def generate() -> AsyncIterator[str]:
+            async for task_export in task_exports:
+                yield TaskExportView.serialize_task_export(task_export)
+
+        result = Response(generate(), status=200, mimetype="application/x-ndjson")  # type: ignore[type-var]
+        return result
@@ -0,0 +1,45 @@
+from quart import Blueprint
+
+from modules.task.rest_api.async_comment_batch_view import AsyncCommentBatchView
+from modules.task.rest_api.async_comment_view import AsyncCommentView
+from modules.task.rest_api.async_task_batch_view import AsyncTaskBatchView
+from modules.task.rest_api.async_task_export_view import AsyncTaskExportView
+from modules.task.rest_api.async_task_view import AsyncTaskView
+from modules.task.rest_api.task_router import TaskRouter
+
+
+class AsyncTaskRouter:
+    """Registers the async views under the URLs and endpoint names of TaskRouter"""
+
+    @staticmethod
+    def create_route(*, blueprint: Blueprint) -> Blueprint:
+        blueprint.add_url_rule(
+            TaskRouter.TASKS_URL, view_func=AsyncTaskView.as_view("task_view"), methods=["POST", "GET"]
+        )
+        blueprint.add_url_rule(
+            TaskRouter.TASKS_BATCH_URL, view_func=AsyncTaskBatchView.as_view("task_batch_view"), methods=["POST"]
+        )
+        blueprint.add_url_rule(
+            TaskRouter.TASKS_EXPORT_URL, view_func=AsyncTaskExportView.as_view("task_export_view"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            TaskRouter.TASK_BY_ID_URL,
+            view_func=AsyncTaskView.as_view("task_view_by_id"),
+            methods=["GET", "PATCH", "DELETE"],
+        )
+        blueprint.add_url_rule(
+            TaskRouter.COMMENTS_URL, view_func=AsyncCommentView.as_view("task_comment_view"), methods=["POST", "GET"]
+        )
+        blueprint.add_url_rule(
+            TaskRouter.COMMENTS_BATCH_URL,
+            view_func=AsyncCommentBatchView.as_view("task_comment_batch_view"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            TaskRouter.COMMENT_BY_ID_URL,
+            view_func=AsyncCommentView.as_view("task_comment_view_by_id"),
+            methods=["GET", "PATCH", "DELETE"],
+        )
+
+        result = blueprint
+        return result
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.task.async_task_service import AsyncTaskService
+from modules.task.rest_api.task_request_parser import TaskRequestParser
+from modules.task.rest_api.task_serializer import TaskSerializer
+from modules.task.types import DeleteTaskParams, GetTaskParams
+
+
+class AsyncTaskView(MethodView):
+    @async_access_auth_middleware
+    async def post(self, account_id: str) -> ResponseReturnValue:
+        create_task_params = TaskRequestParser.parse_create_task_params(
+            account_id=account_id, request_data=await request.get_json()
+        )
+
+        created_task = await AsyncTaskService.create_task(params=create_task_params)
+        task_dict = TaskSerializer.to_dict(created_task)
+
+        result = jsonify(task_dict), 201
+        return result
+
+    @async_access_auth_middleware
+    async def get(self, account_id: str, task_id: Optional[str] = None) -> ResponseReturnValue:
+        if task_id:
+            task_params = GetTaskParams(account_id=account_id, task_id=task_id)
+            task = await AsyncTaskService.get_task(params=task_params)
+            task_dict = TaskSerializer.to_dict(task)
+            result = jsonify(task_dict), 200
+            return result
+        else:
+            tasks_params = TaskRequestParser.parse_get_paginated_tasks_params(account_id=account_id, args=request.args)
+
+            pagination_result = await AsyncTaskService.get_paginated_tasks(params=tasks_params)
+
+            response_data = TaskSerializer.to_dict(pagination_result)
+
+            result = jsonify(response_data), 200
+            return result
+
+    @async_access_auth_middleware
+    async def patch(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        update_task_params = TaskRequestParser.parse_update_task_params(
+            account_id=account_id, task_id=task_id, request_data=await request.get_json()
+        )
+
+        updated_task = await AsyncTaskService.update_task(params=update_task_params)
+        task_dict = TaskSerializer.to_dict(updated_task)
+
+        result = jsonify(task_dict), 200
+        return result
+
+    @async_access_auth_middleware
+    async def delete(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        delete_params = DeleteTaskParams(account_id=account_id, task_id=task_id)
+
+        await AsyncTaskService.delete_task(params=delete_params)
+
+        result = "", 204
+        return result
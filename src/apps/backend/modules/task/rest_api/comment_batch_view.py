@@ -0,0 +1,30 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.comment_service import CommentService
+from modules.task.rest_api.comment_request_parser import CommentRequestParser
+
+
+class CommentBatchView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        params = CommentRequestParser.parse_batch_params(
+            account_id=account_id, task_id=task_id, request_data=request.get_json()
+        )
+
+        bulk_write_result = CommentService.bulk_write(params=params)
+
+        response_data = {}
+        if params.create.comments:
+            response_data["create"] = [asdict(create_result) for create_result in bulk_write_result.create]
+        if params.update.comments:
+            response_data["update"] = [asdict(update_result) for update_result in bulk_write_result.update]
+        if params.delete.comments:
+            response_data["delete"] = [asdict(delete_result) for delete_result in bulk_write_result.delete]
+
+        result = jsonify(response_data), 200
+        return result
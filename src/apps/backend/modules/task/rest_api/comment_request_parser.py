@@ -0,0 +1,143 @@
+from typing import Any, Optional
+
+from bson.objectid import ObjectId
+from werkzeug.datastructures import MultiDict
+
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS, MAX_BATCH_SIZE
+from modules.application.common.types import CountMode, PaginationParams
+from modules.task.comment_types import (
+    BulkCreateCommentsParams,
+    BulkDeleteCommentsParams,
+    BulkUpdateCommentsParams,
+    BulkWriteCommentsParams,
+    CreateCommentParams,
+    DeleteCommentParams,
+    GetPaginatedCommentsParams,
+    UpdateCommentParams,
+)
+from modules.task.errors import CommentBadRequestError
+
+
+class CommentRequestParser:
+    """Validates comment requests into service params, shared by the sync and the async views"""
+
+    @staticmethod
+    def parse_create_comment_params(
+        *, account_id: str, task_id: str, request_data: Optional[dict[str, Any]]
+    ) -> CreateCommentParams:
+        if request_data is None:
+            raise CommentBadRequestError("Request body is required")
+
+        if not request_data.get("content"):
+            raise CommentBadRequestError("Content is required")
+
+        result = CreateCommentParams(account_id=account_id, task_id=task_id, content=request_data["content"])
+        return result
+
+    @staticmethod
+    def parse_update_comment_params(
+        *, account_id: str, task_id: str, comment_id: str, request_data: Optional[dict[str, Any]]
+    ) -> UpdateCommentParams:
+        if request_data is None:
+            raise CommentBadRequestError("Request body is required")
+
+        if not request_data.get("content"):
+            raise CommentBadRequestError("Content is required")
+
+        result = UpdateCommentParams(
+            account_id=account_id, task_id=task_id, comment_id=comment_id, content=request_data["content"]
+        )
+        return result
+
+    @staticmethod
+    def parse_get_paginated_comments_params(
+        *, account_id: str, task_id: str, args: MultiDict
+    ) -> GetPaginatedCommentsParams:
+        page = args.get("page", type=int)
+        size = args.get("size", type=int)
+        count = args.get("count", CountMode.EXACT.value)
+
+        if page is not None and page < 1:
+            raise CommentBadRequestError("Page must be greater than 0")
+
+        if size is not None and size < 1:
+            raise CommentBadRequestError("Size must be greater than 0")
+
+        if page is None:
+            page = DEFAULT_PAGINATION_PARAMS.page
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        try:
+            count_mode = CountMode(count)
+        except ValueError:
+            raise CommentBadRequestError("Count must be one of exact, estimated or none")
+
+        pagination_params = PaginationParams(page=page, size=size, offset=0)
+        result = GetPaginatedCommentsParams(
+            account_id=account_id, task_id=task_id, pagination_params=pagination_params, count_mode=count_mode
+        )
+        return result
+
+    @staticmethod
+    def parse_batch_params(
+        *, account_id: str, task_id: str, request_data: Optional[dict[str, Any]]
+    ) -> BulkWriteCommentsParams:
+        if request_data is None:
+            raise CommentBadRequestError("Request body is required")
+
+        create_items = CommentRequestParser._get_items(request_data, "create")
+        update_items = CommentRequestParser._get_items(request_data, "update")
+        delete_items = CommentRequestParser._get_items(request_data, "delete")
+
+        if not create_items and not update_items and not delete_items:
+            raise CommentBadRequestError("At least one of create, update or delete is required")
+
+        if len(create_items) + len(update_items) + len(delete_items) > MAX_BATCH_SIZE:
+            raise CommentBadRequestError(f"Batch must not contain more than {MAX_BATCH_SIZE} items")
+
+        # Validate the whole payload before writing anything
+        create_comments_params = []
+        for index, item in enumerate(create_items):
+            if not item.get("content"):
+                raise CommentBadRequestError(f"Content is required for create item {index}")
+            create_comments_params.append(
+                CreateCommentParams(account_id=account_id, task_id=task_id, content=item["content"])
+            )
+
+        update_comments_params = []
+        for index, item in enumerate(update_items):
+            if not ObjectId.is_valid(item.get("id")):
+                raise CommentBadRequestError(f"Valid id is required for update item {index}")
+            if not item.get("content"):
+                raise CommentBadRequestError(f"Content is required for update item {index}")
+            update_comments_params.append(
+                UpdateCommentParams(
+                    account_id=account_id, task_id=task_id, comment_id=item["id"], content=item["content"]
+                )
+            )
+
+        delete_comments_params = []
+        for index, item in enumerate(delete_items):
+            if not ObjectId.is_valid(item.get("id")):
+                raise CommentBadRequestError(f"Valid id is required for delete item {index}")
+            delete_comments_params.append(
+                DeleteCommentParams(account_id=account_id, task_id=task_id, comment_id=item["id"])
+            )
+
+        result = BulkWriteCommentsParams(
+            create=BulkCreateCommentsParams(comments=create_comments_params),
+            update=BulkUpdateCommentsParams(comments=update_comments_params),
+            delete=BulkDeleteCommentsParams(comments=delete_comments_params),
+        )
+        return result
+
+    @staticmethod
+    def _get_items(request_data: dict[str, Any], key: str) -> list[dict[str, Any]]:
+        items = request_data.get(key, [])
+
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise CommentBadRequestError(f"{key.capitalize()} must be a list of objects")
+
+        result = items
+        return result
@@ -5,33 +5,17 @@ from flask import jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
-from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
-from modules.application.common.types import PaginationParams
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
-from modules.task.errors import CommentBadRequestError
 from modules.task.comment_service import CommentService
-from modules.task.comment_types import (
-    CreateCommentParams,
-    DeleteCommentParams,
-    GetCommentParams,
-    GetPaginatedCommentsParams,
-    UpdateCommentParams,
-)
+from modules.task.comment_types import DeleteCommentParams, GetCommentParams
+from modules.task.rest_api.comment_request_parser import CommentRequestParser
 
 
 class CommentView(MethodView):
     @access_auth_middleware
     def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise CommentBadRequestError("Request body is required")
-
-        if not request_data.get("content"):
-            raise CommentBadRequestError("Content is required")
-
-        create_comment_params = CreateCommentParams(
-            account_id=account_id, task_id=task_id, content=request_data["content"]
+        create_comment_params = CommentRequestParser.parse_create_comment_params(
+            account_id=account_id, task_id=task_id, request_data=request.get_json()
         )
 
         created_comment = CommentService.create_comment(params=create_comment_params)
@@ -49,23 +33,8 @@ class CommentView(MethodView):
             result = jsonify(comment_dict), 200
             return result
         else:
-            page = request.args.get("page", type=int)
-            size = request.args.get("size", type=int)
-
-            if page is not None and page < 1:
-                raise CommentBadRequestError("Page must be greater than 0")
-
-            if size is not None and size < 1:
-                raise CommentBadRequestError("Size must be greater than 0")
-
-            if page is None:
-                page = DEFAULT_PAGINATION_PARAMS.page
-            if size is None:
-                size = DEFAULT_PAGINATION_PARAMS.size
-
-            pagination_params = PaginationParams(page=page, size=size, offset=0)
-            comments_params = GetPaginatedCommentsParams(
-                account_id=account_id, task_id=task_id, pagination_params=pagination_params
+            comments_params = CommentRequestParser.parse_get_paginated_comments_params(
+                account_id=account_id, task_id=task_id, args=request.args
             )
 
             pagination_result = CommentService.get_paginated_comments(params=comments_params)
@@ -77,16 +46,8 @@ class CommentView(MethodView):
 
     @access_auth_middleware
     def patch(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise CommentBadRequestError("Request body is required")
-
-        if not request_data.get("content"):
-            raise CommentBadRequestError("Content is required")
-
-        update_comment_params = UpdateCommentParams(
-            account_id=account_id, task_id=task_id, comment_id=comment_id, content=request_data["content"]
+        update_comment_params = CommentRequestParser.parse_update_comment_params(
+            account_id=account_id, task_id=task_id, comment_id=comment_id, request_data=request.get_json()
         )
 
         updated_comment = CommentService.update_comment(params=update_comment_params)
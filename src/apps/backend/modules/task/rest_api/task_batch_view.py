@@ -0,0 +1,34 @@
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.rest_api.task_request_parser import TaskRequestParser
+from modules.task.rest_api.task_serializer import TaskSerializer
+from modules.task.task_service import TaskService
+
+
+class TaskBatchView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        params = TaskRequestParser.parse_batch_params(account_id=account_id, request_data=request.get_json())
+
+        # Creates, updates and deletes of the batch are written with a single bulk_write
+        bulk_write_result = TaskService.bulk_write(params=params)
+
+        response_data = {}
+        if params.create.tasks:
+            response_data["create"] = [
+                TaskSerializer.to_dict(create_result) for create_result in bulk_write_result.create
+            ]
+        if params.update.tasks:
+            response_data["update"] = [
+                TaskSerializer.to_dict(update_result) for update_result in bulk_write_result.update
+            ]
+        if params.delete.tasks:
+            response_data["delete"] = [
+                TaskSerializer.to_dict(delete_result) for delete_result in bulk_write_result.delete
+            ]
+
+        result = jsonify(response_data), 200
+        return result
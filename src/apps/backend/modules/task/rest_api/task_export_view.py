@@ -0,0 +1,38 @@
+import json
+from dataclasses import asdict
+from typing import Iterator
+
+from flask import Response, request, stream_with_context
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.rest_api.task_request_parser import TaskRequestParser
+from modules.task.rest_api.task_serializer import TaskSerializer
+from modules.task.task_service import TaskService
+from modules.task.types import TaskExport
+
+
+class TaskExportView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        export_params = TaskRequestParser.parse_export_tasks_params(account_id=account_id, args=request.args)
+
+        task_exports = TaskService.export_tasks(params=export_params)
+
+        def generate() -> Iterator[str]:
+            # One JSON document per line, serialized as the cursor advances so nothing is held beyond a batch
+            for task_export in task_exports:
+                yield TaskExportView.serialize_task_export(task_export)
+
+        result = Response(stream_with_context(generate()), status=200, mimetype="application/x-ndjson")
+        return result
+
+    @staticmethod
+    def serialize_task_export(task_export: TaskExport) -> str:
+        task_dict = TaskSerializer.to_dict(task_export.task)
+        if task_export.comments is not None:
+            task_dict["comments"] = [asdict(comment) for comment in task_export.comments]
+
+        result = json.dumps(task_dict) + "\n"
+        return result
@@ -0,0 +1,173 @@
+from typing import Any, Optional
+
+from bson.objectid import ObjectId
+from werkzeug.datastructures import MultiDict
+
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS, MAX_BATCH_SIZE
+from modules.application.common.types import CountMode, PaginationParams
+from modules.task.errors import TaskBadRequestError
+from modules.task.types import (
+    BulkCreateTasksParams,
+    BulkDeleteTasksParams,
+    BulkUpdateTasksParams,
+    BulkWriteTasksParams,
+    CreateTaskParams,
+    DeleteTaskParams,
+    ExportTasksParams,
+    GetPaginatedTasksParams,
+    UpdateTaskParams,
+)
+
+
+class TaskRequestParser:
+    """Validates task requests into service params, shared by the sync and the async views"""
+
+    @staticmethod
+    def parse_create_task_params(*, account_id: str, request_data: Optional[dict[str, Any]]) -> CreateTaskParams:
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        if not request_data.get("title"):
+            raise TaskBadRequestError("Title is required")
+
+        if not request_data.get("description"):
+            raise TaskBadRequestError("Description is required")
+
+        result = CreateTaskParams(
+            account_id=account_id, title=request_data["title"], description=request_data["description"]
+        )
+        return result
+
+    @staticmethod
+    def parse_update_task_params(
+        *, account_id: str, task_id: str, request_data: Optional[dict[str, Any]]
+    ) -> UpdateTaskParams:
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        if not request_data.get("title"):
+            raise TaskBadRequestError("Title is required")
+
+        if not request_data.get("description"):
+            raise TaskBadRequestError("Description is required")
+
+        result = UpdateTaskParams(
+            account_id=account_id, task_id=task_id, title=request_data["title"], description=request_data["description"]
+        )
+        return result
+
+    @staticmethod
+    def parse_get_paginated_tasks_params(*, account_id: str, args: MultiDict) -> GetPaginatedTasksParams:
+        page = args.get("page", type=int)
+        size = args.get("size", type=int)
+        after = args.get("after")
+        count = args.get("count", CountMode.EXACT.value)
+        include = args.get("include")
+
+        if page is not None and page < 1:
+            raise TaskBadRequestError("Page must be greater than 0")
+
+        if size is not None and size < 1:
+            raise TaskBadRequestError("Size must be greater than 0")
+
+        if page is None:
+            page = DEFAULT_PAGINATION_PARAMS.page
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        if after is not None and not after:
+            raise TaskBadRequestError("After cursor must not be empty")
+
+        if after is not None and "page" in args:
+            raise TaskBadRequestError("Page and after cursor cannot be used together")
+
+        try:
+            count_mode = CountMode(count)
+        except ValueError:
+            raise TaskBadRequestError("Count must be one of exact, estimated or none")
+
+        if include is not None and include != "comment_stats":
+            raise TaskBadRequestError("Include must be comment_stats")
+
+        pagination_params = PaginationParams(page=page, size=size, offset=0)
+        result = GetPaginatedTasksParams(
+            account_id=account_id,
+            pagination_params=pagination_params,
+            after=after,
+            count_mode=count_mode,
+            include_comment_stats=include == "comment_stats",
+        )
+        return result
+
+    @staticmethod
+    def parse_export_tasks_params(*, account_id: str, args: MultiDict) -> ExportTasksParams:
+        include = args.get("include")
+
+        if include is not None and include != "comments":
+            raise TaskBadRequestError("Include must be comments")
+
+        result = ExportTasksParams(account_id=account_id, include_comments=include == "comments")
+        return result
+
+    @staticmethod
+    def parse_batch_params(*, account_id: str, request_data: Optional[dict[str, Any]]) -> BulkWriteTasksParams:
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        create_items = TaskRequestParser._get_items(request_data, "create")
+        update_items = TaskRequestParser._get_items(request_data, "update")
+        delete_items = TaskRequestParser._get_items(request_data, "delete")
+
+        if not create_items and not update_items and not delete_items:
+            raise TaskBadRequestError("At least one of create, update or delete is required")
+
+        if len(create_items) + len(update_items) + len(delete_items) > MAX_BATCH_SIZE:
+            raise TaskBadRequestError(f"Batch must not contain more than {MAX_BATCH_SIZE} items")
+
+        # Validate the whole payload before writing anything
+        create_tasks_params = []
+        for index, item in enumerate(create_items):
+            if not item.get("title"):
+                raise TaskBadRequestError(f"Title is required for create item {index}")
+            if not item.get("description"):
+                raise TaskBadRequestError(f"Description is required for create item {index}")
+            create_tasks_params.append(
+                CreateTaskParams(account_id=account_id, title=item["title"], description=item["description"])
+            )
+
+        update_tasks_params = []
+        for index, item in enumerate(update_items):
+            if not ObjectId.is_valid(item.get("id")):
+                raise TaskBadRequestError(f"Valid id is required for update item {index}")
+            if not item.get("title"):
+                raise TaskBadRequestError(f"Title is required for update item {index}")
+            if not item.get("description"):
+                raise TaskBadRequestError(f"Description is required for update item {index}")
+            update_tasks_params.append(
+                UpdateTaskParams(
+                    account_id=account_id, task_id=item["id"], title=item["title"], description=item["description"]
+                )
+            )
+
+        delete_tasks_params = []
+        for index, item in enumerate(delete_items):
+            if not ObjectId.is_valid(item.get("id")):
+                raise TaskBadRequestError(f"Valid id is required for delete item {index}")
+            delete_tasks_params.append(DeleteTaskParams(account_id=account_id, task_id=item["id"]))
+
+        result = BulkWriteTasksParams(
+            create=BulkCreateTasksParams(tasks=create_tasks_params),
+            update=BulkUpdateTasksParams(tasks=update_tasks_params),
+            delete=BulkDeleteTasksParams(tasks=delete_tasks_params),
+        )
+        return result
+
+    @staticmethod
+    def _get_items(request_data: dict[str, Any], key: str) -> list[dict[str, Any]]:
+        items = request_data.get(key, [])
+
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise TaskBadRequestError(f"{key.capitalize()} must be a list of objects")
+
+        result = items
+        return result
@@ -1,5 +1,7 @@
+import quart
 from flask import Blueprint
 
+from modules.task.rest_api.async_task_router import AsyncTaskRouter
 from modules.task.rest_api.task_router import TaskRouter
 
 
@@ -9,3 +11,9 @@ class TaskRestApiServer:
         task_api_blueprint = Blueprint("task", __name__)
         result = TaskRouter.create_route(blueprint=task_api_blueprint)
         return result
+
+    @staticmethod
+    def create_async() -> quart.Blueprint:
+        task_api_blueprint = quart.Blueprint("task", __name__)
+        result = AsyncTaskRouter.create_route(blueprint=task_api_blueprint)
+        return result
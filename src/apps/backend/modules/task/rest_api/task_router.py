@@ -1,27 +1,43 @@
 from flask import Blueprint
 
+from modules.task.rest_api.comment_batch_view import CommentBatchView
 from modules.task.rest_api.comment_view import CommentView
+from modules.task.rest_api.task_batch_view import TaskBatchView
+from modules.task.rest_api.task_export_view import TaskExportView
 from modules.task.rest_api.task_view import TaskView
 
 
 class TaskRouter:
+    TASKS_URL = "/accounts/<account_id>/tasks"
+    TASKS_BATCH_URL = "/accounts/<account_id>/tasks:batch"
+    TASKS_EXPORT_URL = "/accounts/<account_id>/tasks:export"
+    TASK_BY_ID_URL = "/accounts/<account_id>/tasks/<task_id>"
+    COMMENTS_URL = "/accounts/<account_id>/tasks/<task_id>/comments"
+    COMMENTS_BATCH_URL = "/accounts/<account_id>/tasks/<task_id>/comments:batch"
+    COMMENT_BY_ID_URL = "/accounts/<account_id>/tasks/<task_id>/comments/<comment_id>"
+
     @staticmethod
     def create_route(*, blueprint: Blueprint) -> Blueprint:
+        blueprint.add_url_rule(TaskRouter.TASKS_URL, view_func=TaskView.as_view("task_view"), methods=["POST", "GET"])
         blueprint.add_url_rule(
-            "/accounts/<account_id>/tasks", view_func=TaskView.as_view("task_view"), methods=["POST", "GET"]
+            TaskRouter.TASKS_BATCH_URL, view_func=TaskBatchView.as_view("task_batch_view"), methods=["POST"]
         )
         blueprint.add_url_rule(
-            "/accounts/<account_id>/tasks/<task_id>",
-            view_func=TaskView.as_view("task_view_by_id"),
-            methods=["GET", "PATCH", "DELETE"],
+            TaskRouter.TASKS_EXPORT_URL, view_func=TaskExportView.as_view("task_export_view"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            TaskRouter.TASK_BY_ID_URL, view_func=TaskView.as_view("task_view_by_id"), methods=["GET", "PATCH", "DELETE"]
+        )
+        blueprint.add_url_rule(
+            TaskRouter.COMMENTS_URL, view_func=CommentView.as_view("task_comment_view"), methods=["POST", "GET"]
         )
         blueprint.add_url_rule(
-            "/accounts/<account_id>/tasks/<task_id>/comments",
-            view_func=CommentView.as_view("task_comment_view"),
-            methods=["POST", "GET"],
+            TaskRouter.COMMENTS_BATCH_URL,
+            view_func=CommentBatchView.as_view("task_comment_batch_view"),
+            methods=["POST"],
         )
         blueprint.add_url_rule(
-            "/accounts/<account_id>/tasks/<task_id>/comments/<comment_id>",
+            TaskRouter.COMMENT_BY_ID_URL,
             view_func=CommentView.as_view("task_comment_view_by_id"),
             methods=["GET", "PATCH", "DELETE"],
         )
@@ -0,0 +1,22 @@
+from dataclasses import asdict
+from typing import Any
+
+
+class TaskSerializer:
+    # Fields that are only computed when the request asks for them, left out of the payload otherwise
+    OPTIONAL_FIELDS = {"comment_stats"}
+
+    @staticmethod
+    def to_dict(value: Any) -> dict[str, Any]:
+        """
+        asdict() for a Task or any result holding tasks, without the optional fields that were not computed
+        """
+        result = asdict(value, dict_factory=TaskSerializer._build_dict)
+        return result
+
+    @staticmethod
+    def _build_dict(fields: list[tuple[str, Any]]) -> dict[str, Any]:
+        result = {
+            name: value for name, value in fields if not (name in TaskSerializer.OPTIONAL_FIELDS and value is None)
+        }
+        return result
@@ -1,44 +1,25 @@
-from dataclasses import asdict
 from typing import Optional
 
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
-from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
-from modules.application.common.types import PaginationParams
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
-from modules.task.errors import TaskBadRequestError
+from modules.task.rest_api.task_request_parser import TaskRequestParser
+from modules.task.rest_api.task_serializer import TaskSerializer
 from modules.task.task_service import TaskService
-from modules.task.types import (
-    CreateTaskParams,
-    DeleteTaskParams,
-    GetPaginatedTasksParams,
-    GetTaskParams,
-    UpdateTaskParams,
-)
+from modules.task.types import DeleteTaskParams, GetTaskParams
 
 
 class TaskView(MethodView):
     @access_auth_middleware
     def post(self, account_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise TaskBadRequestError("Request body is required")
-
-        if not request_data.get("title"):
-            raise TaskBadRequestError("Title is required")
-
-        if not request_data.get("description"):
-            raise TaskBadRequestError("Description is required")
-
-        create_task_params = CreateTaskParams(
-            account_id=account_id, title=request_data["title"], description=request_data["description"]
+        create_task_params = TaskRequestParser.parse_create_task_params(
+            account_id=account_id, request_data=request.get_json()
         )
 
         created_task = TaskService.create_task(params=create_task_params)
-        task_dict = asdict(created_task)
+        task_dict = TaskSerializer.to_dict(created_task)
 
         result = jsonify(task_dict), 201
         return result
@@ -48,53 +29,27 @@ class TaskView(MethodView):
         if task_id:
             task_params = GetTaskParams(account_id=account_id, task_id=task_id)
             task = TaskService.get_task(params=task_params)
-            task_dict = asdict(task)
+            task_dict = TaskSerializer.to_dict(task)
             result = jsonify(task_dict), 200
             return result
         else:
-            page = request.args.get("page", type=int)
-            size = request.args.get("size", type=int)
-
-            if page is not None and page < 1:
-                raise TaskBadRequestError("Page must be greater than 0")
-
-            if size is not None and size < 1:
-                raise TaskBadRequestError("Size must be greater than 0")
-
-            if page is None:
-                page = DEFAULT_PAGINATION_PARAMS.page
-            if size is None:
-                size = DEFAULT_PAGINATION_PARAMS.size
-
-            pagination_params = PaginationParams(page=page, size=size, offset=0)
-            tasks_params = GetPaginatedTasksParams(account_id=account_id, pagination_params=pagination_params)
+            tasks_params = TaskRequestParser.parse_get_paginated_tasks_params(account_id=account_id, args=request.args)
 
             pagination_result = TaskService.get_paginated_tasks(params=tasks_params)
 
-            response_data = asdict(pagination_result)
+            response_data = TaskSerializer.to_dict(pagination_result)
 
             result = jsonify(response_data), 200
             return result
 
     @access_auth_middleware
     def patch(self, account_id: str, task_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise TaskBadRequestError("Request body is required")
-
-        if not request_data.get("title"):
-            raise TaskBadRequestError("Title is required")
-
-        if not request_data.get("description"):
-            raise TaskBadRequestError("Description is required")
-
-        update_task_params = UpdateTaskParams(
-            account_id=account_id, task_id=task_id, title=request_data["title"], description=request_data["description"]
+        update_task_params = TaskRequestParser.parse_update_task_params(
+            account_id=account_id, task_id=task_id, request_data=request.get_json()
         )
 
         updated_task = TaskService.update_task(params=update_task_params)
-        task_dict = asdict(updated_task)
+        task_dict = TaskSerializer.to_dict(updated_task)
 
         result = jsonify(task_dict), 200
         return result
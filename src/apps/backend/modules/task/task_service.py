@@ -1,13 +1,23 @@
+from typing import Generator
+
 from modules.application.common.types import PaginationResult
 from modules.task.internal.task_reader import TaskReader
 from modules.task.internal.task_writer import TaskWriter
 from modules.task.types import (
+    BulkCreateTasksParams,
+    BulkDeleteTasksParams,
+    BulkTaskOperationResult,
+    BulkUpdateTasksParams,
+    BulkWriteTasksParams,
+    BulkWriteTasksResult,
     CreateTaskParams,
     DeleteTaskParams,
+    ExportTasksParams,
     GetPaginatedTasksParams,
     GetTaskParams,
     Task,
     TaskDeletionResult,
+    TaskExport,
     UpdateTaskParams,
 )
 
@@ -28,6 +38,11 @@ class TaskService:
         result = TaskReader.get_paginated_tasks(params=params)
         return result
 
+    @staticmethod
+    def export_tasks(*, params: ExportTasksParams) -> Generator[TaskExport, None, None]:
+        result = TaskReader.export_tasks(params=params)
+        return result
+
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
         result = TaskWriter.update_task(params=params)
@@ -37,3 +52,32 @@ class TaskService:
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
         result = TaskWriter.delete_task(params=params)
         return result
+
+    @staticmethod
+    def bulk_write(*, params: BulkWriteTasksParams) -> BulkWriteTasksResult:
+        result = TaskWriter.bulk_write_tasks(params=params)
+        return result
+
+    @staticmethod
+    def bulk_create(*, params: BulkCreateTasksParams) -> list[BulkTaskOperationResult]:
+        bulk_write_params = BulkWriteTasksParams(
+            create=params, update=BulkUpdateTasksParams(tasks=[]), delete=BulkDeleteTasksParams(tasks=[])
+        )
+        result = TaskWriter.bulk_write_tasks(params=bulk_write_params).create
+        return result
+
+    @staticmethod
+    def bulk_update(*, params: BulkUpdateTasksParams) -> list[BulkTaskOperationResult]:
+        bulk_write_params = BulkWriteTasksParams(
+            create=BulkCreateTasksParams(tasks=[]), update=params, delete=BulkDeleteTasksParams(tasks=[])
+        )
+        result = TaskWriter.bulk_write_tasks(params=bulk_write_params).update
+        return result
+
+    @staticmethod
+    def bulk_delete(*, params: BulkDeleteTasksParams) -> list[BulkTaskOperationResult]:
+        bulk_write_params = BulkWriteTasksParams(
+            create=BulkCreateTasksParams(tasks=[]), update=BulkUpdateTasksParams(tasks=[]), delete=params
+        )
+        result = TaskWriter.bulk_write_tasks(params=bulk_write_params).delete
+        return result
@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from modules.application.common.types import PaginationParams, PaginationResult, SortParams
+from modules.application.common.types import CountMode, PaginationParams, PaginationResult, SortParams
+from modules.task.comment_types import Comment, CommentStats
 
 
 @dataclass(frozen=True)
@@ -11,6 +12,7 @@ class Task:
     account_id: str
     description: str
     title: str
+    comment_stats: Optional[CommentStats] = None
 
 
 @dataclass(frozen=True)
@@ -24,6 +26,21 @@ class GetPaginatedTasksParams:
     account_id: str
     pagination_params: PaginationParams
     sort_params: Optional[SortParams] = None
+    after: Optional[str] = None
+    count_mode: CountMode = CountMode.EXACT
+    include_comment_stats: bool = False
+
+
+@dataclass(frozen=True)
+class ExportTasksParams:
+    account_id: str
+    include_comments: bool = False
+
+
+@dataclass(frozen=True)
+class TaskExport:
+    task: Task
+    comments: Optional[list[Comment]] = None
 
 
 @dataclass(frozen=True)
@@ -45,6 +62,7 @@ class UpdateTaskParams:
 class DeleteTaskParams:
     account_id: str
     task_id: str
+    cascade: bool = True
 
 
 @dataclass(frozen=True)
@@ -54,7 +72,47 @@ class TaskDeletionResult:
     success: bool
 
 
+@dataclass(frozen=True)
+class BulkCreateTasksParams:
+    tasks: list[CreateTaskParams]
+
+
+@dataclass(frozen=True)
+class BulkUpdateTasksParams:
+    tasks: list[UpdateTaskParams]
+
+
+@dataclass(frozen=True)
+class BulkDeleteTasksParams:
+    tasks: list[DeleteTaskParams]
+
+
+@dataclass(frozen=True)
+class BulkWriteTasksParams:
+    create: BulkCreateTasksParams
+    update: BulkUpdateTasksParams
+    delete: BulkDeleteTasksParams
+
+
+@dataclass(frozen=True)
+class BulkTaskOperationResult:
+    index: int
+    success: bool
+    task_id: Optional[str] = None
+    task: Optional[Task] = None
+    error_code: Optional[str] = None
+    message: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BulkWriteTasksResult:
+    create: list[BulkTaskOperationResult]
+    update: list[BulkTaskOperationResult]
+    delete: list[BulkTaskOperationResult]
+
+
 @dataclass(frozen=True)
 class TaskErrorCode:
     NOT_FOUND: str = "TASK_ERR_01"
     BAD_REQUEST: str = "TASK_ERR_02"
+    WRITE_FAILED: str = "TASK_ERR_03"
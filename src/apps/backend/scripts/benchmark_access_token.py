@@ -0,0 +1,31 @@
+import timeit
+
+from modules.account.types import Account
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
+
+ITERATIONS = 20000
+
+
+def run() -> None:
+    account = Account(
+        first_name="Benchmark", hashed_password="", id="0" * 24, last_name="User", phone_number=None, username=""
+    )
+    token = AccessTokenUtil.generate_access_token(account=account).token
+
+    def verify_cold() -> None:
+        AccessTokenUtil.VERIFIED_TOKEN_CACHE.clear()
+        AccessTokenUtil.verify_access_token(token=token)
+
+    def verify_warm() -> None:
+        AccessTokenUtil.verify_access_token(token=token)
+
+    verify_warm()
+    cold_seconds = timeit.timeit(verify_cold, number=ITERATIONS)
+    warm_seconds = timeit.timeit(verify_warm, number=ITERATIONS)
+
+    print(f"cold verification: {ITERATIONS / cold_seconds:,.0f} ops/s")
+    print(f"warm verification: {ITERATIONS / warm_seconds:,.0f} ops/s")
+    print(f"speedup: {cold_seconds / warm_seconds:.1f}x")
+
+
+run()
@@ -0,0 +1,41 @@
+import timeit
+from typing import Any, Callable, Dict, Optional
+
+from modules.config.config_service import ConfigService
+
+ITERATIONS = 200000
+KEY = "public.default_otp.enabled"
+
+
+def traverse_config(key: str) -> Optional[Any]:
+    # The lookup ConfigManager did before the flattened index: split the key and walk the nested sections
+    values: Any = ConfigService.config_manager.config_store
+    for k in key.split("."):
+        if not isinstance(values, dict) or k not in values:
+            return None
+
+        next_values = values[k]
+
+        if not isinstance(next_values, dict):
+            return next_values
+
+        values = next_values
+
+    return values
+
+
+def run() -> None:
+    is_default_otp_enabled = ConfigService[bool].get_accessor(KEY, default=False)
+
+    lookups: Dict[str, Callable[[], Any]] = {
+        "nested traversal": lambda: traverse_config(KEY),
+        "flattened index": lambda: ConfigService.config_manager.get(KEY),
+        "ConfigService[bool].get_value": lambda: ConfigService[bool].get_value(key=KEY, default=False),
+        "bound accessor": is_default_otp_enabled,
+    }
+    for name, lookup in lookups.items():
+        seconds = timeit.timeit(lookup, number=ITERATIONS)
+        print(f"{name}: {seconds / ITERATIONS * 1e9:,.0f} ns/lookup")
+
+
+run()
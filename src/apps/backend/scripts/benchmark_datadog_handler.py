@@ -0,0 +1,84 @@
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from datadog_api_client import ApiClient, Configuration
+from datadog_api_client.v2.api.logs_api import LogsApi
+from datadog_api_client.v2.models import HTTPLog, HTTPLogItem
+
+LOG_LINES = 100000
+SYNCHRONOUS_LOG_LINES = 1000
+
+
+class StubIntakeHandler(BaseHTTPRequestHandler):
+    requests_received = 0
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        StubIntakeHandler.requests_received += 1
+        self.send_response(202)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def submit_synchronously(host: str, message: str) -> None:
+    # What DatadogHandler.emit used to do for every record
+    config = Configuration(host=host)
+    config.api_key["apiKeyAuth"] = "benchmark"
+    with ApiClient(config) as api_client:
+        LogsApi(api_client).submit_log(
+            HTTPLog([HTTPLogItem(ddsource="flask", hostname="", message=message, service="benchmark", status="info")])
+        )
+
+
+def run() -> None:
+    # Only the stub intake server is contacted, so placeholder credentials are enough. They must be set before the
+    # config is loaded, hence the import below.
+    os.environ.setdefault("DATADOG_API_KEY", "benchmark")
+    os.environ.setdefault("DATADOG_SITE", "datadoghq.com")
+    os.environ.setdefault("DATADOG_APP_NAME", "benchmark")
+    from modules.logger.internal.datadog_handler import DatadogHandler
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubIntakeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    started_at = time.perf_counter()
+    for index in range(SYNCHRONOUS_LOG_LINES):
+        submit_synchronously(host, f"benchmark log line {index}")
+    synchronous_seconds = time.perf_counter() - started_at
+    print(f"synchronous submit: {SYNCHRONOUS_LOG_LINES / synchronous_seconds:,.0f} lines/s")
+
+    StubIntakeHandler.requests_received = 0
+    handler = DatadogHandler("flask", host=host)
+    logger = logging.getLogger("benchmark_datadog_handler")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    started_at = time.perf_counter()
+    for index in range(LOG_LINES):
+        logger.info(f"benchmark log line {index}")
+    emit_seconds = time.perf_counter() - started_at
+    handler.flush(timeout_in_seconds=60)
+    total_seconds = time.perf_counter() - started_at
+    handler.close()
+    server.shutdown()
+
+    stats = handler.get_stats()
+    print(f"queued emit: {LOG_LINES / emit_seconds:,.0f} lines/s on the logging thread")
+    print(
+        f"queued end to end: {LOG_LINES / total_seconds:,.0f} lines/s in {StubIntakeHandler.requests_received} requests"
+    )
+    print(f"sent: {stats.sent}, dropped: {stats.dropped}, failed: {stats.failed}")
+
+
+run()
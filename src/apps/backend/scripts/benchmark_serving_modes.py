@@ -0,0 +1,187 @@
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+
+import requests
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.authentication.authentication_service import AuthenticationService
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskParams
+
+# Both modes run one worker process, so requests per CPU-second is the throughput a core gives each mode
+SERVERS = {
+    "sync (gunicorn gthread)": [
+        "-m",
+        "gunicorn",
+        "-c",
+        "gunicorn_config.py",
+        "--workers",
+        "1",
+        "--bind",
+        "127.0.0.1:18080",
+        "server:app",
+    ],
+    "async (hypercorn asyncio)": [
+        "-m",
+        "hypercorn",
+        "-c",
+        "file:hypercorn_config.py",
+        "--workers",
+        "1",
+        "--bind",
+        "127.0.0.1:18081",
+        "asgi:application",
+    ],
+}
+SERVER_URLS = {
+    "sync (gunicorn gthread)": "http://127.0.0.1:18080",
+    "async (hypercorn asyncio)": "http://127.0.0.1:18081",
+}
+CONCURRENCY_LEVELS = [8, 64]
+DURATION_IN_SECONDS = 20
+SEED_TASKS = 50
+READ_RATIO = 0.8
+CLOCK_TICKS_PER_SECOND = os.sysconf("SC_CLK_TCK")
+
+
+@dataclass
+class LoadResult:
+    latencies_in_seconds: list[float] = field(default_factory=list)
+    errors: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def get_process_tree_cpu_seconds(root_pid: int) -> float:
+    # utime + stime of the server and every process it started, i.e. the master and its workers
+    cpu_ticks_by_pid: dict[int, int] = {}
+    children_by_pid: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat_file:
+                stat = stat_file.read()
+        except OSError:
+            continue
+        # The command name may contain spaces, so the fields are read after its closing parenthesis
+        fields = stat[stat.rindex(")") + 2 :].split()
+        pid = int(entry)
+        cpu_ticks_by_pid[pid] = int(fields[11]) + int(fields[12])
+        children_by_pid.setdefault(int(fields[1]), []).append(pid)
+
+    total_ticks = 0
+    pids = [root_pid]
+    while pids:
+        pid = pids.pop()
+        total_ticks += cpu_ticks_by_pid.get(pid, 0)
+        pids.extend(children_by_pid.get(pid, []))
+
+    result = total_ticks / CLOCK_TICKS_PER_SECOND
+    return result
+
+
+def wait_until_serving(url: str) -> None:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"{url}/api/", timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.5)
+
+    raise RuntimeError(f"server at {url} did not start")
+
+
+def run_client(url: str, account_id: str, token: str, task_ids: list[str], stop_at: float, result: LoadResult) -> None:
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    tasks_url = f"{url}/api/accounts/{account_id}/tasks"
+
+    while time.monotonic() < stop_at:
+        operation = random.random()
+        started_at = time.perf_counter()
+        if operation < READ_RATIO / 2:
+            response = session.get(tasks_url, params={"size": "10", "count": "estimated"})
+        elif operation < READ_RATIO:
+            response = session.get(f"{tasks_url}/{random.choice(task_ids)}")
+        elif operation < READ_RATIO + (1 - READ_RATIO) / 2:
+            response = session.post(tasks_url, json={"title": "Benchmark task", "description": "Created under load"})
+        else:
+            response = session.patch(
+                f"{tasks_url}/{random.choice(task_ids)}",
+                json={"title": "Benchmark task", "description": "Updated under load"},
+            )
+        latency_in_seconds = time.perf_counter() - started_at
+
+        with result.lock:
+            result.latencies_in_seconds.append(latency_in_seconds)
+            if response.status_code >= 400:
+                result.errors += 1
+
+
+def run_load(url: str, server_pid: int, concurrency: int, account_id: str, token: str, task_ids: list[str]) -> None:
+    result = LoadResult()
+    cpu_seconds_before = get_process_tree_cpu_seconds(server_pid)
+    started_at = time.monotonic()
+    stop_at = started_at + DURATION_IN_SECONDS
+
+    clients = [
+        threading.Thread(target=run_client, args=(url, account_id, token, task_ids, stop_at, result))
+        for _ in range(concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+
+    elapsed_seconds = time.monotonic() - started_at
+    cpu_seconds = get_process_tree_cpu_seconds(server_pid) - cpu_seconds_before
+    request_count = len(result.latencies_in_seconds)
+    latencies_in_ms = sorted(latency * 1000 for latency in result.latencies_in_seconds)
+
+    print(
+        f"  {concurrency} clients: {request_count / elapsed_seconds:,.0f} req/s, "
+        f"{request_count / cpu_seconds:,.0f} req per server CPU-second ({cpu_seconds:.1f} CPU-s), "
+        f"p50 {statistics.median(latencies_in_ms):.1f} ms, "
+        f"p99 {latencies_in_ms[int(len(latencies_in_ms) * 0.99)]:.1f} ms, "
+        f"{result.errors} errors"
+    )
+
+
+def run() -> None:
+    username = f"benchmark_{int(time.time())}@example.com"
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            first_name="Benchmark", last_name="User", password="benchmark", username=username
+        )
+    )
+    token = AuthenticationService.create_access_token_by_username_and_password(account=account).token
+    task_ids = [
+        TaskService.create_task(
+            params=CreateTaskParams(account_id=account.id, title=f"Task {index}", description="Seeded task")
+        ).id
+        for index in range(SEED_TASKS)
+    ]
+
+    for name, arguments in SERVERS.items():
+        server = subprocess.Popen([sys.executable, *arguments], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_until_serving(SERVER_URLS[name])
+            print(name)
+            for concurrency in CONCURRENCY_LEVELS:
+                run_load(SERVER_URLS[name], server.pid, concurrency, account.id, token, task_ids)
+        finally:
+            server.terminate()
+            server.wait()
+
+    AccountService.delete_account(account_id=account.id)
+
+
+run()
@@ -0,0 +1,55 @@
+import sys
+from dataclasses import asdict
+
+from dotenv import load_dotenv
+
+from database_config import DatabaseConfig
+from modules.application.repository import ApplicationRepositoryClient
+from modules.application.types import CollectionSchemaChanges
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+
+class SyncDatabaseSchema:
+    """
+    Applies the indexes and validators declared on the repositories in DatabaseConfig. Run it once per deploy, before
+    the app starts serving, with `npm run script --file=sync_database_schema`. Running it directly with --dry-run, e.g.
+    `PYTHONPATH=./ python scripts/sync_database_schema.py --dry-run`, only reports the changes.
+    """
+
+    def __init__(self, *, dry_run: bool = False) -> None:
+        self.dry_run = dry_run
+
+    def run(self) -> list[CollectionSchemaChanges]:
+        database = ApplicationRepositoryClient.get_client().get_database()
+        changes: list[CollectionSchemaChanges] = []
+
+        for repository in DatabaseConfig.REPOSITORIES:
+            collection_changes = repository.sync_schema(database[repository.collection_name], dry_run=self.dry_run)
+            changes.append(collection_changes)
+
+            if collection_changes.undeclared_indexes:
+                Logger.warn(
+                    message="collection {collection_name} has indexes that are not declared: {undeclared_indexes}",
+                    collection_name=collection_changes.collection_name,
+                    undeclared_indexes=collection_changes.undeclared_indexes,
+                )
+            if self.dry_run and collection_changes.has_changes:
+                Logger.info(message="collection {collection_name} is out of sync", **asdict(collection_changes))
+
+        changed_count = sum(1 for collection_changes in changes if collection_changes.has_changes)
+        Logger.info(
+            message="{changed_count} of {collection_count} collections {outcome}",
+            changed_count=changed_count,
+            collection_count=len(changes),
+            outcome="need changes" if self.dry_run else "were changed",
+        )
+
+        result = changes
+        return result
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    LoggerManager.mount_logger()
+    SyncDatabaseSchema(dry_run="--dry-run" in sys.argv).run()
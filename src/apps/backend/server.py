@@ -1,5 +1,7 @@
+from typing import Optional
+
 from dotenv import load_dotenv
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request
 from flask.typing import ResponseReturnValue
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
@@ -7,23 +9,29 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 from bin.blueprints import api_blueprint, img_assets_blueprint, react_blueprint
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.application.application_service import ApplicationService
+from modules.application.common.constants import CAUSAL_TOKEN_HEADER
 from modules.application.errors import AppError, WorkerClientConnectionError
 from modules.application.workers.health_check_worker import HealthCheckWorker
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
+from modules.notification.workers.notification_dispatch_worker import NotificationDispatchWorker
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from scripts.bootstrap_app import BootstrapApp
 
 load_dotenv()
 
 app = Flask(__name__)
-cors = CORS(app, resources={r"/*": {"origins": "http://localhost:3000"}})
+cors = CORS(app, resources={r"/*": {"origins": "http://localhost:3000"}}, expose_headers=[CAUSAL_TOKEN_HEADER])
 
 # Mount deps
 LoggerManager.mount_logger()
 
+# Reload config changes, e.g. rotated keys, without restarting the workers
+if ConfigService[bool].get_value(key="config_reload.enabled", default=False):
+    ConfigService.start_watching()
+
 # Run bootstrap tasks
 BootstrapApp().run()
 
@@ -35,6 +43,10 @@ try:
     # In production, it is optional to run this worker
     ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
 
+    # Redeliver outbox notifications whose immediate delivery could not be started or did not finish
+    if ConfigService[str].get_value(key="notification.dispatch_mode", default="sync") == "outbox":
+        ApplicationService.schedule_worker_as_cron(cls=NotificationDispatchWorker, cron_schedule="* * * * *")
+
 except WorkerClientConnectionError as e:
     Logger.critical(message=e.message)
 
@@ -65,6 +77,27 @@ app.register_blueprint(img_assets_blueprint)
 app.register_blueprint(react_blueprint)
 
 
+# Give each request a causally consistent session, so list reads served by secondaries see the client's own writes
+@app.before_request
+def start_causal_session_scope() -> None:
+    ApplicationService.start_causal_session_scope(causal_token=request.headers.get(CAUSAL_TOKEN_HEADER))
+
+
+@app.after_request
+def add_causal_token_header(response: Response) -> Response:
+    causal_token = ApplicationService.get_causal_token()
+    if causal_token is not None:
+        response.headers[CAUSAL_TOKEN_HEADER] = causal_token
+
+    result = response
+    return result
+
+
+@app.teardown_request
+def end_causal_session_scope(exc: Optional[BaseException]) -> None:
+    ApplicationService.end_causal_session_scope()
+
+
 @app.errorhandler(AppError)
 def handle_error(exc: AppError) -> ResponseReturnValue:
     result = jsonify({"message": exc.message, "code": exc.code}), exc.http_code or 500
@@ -4,10 +4,11 @@ from temporalio import activity, workflow
 
 from modules.application.types import BaseWorker, RegisteredWorker
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.notification.workers.notification_dispatch_worker import NotificationDispatchWorker
 
 
 class TemporalConfig:
-    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker, NotificationDispatchWorker]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
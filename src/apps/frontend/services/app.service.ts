@@ -1,5 +1,11 @@
 import axios, { AxiosInstance, CreateAxiosDefaults } from 'axios';
 
+const CAUSAL_TOKEN_HEADER = 'X-Causal-Token';
+
+// operation time of the latest response, sent back with every request so
+// reads served by a database secondary include this client's own writes
+let causalToken: string | undefined;
+
 export default class AppService {
   appHost: string;
 
@@ -10,6 +16,25 @@ export default class AppService {
   static getAxiosInstance(config?: CreateAxiosDefaults): AxiosInstance {
     // returns an axios instance which can be used by services
     // to make remote calls
-    return axios.create(config);
+    const instance = axios.create(config);
+
+    instance.interceptors.request.use((requestConfig) => {
+      if (causalToken) {
+        requestConfig.headers.set(CAUSAL_TOKEN_HEADER, causalToken);
+      }
+      return requestConfig;
+    });
+
+    instance.interceptors.response.use((response) => {
+      const responseCausalToken = response.headers[
+        CAUSAL_TOKEN_HEADER.toLowerCase()
+      ] as string | undefined;
+      if (responseCausalToken) {
+        causalToken = responseCausalToken;
+      }
+      return response;
+    });
+
+    return instance;
   }
 }
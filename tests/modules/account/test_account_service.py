@@ -8,6 +8,7 @@ from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundEr
 from modules.account.types import (
     AccountErrorCode,
     AccountSearchByIdParams,
+    AccountSearchParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
@@ -55,6 +56,57 @@ class TestAccountService(BaseTestAccount):
         except AccountNotFoundError as exc:
             assert exc.code == AccountErrorCode.NOT_FOUND
 
+    def test_get_account_by_id_is_read_once_per_request(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        stats_before = AccountService.get_account_cache_stats()
+
+        with app.test_request_context():
+            first_account = AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+            second_account = AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+
+        stats_after = AccountService.get_account_cache_stats()
+        assert first_account == second_account
+        assert stats_after.misses - stats_before.misses == 1
+        assert stats_after.hits - stats_before.hits == 1
+
+    def test_update_account_profile_invalidates_cached_account(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with app.test_request_context():
+            AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+            AccountService.update_account_profile(
+                account_id=account.id, params=UpdateAccountProfileParams(first_name="updated", last_name=None)
+            )
+            updated_account = AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+
+        assert updated_account.first_name == "updated"
+
+    def test_login_rehashes_password_when_cost_differs(self) -> None:
+        with patch("modules.application.common.password_hasher.PasswordHasher.get_rounds", return_value=4):
+            account = AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username="username"
+                )
+            )
+
+        logged_in_account = AccountService.get_account_by_username_and_password(
+            params=AccountSearchParams(username="username", password="password")
+        )
+
+        assert account.hashed_password.startswith("$2b$04$")
+        assert logged_in_account.hashed_password.startswith("$2b$10$")
+        assert AccountService.get_account_by_username_and_password(
+            params=AccountSearchParams(username="username", password="password")
+        )
+
     def test_get_or_create_account_by_phone_number(self) -> None:
         account = AccountService.get_or_create_account_by_phone_number(
             params=CreateAccountByPhoneNumberParams(
@@ -211,3 +211,26 @@ class TestNotificationPreferencesService(BaseTestAccount):
         assert preferences.email_enabled is True
         assert preferences.push_enabled is True
         assert preferences.sms_enabled is True
+
+    def test_get_notification_preferences_is_served_from_cache_and_invalidated_on_update(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+        hits_before = NotificationService.get_account_notification_preferences_cache_stats().hits
+
+        preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+
+        assert preferences.email_enabled is True
+        assert NotificationService.get_account_notification_preferences_cache_stats().hits == hits_before + 1
+
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=account.id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False)
+        )
+
+        preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+
+        assert preferences.email_enabled is False
+        assert preferences.sms_enabled is True
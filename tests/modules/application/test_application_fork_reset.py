@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+
+from modules.application.application_service import ApplicationService
+from modules.application.common.password_hasher import PasswordHasher
+from modules.application.internal.worker_manager import WorkerManager
+from modules.application.repository import ApplicationRepositoryClient
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestApplicationForkReset(BaseTestApplication):
+    def test_reset_after_fork_drops_inherited_clients(self) -> None:
+        ApplicationRepositoryClient._client = MagicMock()
+        TaskRepository._collection = MagicMock()
+        NotificationOutboxRepository._collection = MagicMock()
+        WorkerManager.CLIENT = MagicMock()
+        PasswordHasher._executor = MagicMock()
+        PasswordHasher._pending = 3
+
+        ApplicationService.reset_after_fork()
+
+        assert ApplicationRepositoryClient._client is None
+        assert TaskRepository._collection is None
+        assert NotificationOutboxRepository._collection is None
+        assert WorkerManager.CLIENT is None
+        assert WorkerManager.LOOP is None
+        assert PasswordHasher._executor is None
+        assert PasswordHasher._pending == 0
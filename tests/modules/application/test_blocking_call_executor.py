@@ -0,0 +1,55 @@
+import asyncio
+import contextvars
+import threading
+from typing import Callable
+
+import pytest
+
+from modules.application.common.blocking_call_executor import BlockingCallExecutor
+from tests.modules.application.base_test_application import BaseTestApplication
+
+REQUEST_ID: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class TestBlockingCallExecutor(BaseTestApplication):
+    def teardown_method(self, method: Callable) -> None:
+        if BlockingCallExecutor.EXECUTOR is not None:
+            BlockingCallExecutor.EXECUTOR.shutdown()
+        BlockingCallExecutor.reset_after_fork()
+        super().teardown_method(method)
+
+    def test_call_runs_off_the_event_loop_thread(self) -> None:
+        async def run() -> tuple[str, str]:
+            call_thread_name = await BlockingCallExecutor.run(lambda: threading.current_thread().name)
+            return threading.current_thread().name, call_thread_name
+
+        loop_thread_name, call_thread_name = asyncio.run(run())
+
+        assert call_thread_name != loop_thread_name
+        assert call_thread_name.startswith("blocking-call")
+
+    def test_call_sees_context_and_arguments_of_caller(self) -> None:
+        def get_request_id(*, suffix: str) -> str:
+            return REQUEST_ID.get() + suffix
+
+        async def run() -> str:
+            REQUEST_ID.set("request-1")
+            result = await BlockingCallExecutor.run(get_request_id, suffix="-call")
+            return result
+
+        assert asyncio.run(run()) == "request-1-call"
+
+    def test_call_error_is_raised_to_caller(self) -> None:
+        def fail() -> None:
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError):
+            asyncio.run(BlockingCallExecutor.run(fail))
+
+    def test_reset_after_fork_creates_new_executor(self) -> None:
+        executor = BlockingCallExecutor.get_executor()
+
+        BlockingCallExecutor.reset_after_fork()
+
+        assert BlockingCallExecutor.get_executor() is not executor
+        executor.shutdown()
@@ -0,0 +1,87 @@
+from typing import Callable
+
+from bson.timestamp import Timestamp
+from pymongo.read_preferences import ReadPreference
+
+from modules.application.repository import ApplicationRepository, ApplicationRepositoryClient
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class CausalSessionTestRepository(ApplicationRepository):
+    collection_name = "causal_session_test"
+
+
+class TestCausalSession(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        CausalSessionTestRepository.collection().delete_many({})
+
+    def teardown_method(self, method: Callable) -> None:
+        ApplicationRepository.end_causal_session_scope()
+        CausalSessionTestRepository.collection().delete_many({})
+        super().teardown_method(method)
+
+    @staticmethod
+    def is_replica_set() -> bool:
+        result = "setName" in ApplicationRepositoryClient.get_client().admin.command("hello")
+        return result
+
+    def test_list_read_preference_is_applied_to_collection(self) -> None:
+        collection = CausalSessionTestRepository.collection(read="secondaryPreferred")
+
+        assert collection.read_preference == ReadPreference.SECONDARY_PREFERRED
+        assert CausalSessionTestRepository.collection().read_preference == ReadPreference.PRIMARY
+
+    def test_no_session_outside_of_request(self) -> None:
+        assert ApplicationRepository.get_causal_session() is None
+        assert ApplicationRepository.get_causal_token() is None
+
+    def test_read_from_secondary_sees_write_of_same_request(self) -> None:
+        ApplicationRepository.start_causal_session_scope()
+        session = ApplicationRepository.get_causal_session()
+
+        CausalSessionTestRepository.collection().insert_one({"name": "written"}, session=session)
+        names = [
+            document["name"]
+            for document in CausalSessionTestRepository.collection(read="secondaryPreferred").find({}, session=session)
+        ]
+
+        assert names == ["written"]
+
+    def test_causal_token_is_carried_to_next_request(self) -> None:
+        ApplicationRepository.start_causal_session_scope()
+        CausalSessionTestRepository.insert_one_and_return({"name": "written"})
+        causal_token = ApplicationRepository.get_causal_token()
+        ApplicationRepository.end_causal_session_scope()
+
+        if not self.is_replica_set():
+            # A standalone server reports no operation time, so there is nothing to carry
+            assert causal_token is None
+            return
+
+        assert causal_token is not None
+        ApplicationRepository.start_causal_session_scope(causal_token=causal_token)
+        session = ApplicationRepository.get_causal_session()
+
+        assert session is not None
+        assert f"{session.operation_time.time}.{session.operation_time.inc}" == causal_token
+
+    def test_malformed_causal_token_is_ignored(self) -> None:
+        ApplicationRepository.start_causal_session_scope(causal_token="not-a-token")
+        session = ApplicationRepository.get_causal_session()
+
+        assert session is not None
+        assert session.operation_time is None
+
+    def test_detached_session_follows_request_session(self) -> None:
+        ApplicationRepository.start_causal_session_scope(causal_token="1700000000.1")
+        request_session = ApplicationRepository.get_causal_session()
+        causal_position = ApplicationRepository.get_causal_position()
+        ApplicationRepository.end_causal_session_scope()
+        detached_session = ApplicationRepository.start_detached_causal_session(causal_position=causal_position)
+
+        assert request_session is not None
+        assert detached_session is not None
+        assert detached_session is not request_session
+        assert detached_session.operation_time == Timestamp(1700000000, 1)
+        detached_session.end_session()
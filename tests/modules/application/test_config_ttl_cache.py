@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+from modules.application.common.config_ttl_cache import ConfigTTLCache
+from modules.config.config_service import ConfigService
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestConfigTTLCache(BaseTestApplication):
+    def test_disabled_cache_stores_nothing(self) -> None:
+        config_ttl_cache: ConfigTTLCache[str] = ConfigTTLCache(
+            config_key="test.disabled_cache", enabled_by_default=False, ttl_in_seconds=60
+        )
+        config_ttl_cache.set("a", "value")
+
+        assert config_ttl_cache.get_cache() is None
+        assert config_ttl_cache.get("a") is None
+
+    def test_reset_rebuilds_cache_from_config(self) -> None:
+        config_ttl_cache: ConfigTTLCache[str] = ConfigTTLCache(
+            config_key="test.enabled_cache", enabled_by_default=True, ttl_in_seconds=60
+        )
+        config_ttl_cache.set("a", "value")
+        assert config_ttl_cache.get("a") == "value"
+
+        get_value = ConfigService.get_value
+
+        def get_value_with_ttl(key, default=None):
+            if key == "test.enabled_cache.ttl_in_seconds":
+                return 5
+            return get_value(key, default=default)
+
+        with patch.object(ConfigService, "get_value", side_effect=get_value_with_ttl):
+            config_ttl_cache.reset()
+            cache = config_ttl_cache.get_cache()
+
+        assert cache is not None
+        assert cache.ttl_in_seconds == 5
+        assert config_ttl_cache.get("a") is None
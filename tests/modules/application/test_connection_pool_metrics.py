@@ -0,0 +1,86 @@
+from typing import Any, Optional
+from unittest.mock import patch
+
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutFailedReason,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+)
+
+from modules.application.common.connection_pool_metrics import ConnectionPoolMetrics
+from modules.application.repository import ApplicationRepositoryClient
+from modules.config.config_service import ConfigService
+from tests.modules.application.base_test_application import BaseTestApplication
+
+ADDRESS = ("localhost", 27017)
+
+
+class TestConnectionPoolMetrics(BaseTestApplication):
+    def test_checkouts_and_open_connections_are_counted(self) -> None:
+        pool_metrics = ConnectionPoolMetrics()
+
+        pool_metrics.connection_created(ConnectionCreatedEvent(ADDRESS, 1))
+        pool_metrics.connection_created(ConnectionCreatedEvent(ADDRESS, 2))
+        pool_metrics.connection_check_out_started(ConnectionCheckOutStartedEvent(ADDRESS))
+        pool_metrics.connection_checked_out(ConnectionCheckedOutEvent(ADDRESS, 1))
+
+        stats = pool_metrics.get_stats()
+        assert stats.connections_open == 2
+        assert stats.connections_in_use == 1
+        assert stats.checkouts == 1
+        assert stats.max_checkout_wait_time_in_ms >= stats.average_checkout_wait_time_in_ms >= 0
+
+        pool_metrics.connection_checked_in(ConnectionCheckedInEvent(ADDRESS, 1))
+        pool_metrics.connection_closed(ConnectionClosedEvent(ADDRESS, 2, "idle"))
+
+        stats = pool_metrics.get_stats()
+        assert stats.connections_open == 1
+        assert stats.connections_in_use == 0
+
+    def test_checkout_failures_are_counted_by_reason(self) -> None:
+        pool_metrics = ConnectionPoolMetrics()
+
+        for _ in range(2):
+            pool_metrics.connection_check_out_started(ConnectionCheckOutStartedEvent(ADDRESS))
+            pool_metrics.connection_check_out_failed(
+                ConnectionCheckOutFailedEvent(ADDRESS, ConnectionCheckOutFailedReason.TIMEOUT)
+            )
+
+        stats = pool_metrics.get_stats()
+        assert stats.checkouts == 0
+        assert stats.checkout_failures == 2
+        assert stats.checkout_failures_by_reason == {ConnectionCheckOutFailedReason.TIMEOUT: 2}
+
+    def test_reset_clears_counters(self) -> None:
+        pool_metrics = ConnectionPoolMetrics()
+        pool_metrics.connection_created(ConnectionCreatedEvent(ADDRESS, 1))
+
+        pool_metrics.reset()
+
+        assert pool_metrics.get_stats().connections_open == 0
+
+    def test_client_options_follow_config(self) -> None:
+        overrides = {
+            "mongodb.max_pool_size": 20,
+            "mongodb.wait_queue_timeout_in_ms": 500,
+            "mongodb.socket_timeout_in_ms": 0,
+            "mongodb.compressors": "zlib",
+        }
+        original_get_value = ConfigService.get_value
+
+        def get_value(key: str, default: Optional[Any] = None) -> Any:
+            if key in overrides:
+                return overrides[key]
+            return original_get_value(key, default=default)
+
+        with patch.object(ConfigService, "get_value", side_effect=get_value):
+            options = ApplicationRepositoryClient._get_client_options()
+
+        assert options["maxPoolSize"] == 20
+        assert options["waitQueueTimeoutMS"] == 500
+        assert options["compressors"] == "zlib"
+        assert "socketTimeoutMS" not in options
@@ -0,0 +1,65 @@
+from modules.application.common.count_cache import CountCache
+from modules.application.common.types import CountMode
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestCountCache(BaseTestApplication):
+    def test_exact_count_always_calls_counter(self) -> None:
+        count_cache = CountCache()
+        counts = iter([3, 5])
+
+        first = count_cache.count(account_id="a", key="tasks", count_mode=CountMode.EXACT, counter=lambda: next(counts))
+        second = count_cache.count(
+            account_id="a", key="tasks", count_mode=CountMode.EXACT, counter=lambda: next(counts)
+        )
+
+        assert first == 3
+        assert second == 5
+
+    def test_estimated_count_is_served_from_cache(self) -> None:
+        count_cache = CountCache()
+        count_cache.set(account_id="a", key="tasks", count=7)
+
+        result = count_cache.count(account_id="a", key="tasks", count_mode=CountMode.ESTIMATED, counter=lambda: 1)
+
+        assert result == 7
+
+    def test_estimated_count_expires(self) -> None:
+        count_cache = CountCache(ttl_in_seconds=-1)
+        count_cache.set(account_id="a", key="tasks", count=7)
+
+        result = count_cache.count(account_id="a", key="tasks", count_mode=CountMode.ESTIMATED, counter=lambda: 1)
+
+        assert result == 1
+
+    def test_none_count_skips_counter(self) -> None:
+        count_cache = CountCache()
+
+        def counter() -> int:
+            raise AssertionError("counter should not be called")
+
+        assert count_cache.count(account_id="a", key="tasks", count_mode=CountMode.NONE, counter=counter) is None
+
+    def test_invalidate_drops_all_counts_of_account(self) -> None:
+        count_cache = CountCache()
+        count_cache.set(account_id="a", key="tasks", count=1)
+        count_cache.set(account_id="a", key="task-1", count=2)
+        count_cache.set(account_id="b", key="tasks", count=3)
+
+        count_cache.invalidate(account_id="a")
+
+        assert count_cache.get(account_id="a", key="tasks") is None
+        assert count_cache.get(account_id="a", key="task-1") is None
+        assert count_cache.get(account_id="b", key="tasks") == 3
+
+    def test_least_recently_used_account_is_evicted(self) -> None:
+        count_cache = CountCache(max_accounts=2)
+        count_cache.set(account_id="a", key="tasks", count=1)
+        count_cache.set(account_id="b", key="tasks", count=2)
+        count_cache.get(account_id="a", key="tasks")
+
+        count_cache.set(account_id="c", key="tasks", count=3)
+
+        assert count_cache.get(account_id="a", key="tasks") == 1
+        assert count_cache.get(account_id="b", key="tasks") is None
+        assert count_cache.get(account_id="c", key="tasks") == 3
@@ -0,0 +1,85 @@
+import os
+from unittest.mock import patch
+
+from modules.application.common.password_hasher import PasswordHasher
+from modules.application.errors import PasswordHasherBusyError
+from modules.config.config_service import ConfigService
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestPasswordHasher(BaseTestApplication):
+    def get_config_value(self, overrides: dict):
+        get_value = ConfigService.get_value
+
+        def get_value_with_overrides(key, default=None):
+            if key in overrides:
+                return overrides[key]
+            return get_value(key, default=default)
+
+        return get_value_with_overrides
+
+    def test_hash_and_verify(self) -> None:
+        hashed_value = PasswordHasher.hash(value="password")
+
+        assert PasswordHasher.verify(value="password", hashed_value=hashed_value)
+        assert not PasswordHasher.verify(value="wrong-password", hashed_value=hashed_value)
+
+    def test_hash_and_verify_inline(self) -> None:
+        overrides = {"password_hashing.pool_size": 0}
+        with patch.object(ConfigService, "get_value", side_effect=self.get_config_value(overrides)):
+            hashed_value = PasswordHasher.hash(value="password")
+
+            assert PasswordHasher.verify(value="password", hashed_value=hashed_value)
+
+    def test_needs_rehash_when_cost_differs(self) -> None:
+        overrides = {"password_hashing.pool_size": 0, "password_hashing.rounds": 4}
+        with patch.object(ConfigService, "get_value", side_effect=self.get_config_value(overrides)):
+            hashed_value = PasswordHasher.hash(value="password")
+
+            assert not PasswordHasher.needs_rehash(hashed_value=hashed_value)
+
+        assert PasswordHasher.needs_rehash(hashed_value=hashed_value)
+        assert PasswordHasher.needs_rehash(hashed_value="not-a-bcrypt-hash")
+
+    def test_busy_when_every_pool_process_is_busy(self) -> None:
+        overrides = {"password_hashing.pool_size": 1, "password_hashing.max_queued": 0}
+        with patch.object(ConfigService, "get_value", side_effect=self.get_config_value(overrides)):
+            PasswordHasher._pending = 1
+            try:
+                with self.assertRaises(PasswordHasherBusyError) as context:
+                    PasswordHasher.hash(value="password")
+            finally:
+                PasswordHasher._pending = 0
+
+            hashed_value = PasswordHasher.hash(value="password")
+            assert PasswordHasher.verify(value="password", hashed_value=hashed_value)
+        PasswordHasher.shutdown()
+
+        assert context.exception.http_code == 429
+
+    def test_reset_after_fork_starts_new_pool(self) -> None:
+        overrides = {"password_hashing.pool_size": 1}
+        with patch.object(ConfigService, "get_value", side_effect=self.get_config_value(overrides)):
+            hashed_value = PasswordHasher.hash(value="password")
+            executor = PasswordHasher._executor
+            assert executor is not None
+
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                # gunicorn's post_fork resets the child, which then hashes with a pool of its own
+                os.close(read_fd)
+                PasswordHasher.reset_after_fork()
+                is_verified = PasswordHasher._executor is None and PasswordHasher.verify(
+                    value="password", hashed_value=hashed_value
+                )
+                os.write(write_fd, b"1" if is_verified else b"0")
+                os._exit(0)
+
+            os.close(write_fd)
+            with os.fdopen(read_fd, "rb") as child_output:
+                assert child_output.read() == b"1"
+            os.waitpid(pid, 0)
+
+            assert PasswordHasher._executor is executor
+        PasswordHasher.shutdown()
@@ -0,0 +1,69 @@
+from typing import Callable
+
+from pymongo import IndexModel
+
+from modules.application.repository import ApplicationRepository, ApplicationRepositoryClient
+from tests.modules.application.base_test_application import BaseTestApplication
+
+SCHEMA_SYNC_TEST_VALIDATION_SCHEMA = {
+    "$jsonSchema": {"bsonType": "object", "required": ["name"], "properties": {"name": {"bsonType": "string"}}}
+}
+
+
+class SchemaSyncTestRepository(ApplicationRepository):
+    collection_name = "schema_sync_test"
+    indexes = [
+        IndexModel("name"),
+        IndexModel([("name", 1), ("created_at", -1)], name="name_created_at_index", partialFilterExpression={"a": 1}),
+    ]
+    validator = SCHEMA_SYNC_TEST_VALIDATION_SCHEMA
+
+
+class TestRepositorySchema(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.database = ApplicationRepositoryClient.get_client().get_database()
+        self.database.drop_collection(SchemaSyncTestRepository.collection_name)
+        self.collection = self.database[SchemaSyncTestRepository.collection_name]
+
+    def teardown_method(self, method: Callable) -> None:
+        self.database.drop_collection(SchemaSyncTestRepository.collection_name)
+        super().teardown_method(method)
+
+    def test_index_with_changed_options_is_detected(self) -> None:
+        declared_index = IndexModel("name", name="name_index", unique=True).document
+
+        assert not ApplicationRepository._is_index_changed(
+            declared_index, {"v": 2, "key": [("name", 1)], "unique": True}
+        )
+        assert ApplicationRepository._is_index_changed(declared_index, {"v": 2, "key": [("name", 1)]})
+        assert ApplicationRepository._is_index_changed(declared_index, {"v": 2, "key": [("name", -1)], "unique": True})
+
+    def test_sync_schema_creates_collection_and_is_idempotent(self) -> None:
+        changes = SchemaSyncTestRepository.sync_schema(self.collection)
+
+        assert changes.is_collection_missing
+        assert changes.indexes_to_create == ["name_1", "name_created_at_index"]
+        assert SchemaSyncTestRepository.get_schema_changes(self.collection).has_changes is False
+
+    def test_dry_run_reports_without_applying(self) -> None:
+        changes = SchemaSyncTestRepository.sync_schema(self.collection, dry_run=True)
+
+        assert changes.is_collection_missing
+        assert SchemaSyncTestRepository.collection_name not in self.database.list_collection_names()
+
+    def test_changed_and_undeclared_indexes(self) -> None:
+        SchemaSyncTestRepository.sync_schema(self.collection)
+        self.collection.drop_index("name_1")
+        self.collection.create_index("name", unique=True)
+        self.collection.create_index("created_at", name="created_at_index")
+        self.database.command({"collMod": SchemaSyncTestRepository.collection_name, "validator": {}})
+
+        changes = SchemaSyncTestRepository.sync_schema(self.collection)
+
+        assert changes.is_validator_changed
+        assert changes.indexes_to_recreate == ["name_1"]
+        assert changes.undeclared_indexes == ["created_at_index"]
+        assert "unique" not in self.collection.index_information()["name_1"]
+        assert "created_at_index" in self.collection.index_information()
+        assert SchemaSyncTestRepository.get_schema_changes(self.collection).has_changes is False
@@ -0,0 +1,45 @@
+from modules.application.common.ttl_cache import TTLCache
+from modules.application.common.types import CacheStats
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestTTLCache(BaseTestApplication):
+    def test_get_returns_cached_value(self) -> None:
+        ttl_cache: TTLCache[str] = TTLCache()
+        ttl_cache.set("a", "value")
+
+        assert ttl_cache.get("a") == "value"
+        assert ttl_cache.get("b") is None
+        assert ttl_cache.get_stats() == CacheStats(hits=1, misses=1, size=1)
+
+    def test_entries_expire(self) -> None:
+        ttl_cache: TTLCache[str] = TTLCache(ttl_in_seconds=-1)
+        ttl_cache.set("a", "value")
+
+        assert ttl_cache.get("a") is None
+        assert ttl_cache.get_stats().size == 0
+
+    def test_entry_ttl_overrides_default(self) -> None:
+        ttl_cache: TTLCache[str] = TTLCache(ttl_in_seconds=60)
+        ttl_cache.set("a", "value", ttl_in_seconds=-1)
+
+        assert ttl_cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        ttl_cache: TTLCache[str] = TTLCache(max_entries=2)
+        ttl_cache.set("a", "a")
+        ttl_cache.set("b", "b")
+        ttl_cache.get("a")
+        ttl_cache.set("c", "c")
+
+        assert ttl_cache.get("a") == "a"
+        assert ttl_cache.get("b") is None
+        assert ttl_cache.get("c") == "c"
+
+    def test_invalidate_removes_entry(self) -> None:
+        ttl_cache: TTLCache[str] = TTLCache()
+        ttl_cache.set("a", "value")
+
+        ttl_cache.invalidate("a")
+
+        assert ttl_cache.get("a") is None
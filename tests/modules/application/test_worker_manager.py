@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from typing import Callable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio.client import Client
+from temporalio.service import RPCError, RPCStatusCode
+
+from modules.application.errors import WorkerClientConnectionError
+from modules.application.internal.worker_manager import WorkerManager
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestWorkerManager(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self._stop_loop()
+
+    def teardown_method(self, method: Callable) -> None:
+        self._stop_loop()
+        super().teardown_method(method)
+
+    @staticmethod
+    def _stop_loop() -> None:
+        if WorkerManager.LOOP is not None:
+            WorkerManager.LOOP.call_soon_threadsafe(WorkerManager.LOOP.stop)
+        WorkerManager.reset_after_fork()
+
+    @staticmethod
+    def _get_fake_client(is_healthy: bool = True) -> MagicMock:
+        client = MagicMock()
+        client.service_client.check_health = AsyncMock(return_value=is_healthy)
+        return client
+
+    def test_calls_share_one_background_loop(self) -> None:
+        async def get_running_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first_loop = WorkerManager._run(get_running_loop())
+        second_loop = WorkerManager._run(get_running_loop())
+
+        assert first_loop is second_loop
+        assert first_loop is WorkerManager.LOOP
+        assert first_loop.is_running()
+        assert any(thread.name == "worker-manager-loop" for thread in threading.enumerate())
+
+    def test_client_is_connected_once_and_reused(self) -> None:
+        client = self._get_fake_client()
+        with patch.object(Client, "connect", AsyncMock(return_value=client)) as connect:
+            assert WorkerManager._run(WorkerManager._get_client()) is client
+            assert WorkerManager._run(WorkerManager._get_client()) is client
+
+        assert connect.await_count == 1
+        client.service_client.check_health.assert_not_awaited()
+
+    def test_unhealthy_client_is_replaced(self) -> None:
+        unhealthy_client = self._get_fake_client(is_healthy=False)
+        healthy_client = self._get_fake_client()
+        with patch.object(Client, "connect", AsyncMock(side_effect=[unhealthy_client, healthy_client])) as connect:
+            WorkerManager._run(WorkerManager._get_client())
+            WorkerManager.CLIENT_VERIFIED_AT = 0.0
+
+            assert WorkerManager._run(WorkerManager._get_client()) is healthy_client
+
+        assert connect.await_count == 2
+        unhealthy_client.service_client.check_health.assert_awaited_once()
+
+    def test_unavailable_error_forces_health_check(self) -> None:
+        async def fail_unavailable() -> None:
+            raise RPCError("unavailable", RPCStatusCode.UNAVAILABLE, b"")
+
+        WorkerManager.CLIENT_VERIFIED_AT = 1.0
+        with pytest.raises(RPCError):
+            WorkerManager._run(fail_unavailable())
+
+        assert WorkerManager.CLIENT_VERIFIED_AT == 0.0
+
+    def test_call_exceeding_timeout_raises_deadline_exceeded(self) -> None:
+        with patch.object(WorkerManager, "RPC_TIMEOUT_IN_SECONDS", return_value=0.01):
+            with pytest.raises(RPCError) as exc_info:
+                WorkerManager._run(asyncio.sleep(1))
+
+        assert exc_info.value.status == RPCStatusCode.DEADLINE_EXCEEDED
+
+    def test_connect_exceeding_timeout_raises_connection_error(self) -> None:
+        async def connect(*args: object, **kwargs: object) -> Client:
+            await asyncio.sleep(1)
+            return self._get_fake_client()
+
+        with patch.object(WorkerManager, "RPC_TIMEOUT_IN_SECONDS", return_value=0.01):
+            with patch.object(Client, "connect", connect):
+                with pytest.raises(WorkerClientConnectionError):
+                    WorkerManager.connect_temporal_server()
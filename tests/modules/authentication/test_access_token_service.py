@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from modules.account.account_service import AccountService
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
@@ -6,7 +8,11 @@ from modules.account.types import (
     PhoneNumber,
 )
 from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.errors import AccessTokenInvalidError
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
 from modules.authentication.types import CreateOTPParams, OTPBasedAuthAccessTokenRequestParams
+from modules.config.config_service import ConfigService
 from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
 
 
@@ -37,6 +43,40 @@ class TestAuthenticationService(BaseTestAccessToken):
 
         assert verified_access_token.account_id == account.id
 
+    def test_verify_access_token_is_served_from_cache(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+        AuthenticationService.verify_access_token(token=access_token.token)
+        hits_before = AccessTokenUtil.VERIFIED_TOKEN_CACHE.get_stats().hits
+
+        verified_access_token = AuthenticationService.verify_access_token(token=access_token.token)
+
+        assert verified_access_token.account_id == account.id
+        assert AccessTokenUtil.VERIFIED_TOKEN_CACHE.get_stats().hits == hits_before + 1
+
+    def test_verify_access_token_after_signing_key_rotation(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+        AuthenticationService.verify_access_token(token=access_token.token)
+        get_value = ConfigService.get_value
+
+        def get_rotated_value(key, default=None):
+            if key == "accounts.token_signing_key":
+                return "ROTATED_JWT_TOKEN"
+            return get_value(key, default=default)
+
+        with patch.object(ConfigService, "get_value", side_effect=get_rotated_value):
+            with self.assertRaises(AccessTokenInvalidError):
+                AuthenticationService.verify_access_token(token=access_token.token)
+
     def test_get_access_token_by_phone_number(self) -> None:
         phone_number = {"country_code": "+91", "phone_number": "9999999999"}
         account = AccountWriter.create_account_by_phone_number(
@@ -76,3 +116,18 @@ class TestAuthenticationService(BaseTestAccessToken):
         verified_access_token = AuthenticationService.verify_access_token(token=access_token.token)
 
         assert verified_access_token.account_id == account.id
+
+    def test_create_otp_expires_previous_otps(self) -> None:
+        phone_number = {"country_code": "+91", "phone_number": "9999999999"}
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=PhoneNumber(**phone_number))
+        )
+        for _ in range(3):
+            latest_otp = AuthenticationService.create_otp(
+                params=CreateOTPParams(phone_number=PhoneNumber(**phone_number)), account_id=account.id
+            )
+
+        active_otps = list(OTPRepository.collection().find({"phone_number": phone_number, "active": True}))
+
+        assert [str(otp_bson["_id"]) for otp_bson in active_otps] == [latest_otp.id]
+        assert OTPRepository.collection().count_documents({"phone_number": phone_number, "active": False}) == 2
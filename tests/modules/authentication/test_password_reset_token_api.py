@@ -8,8 +8,12 @@ from modules.account.errors import AccountBadRequestError, AccountNotFoundError
 from modules.account.types import CreateAccountByUsernameAndPasswordParams
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.errors import PasswordResetTokenNotFoundError
-from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
+from modules.authentication.internals.password_reset_token.password_reset_token_util import (
+    HMAC_TOKEN_PREFIX,
+    PasswordResetTokenUtil,
+)
 from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.config.config_service import ConfigService
 from modules.notification.email_service import EmailService
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
@@ -97,6 +101,86 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertTrue(updated_password_reset_token.is_used)
             self.assertTrue(mock_send_email.called)
 
+    @mock.patch.object(EmailService, "send_email_for_account")
+    def test_reset_account_password_with_hmac_token(self, mock_send_email):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        get_value = ConfigService.get_value
+
+        def get_value_with_hmac_mode(key, default=None):
+            if key == "accounts.password_reset_token_hash_mode":
+                return "hmac"
+            if key == "accounts.password_reset_token_hmac_key":
+                return "hmac_key"
+            return get_value(key, default=default)
+
+        with mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_hmac_mode):
+            password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account.id, token)
+
+        self.assertTrue(password_reset_token.token.startswith(HMAC_TOKEN_PREFIX))
+
+        with app.test_client() as client:
+            invalid_response = client.patch(
+                f"{ACCOUNT_API_URL}/{account.id}",
+                headers=HEADERS,
+                data=json.dumps({"new_password": "new_password", "token": "invalid_token"}),
+            )
+            response = client.patch(
+                f"{ACCOUNT_API_URL}/{account.id}",
+                headers=HEADERS,
+                data=json.dumps({"new_password": "new_password", "token": token}),
+            )
+
+            self.assertEqual(invalid_response.status_code, 400)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json["id"], account.id)
+
+    def test_hmac_token_verifies_with_previous_key_after_rotation(self):
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        get_value = ConfigService.get_value
+
+        def get_value_with_hmac_keys(hmac_keys):
+            def get_value_with_overrides(key, default=None):
+                if key == "accounts.password_reset_token_hash_mode":
+                    return "hmac"
+                if key in hmac_keys:
+                    return hmac_keys[key]
+                return get_value(key, default=default)
+
+            return get_value_with_overrides
+
+        old_keys = {"accounts.password_reset_token_hmac_key": "old_key"}
+        with mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_hmac_keys(old_keys)):
+            hashed_token = PasswordResetTokenUtil.hash_password_reset_token(token)
+
+        rotated_keys = {
+            "accounts.password_reset_token_hmac_key": "new_key",
+            "accounts.password_reset_token_previous_hmac_key": "old_key",
+        }
+        with mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_hmac_keys(rotated_keys)):
+            self.assertTrue(
+                PasswordResetTokenUtil.compare_password_reset_token(reset_token=token, hashed_reset_token=hashed_token)
+            )
+
+        new_keys = {"accounts.password_reset_token_hmac_key": "new_key"}
+        with mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_hmac_keys(new_keys)):
+            self.assertFalse(
+                PasswordResetTokenUtil.compare_password_reset_token(reset_token=token, hashed_reset_token=hashed_token)
+            )
+
+        signing_key_rotated_keys = {**old_keys, "accounts.token_signing_key": "rotated_signing_key"}
+        with mock.patch.object(
+            ConfigService, "get_value", side_effect=get_value_with_hmac_keys(signing_key_rotated_keys)
+        ):
+            self.assertTrue(
+                PasswordResetTokenUtil.compare_password_reset_token(reset_token=token, hashed_reset_token=hashed_token)
+            )
+
     @mock.patch.object(EmailService, "send_email_for_account")
     def test_reset_account_password_account_not_found(self, mock_send_email):
         account_id = "661e42ec98423703a299a899"
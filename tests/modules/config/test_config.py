@@ -26,3 +26,20 @@ class TestConfig(BaseTestConfig):
 
         populated_env = os.environ.get("APP_ENV")
         assert populated_env == "testing" or populated_env == "docker-test"
+
+    def test_nested_section_and_leaf_are_indexed_by_dotted_key(self) -> None:
+        section = ConfigService[dict].get_value(key="public.default_otp")
+        assert ConfigService[str].get_value(key="public.default_otp.code") == section["code"]
+        assert ConfigService.has_value("public.default_otp.missing_key") is False
+        assert ConfigService[str].get_value(key="public.default_otp.missing_key", default="fallback") == "fallback"
+
+    def test_accessor_returns_current_value_of_bound_key(self) -> None:
+        get_mongodb_uri = ConfigService[str].get_accessor("mongodb.uri")
+        assert get_mongodb_uri() == ConfigService[str].get_value(key="mongodb.uri")
+
+        get_missing_value = ConfigService[str].get_accessor("missing.key")
+        try:
+            get_missing_value()
+            assert False, "expected MissingKeyError"
+        except MissingKeyError as exc:
+            assert exc.code == ErrorCode.MISSING_KEY
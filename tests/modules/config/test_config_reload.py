@@ -0,0 +1,66 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+from modules.config.config_service import ConfigService
+from modules.config.internals.config_watcher import ConfigWatcher
+from tests.modules.config.base_test_config import BaseTestConfig
+
+
+class TestConfigReload(BaseTestConfig):
+    def setUp(self) -> None:
+        self.original_config_manager = ConfigService.config_manager
+        self.original_subscribers = dict(ConfigService._subscribers)
+
+    def tearDown(self) -> None:
+        ConfigService.config_manager = self.original_config_manager
+        ConfigService._subscribers = self.original_subscribers
+
+    def test_reload_swaps_config_and_notifies_subscribers_of_changed_keys(self) -> None:
+        notified_keys: List[str] = []
+        ConfigService.subscribe("accounts", lambda: notified_keys.append("accounts"))
+        ConfigService.subscribe("accounts.password_reset_token_hash_mode", lambda: notified_keys.append("hash_mode"))
+        ConfigService.subscribe("sms", lambda: notified_keys.append("sms"))
+
+        with mock.patch.dict(os.environ, {"PASSWORD_RESET_TOKEN_HASH_MODE": "hmac"}):
+            changed_keys = ConfigService.reload()
+
+        assert ConfigService[str].get_value(key="accounts.password_reset_token_hash_mode") == "hmac"
+        assert "accounts.password_reset_token_hash_mode" in changed_keys
+        assert sorted(notified_keys) == ["accounts", "hash_mode"]
+
+    def test_failing_subscriber_does_not_stop_reload(self) -> None:
+        notified_keys: List[str] = []
+
+        def failing_callback() -> None:
+            raise RuntimeError("subscriber failed")
+
+        ConfigService.subscribe("accounts", failing_callback)
+        ConfigService.subscribe("accounts", lambda: notified_keys.append("accounts"))
+
+        with mock.patch.dict(os.environ, {"PASSWORD_RESET_TOKEN_HASH_MODE": "hmac"}):
+            ConfigService.reload()
+
+        assert notified_keys == ["accounts"]
+
+    def test_watcher_calls_on_change_when_a_watched_file_changes(self) -> None:
+        change_count: List[int] = []
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = Path(directory) / "testing.yml"
+            config_file.write_text("sms:\n  enabled: false\n")
+            watcher = ConfigWatcher(
+                get_paths=lambda: [config_file], on_change=lambda: change_count.append(1), interval_in_seconds=0.01
+            )
+            watcher.start()
+
+            config_file.write_text("sms:\n  enabled: true\n")
+            os.utime(config_file, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+            deadline = time.monotonic() + 2
+            while not change_count and time.monotonic() < deadline:
+                time.sleep(0.01)
+            watcher.stop()
+
+        assert len(change_count) == 1
@@ -0,0 +1,119 @@
+import logging
+import os
+import threading
+import unittest
+from typing import Any, List, Optional
+from unittest import mock
+
+from datadog_api_client.v2.api.logs_api import LogsApi
+from datadog_api_client.v2.models import HTTPLog
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.datadog_handler import DatadogHandler
+
+original_get_value = ConfigService.get_value
+
+DATADOG_CONFIG = {
+    "datadog.api_key": "api_key",
+    "datadog.site_name": "datadoghq.com",
+    "datadog.app_name": "app_name",
+    "datadog.log_queue_size": 5,
+    "datadog.log_batch_size": 2,
+    "datadog.log_flush_interval_in_seconds": 0.05,
+}
+
+
+def get_value_with_datadog_config(key: str, default: Optional[Any] = None) -> Any:
+    if key in DATADOG_CONFIG:
+        return DATADOG_CONFIG[key]
+    return original_get_value(key, default=default)
+
+
+@mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_datadog_config)
+class TestDatadogHandler(unittest.TestCase):
+    def _create_logger(self, handler: DatadogHandler) -> logging.Logger:
+        logger = logging.getLogger(f"test_datadog_handler_{id(handler)}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        return logger
+
+    def test_records_are_shipped_in_batches(self, _mock_get_value: Any) -> None:
+        submitted_batches: List[List[str]] = []
+
+        def submit_log(_self: LogsApi, body: HTTPLog) -> None:
+            submitted_batches.append([item.message for item in body.value])
+
+        with mock.patch.object(LogsApi, "submit_log", submit_log):
+            handler = DatadogHandler("flask")
+            logger = self._create_logger(handler)
+            for index in range(3):
+                logger.info(f"line {index}")
+            handler.flush()
+            handler.close()
+
+        assert [len(batch) for batch in submitted_batches] == [2, 1]
+        assert [message for batch in submitted_batches for message in batch] == ["line 0", "line 1", "line 2"]
+        assert handler.get_stats().sent == 3
+
+    def test_close_unregisters_exit_hook(self, _mock_get_value: Any) -> None:
+        with mock.patch("modules.logger.internal.datadog_handler.atexit") as mock_atexit:
+            handler = DatadogHandler("flask")
+            handler.close()
+
+        mock_atexit.register.assert_called_once_with(handler.close)
+        mock_atexit.unregister.assert_called_once_with(handler.close)
+
+    def test_records_are_dropped_when_queue_is_full(self, _mock_get_value: Any) -> None:
+        is_submitting = threading.Event()
+        can_submit = threading.Event()
+
+        def submit_log(_self: LogsApi, body: HTTPLog) -> None:
+            is_submitting.set()
+            can_submit.wait(timeout=5)
+
+        with mock.patch.object(LogsApi, "submit_log", submit_log):
+            handler = DatadogHandler("flask")
+            logger = self._create_logger(handler)
+            logger.info("first line")
+            is_submitting.wait(timeout=5)
+            for index in range(7):
+                logger.info(f"line {index}")
+            can_submit.set()
+            handler.flush()
+            handler.close()
+
+        stats = handler.get_stats()
+        assert stats.sent == 6
+        assert stats.dropped == 2
+
+    def test_failed_batches_are_counted(self, _mock_get_value: Any) -> None:
+        with mock.patch.object(LogsApi, "submit_log", side_effect=RuntimeError("intake down")):
+            handler = DatadogHandler("flask")
+            self._create_logger(handler).error("line")
+            handler.flush()
+            handler.close()
+
+        assert handler.get_stats().failed == 1
+
+    def test_forked_child_ships_its_own_records(self, _mock_get_value: Any) -> None:
+        submitted_messages: List[str] = []
+
+        def submit_log(_self: LogsApi, body: HTTPLog) -> None:
+            submitted_messages.extend(item.message for item in body.value)
+
+        with mock.patch.object(LogsApi, "submit_log", submit_log):
+            handler = DatadogHandler("flask")
+            logger = self._create_logger(handler)
+
+            pid = os.fork()
+            if pid == 0:
+                handler.reset_after_fork()
+                logger.info("from child")
+                handler.flush()
+                os._exit(0 if submitted_messages == ["from child"] else 1)
+
+            _, status = os.waitpid(pid, 0)
+            handler.close()
+
+        assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,66 @@
+import io
+import json
+import logging
+import unittest
+from typing import Any
+
+from modules.logger.internal.log_formatters import JsonFormatter, StructuredTextFormatter
+from modules.logger.internal.log_message import LogMessage
+
+
+class ExpensiveValue:
+    def __init__(self) -> None:
+        self.render_count = 0
+
+    def __format__(self, format_spec: str) -> str:
+        self.render_count += 1
+        return "expensive"
+
+
+class TestLogger(unittest.TestCase):
+    def _create_logger(
+        self, formatter: logging.Formatter, level: int = logging.DEBUG
+    ) -> tuple[logging.Logger, io.StringIO]:
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(formatter)
+        logger = logging.getLogger(f"test_logger_{id(stream)}")
+        logger.propagate = False
+        logger.setLevel(level)
+        logger.addHandler(handler)
+        return logger, stream
+
+    def _log(self, logger: logging.Logger, level: int, message: str, **fields: Any) -> None:
+        logger.log(level, LogMessage(message, fields), extra={"fields": fields})
+
+    def test_template_is_not_rendered_below_logger_level(self) -> None:
+        logger, stream = self._create_logger(StructuredTextFormatter("%(message)s"), level=logging.INFO)
+        value = ExpensiveValue()
+
+        self._log(logger, logging.DEBUG, "debug {value}", value=value)
+
+        assert value.render_count == 0
+        assert stream.getvalue() == ""
+
+    def test_text_format_renders_template_and_appends_fields(self) -> None:
+        logger, stream = self._create_logger(StructuredTextFormatter("%(levelname)s - %(message)s"))
+
+        self._log(logger, logging.INFO, "Task {task_id} created", task_id="task-1", account_id="account-1")
+
+        assert stream.getvalue() == "INFO - Task task-1 created task_id=task-1 account_id=account-1\n"
+
+    def test_json_format_writes_fields_as_top_level_keys(self) -> None:
+        logger, stream = self._create_logger(JsonFormatter())
+
+        self._log(logger, logging.WARNING, "Task {task_id} created", task_id="task-1", account_id="account-1")
+
+        log_entry = json.loads(stream.getvalue())
+        assert log_entry["level"] == "WARNING"
+        assert log_entry["message"] == "Task task-1 created"
+        assert log_entry["task_id"] == "task-1"
+        assert log_entry["account_id"] == "account-1"
+
+    def test_message_with_stray_braces_is_kept_verbatim(self) -> None:
+        message = LogMessage("Failed with {'code': 26}", {"collection": "tasks"})
+
+        assert str(message) == "Failed with {'code': 26}"
@@ -0,0 +1,23 @@
+import unittest
+from typing import Callable
+
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.fake_notification_transport import FakeNotificationTransport
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+
+
+class BaseTestNotification(unittest.TestCase):
+    def setup_method(self, method: Callable) -> None:
+        print(f"Executing:: {method.__name__}")
+        LoggerManager.mount_logger()
+
+    def teardown_method(self, method: Callable) -> None:
+        print(f"Executed:: {method.__name__}")
+        AccountRepository.collection().delete_many({})
+        AccountNotificationPreferencesRepository.collection().delete_many({})
+        NotificationOutboxRepository.collection().delete_many({})
+        FakeNotificationTransport.clear()
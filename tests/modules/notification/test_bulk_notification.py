@@ -0,0 +1,97 @@
+from typing import Any
+from unittest import mock
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.notification.internals.fake_notification_transport import FakeNotificationTransport
+from modules.notification.internals.notification_transport import NotificationTransport
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    BulkEmailItem,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+    EmailRecipient,
+    EmailSender,
+    NotificationDeliveryStatus,
+    SendBulkEmailParams,
+    SendEmailParams,
+)
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+
+class TestBulkNotification(BaseTestNotification):
+    def _create_account_id(self, username: str) -> str:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username=username
+            )
+        )
+        return account.id
+
+    def _email_item(self, account_id: str, email: str, template_id: str = "digest") -> BulkEmailItem:
+        return BulkEmailItem(
+            account_id=account_id,
+            params=SendEmailParams(
+                recipient=EmailRecipient(email=email),
+                sender=EmailSender(email="sender@example.com", name="Sender"),
+                template_id=template_id,
+                template_data={"email": email},
+            ),
+        )
+
+    def test_send_bulk_email_groups_recipients_by_template(self) -> None:
+        account_ids = [self._create_account_id(f"user{index}@example.com") for index in range(3)]
+
+        results = NotificationService.send_bulk_email(
+            params=SendBulkEmailParams(
+                items=[
+                    self._email_item(account_ids[0], "user0@example.com"),
+                    self._email_item(account_ids[1], "user1@example.com", template_id="welcome"),
+                    self._email_item(account_ids[2], "user2@example.com"),
+                ]
+            )
+        )
+
+        assert [result.index for result in results] == [0, 1, 2]
+        assert all(result.status == NotificationDeliveryStatus.SENT for result in results)
+        batch_sizes = sorted(len(batch) for batch in FakeNotificationTransport.SENT_EMAIL_BATCHES)
+        assert batch_sizes == [1, 2]
+
+    def test_send_bulk_email_reports_per_recipient_outcomes(self) -> None:
+        enabled_account_id = self._create_account_id("enabled@example.com")
+        disabled_account_id = self._create_account_id("disabled@example.com")
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=disabled_account_id,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False),
+        )
+
+        results = NotificationService.send_bulk_email(
+            params=SendBulkEmailParams(
+                items=[
+                    self._email_item(enabled_account_id, "enabled@example.com"),
+                    self._email_item(disabled_account_id, "disabled@example.com"),
+                    self._email_item("000000000000000000000000", "unknown@example.com"),
+                    self._email_item(enabled_account_id, "not-an-email"),
+                ]
+            )
+        )
+
+        assert [result.status for result in results] == [
+            NotificationDeliveryStatus.SENT,
+            NotificationDeliveryStatus.SKIPPED,
+            NotificationDeliveryStatus.FAILED,
+            NotificationDeliveryStatus.FAILED,
+        ]
+        assert results[2].error_code == "NOTIFICATION_ERR_01"
+        assert results[3].error_code == "NOTIFICATION_ERR_02"
+        assert [params.recipient.email for params in FakeNotificationTransport.SENT_EMAILS] == ["enabled@example.com"]
+
+    @mock.patch.object(NotificationTransport, "send_bulk_email", side_effect=RuntimeError("provider down"))
+    def test_send_bulk_email_marks_batch_failed_when_provider_fails(self, _mock_send_bulk_email: Any) -> None:
+        account_id = self._create_account_id("user@example.com")
+
+        results = NotificationService.send_bulk_email(
+            params=SendBulkEmailParams(items=[self._email_item(account_id, "user@example.com")])
+        )
+
+        assert results[0].status == NotificationDeliveryStatus.FAILED
+        assert results[0].message == "provider down"
@@ -0,0 +1,126 @@
+from typing import Any, Optional
+from unittest import mock
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams, PhoneNumber
+from modules.application.application_service import ApplicationService
+from modules.application.errors import WorkerStartError
+from modules.config.config_service import ConfigService
+from modules.notification.email_service import EmailService
+from modules.notification.internals.fake_notification_transport import FakeNotificationTransport
+from modules.notification.internals.notification_outbox_dispatcher import NotificationOutboxDispatcher
+from modules.notification.internals.notification_transport import NotificationTransport
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.sms_service import SMSService
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationOutboxStatus,
+    SendEmailParams,
+    SendSMSParams,
+)
+from modules.notification.workers.notification_dispatch_worker import NotificationDispatchWorker
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+original_get_value = ConfigService.get_value
+
+
+def get_value_with_outbox(key: str, default: Optional[Any] = None) -> Any:
+    if key == "notification.dispatch_mode":
+        return "outbox"
+    if key == "sms.enabled":
+        return True
+    return original_get_value(key, default=default)
+
+
+class TestNotificationOutbox(BaseTestNotification):
+    def _create_account_id(self) -> str:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        return account.id
+
+    def _email_params(self) -> SendEmailParams:
+        return SendEmailParams(
+            recipient=EmailRecipient(email="user@example.com"),
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id="template_id",
+            template_data={"first_name": "first_name"},
+        )
+
+    def test_send_email_in_sync_mode_uses_transport_directly(self) -> None:
+        account_id = self._create_account_id()
+
+        EmailService.send_email_for_account(account_id=account_id, params=self._email_params())
+
+        assert FakeNotificationTransport.SENT_EMAILS == [self._email_params()]
+        assert NotificationOutboxRepository.collection().count_documents({}) == 0
+
+    @mock.patch.object(ApplicationService, "run_worker_immediately")
+    @mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_outbox)
+    def test_send_email_in_outbox_mode_enqueues_and_starts_worker(
+        self, _mock_get_value: Any, mock_run_worker: Any
+    ) -> None:
+        account_id = self._create_account_id()
+
+        EmailService.send_email_for_account(account_id=account_id, params=self._email_params())
+
+        assert FakeNotificationTransport.SENT_EMAILS == []
+        notification_bson = NotificationOutboxRepository.collection().find_one({})
+        assert notification_bson["status"] == NotificationOutboxStatus.PENDING
+        assert notification_bson["payload"]["recipient"] == {"email": "user@example.com"}
+        mock_run_worker.assert_called_once_with(
+            cls=NotificationDispatchWorker, arguments=(str(notification_bson["_id"]),)
+        )
+
+        NotificationOutboxDispatcher.dispatch_notification(
+            notification_id=str(notification_bson["_id"]), max_attempts=NotificationDispatchWorker.max_retries
+        )
+
+        assert FakeNotificationTransport.SENT_EMAILS == [self._email_params()]
+        notification_bson = NotificationOutboxRepository.collection().find_one({})
+        assert notification_bson["status"] == NotificationOutboxStatus.SENT
+        assert notification_bson["attempts"] == 1
+        assert notification_bson["payload"] == {}
+
+    @mock.patch.object(ApplicationService, "run_worker_immediately", side_effect=WorkerStartError("worker"))
+    @mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_outbox)
+    def test_send_sms_in_outbox_mode_stays_pending_when_worker_cannot_start(
+        self, _mock_get_value: Any, _mock_run_worker: Any
+    ) -> None:
+        account_id = self._create_account_id()
+        params = SendSMSParams(
+            message_body="123456", recipient_phone=PhoneNumber(country_code="+1", phone_number="5555555555")
+        )
+
+        SMSService.send_sms_for_account(account_id=account_id, params=params)
+
+        notification_bson = NotificationOutboxRepository.collection().find_one({})
+        assert notification_bson["status"] == NotificationOutboxStatus.PENDING
+        assert FakeNotificationTransport.SENT_SMS == []
+
+    @mock.patch.object(ApplicationService, "run_worker_immediately")
+    @mock.patch.object(ConfigService, "get_value", side_effect=get_value_with_outbox)
+    def test_dispatch_marks_notification_failed_after_max_attempts(
+        self, _mock_get_value: Any, _mock_run_worker: Any
+    ) -> None:
+        account_id = self._create_account_id()
+        EmailService.send_email_for_account(account_id=account_id, params=self._email_params())
+        notification_id = str(NotificationOutboxRepository.collection().find_one({})["_id"])
+
+        with mock.patch.object(NotificationTransport, "send_email", side_effect=RuntimeError("provider down")):
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    NotificationOutboxDispatcher.dispatch_notification(notification_id=notification_id, max_attempts=2)
+
+        notification_bson = NotificationOutboxRepository.collection().find_one({})
+        assert notification_bson["status"] == NotificationOutboxStatus.FAILED
+        assert notification_bson["attempts"] == 2
+        assert notification_bson["last_error"] == "provider down"
+        assert notification_bson["payload"] == {}
+
+        NotificationOutboxDispatcher.dispatch_notification(notification_id=notification_id, max_attempts=2)
+
+        assert FakeNotificationTransport.SENT_EMAILS == []
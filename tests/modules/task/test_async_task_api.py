@@ -0,0 +1,128 @@
+import asyncio
+import json
+from typing import Any, Optional
+
+from asgi import application, async_app
+from modules.authentication.types import AccessTokenErrorCode
+from modules.task.types import TaskErrorCode
+from tests.modules.task.base_test_task import BaseTestTask
+
+
+class TestAsyncTaskApi(BaseTestTask):
+    def make_async_request(
+        self, method: str, path: str, token: Optional[str] = None, data: Optional[dict] = None
+    ) -> tuple[int, Any]:
+        headers = {**self.HEADERS}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        async def request() -> tuple[int, Any]:
+            client = async_app.test_client()
+            response = await client.open(
+                path, method=method, headers=headers, data=json.dumps(data) if data is not None else None
+            )
+            body = await response.get_data(as_text=True)
+            return response.status_code, json.loads(body) if body else None
+
+        result = asyncio.run(request())
+        return result
+
+    def test_task_routes_are_served_by_async_app(self) -> None:
+        assert application.is_async_route(path="/api/accounts/abc/tasks", method="GET")
+        assert application.is_async_route(path="/api/accounts/abc/tasks/def/comments:batch", method="POST")
+        assert application.is_async_route(path="/api/accounts/abc", method="PATCH")
+        assert not application.is_async_route(path="/api/accounts/abc/tasks", method="OPTIONS")
+        assert not application.is_async_route(path="/api/access-tokens", method="POST")
+        assert not application.is_async_route(path="/", method="GET")
+
+    def test_create_and_get_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_data = {"title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION}
+
+        status_code, created_task = self.make_async_request(
+            "POST", f"/api/accounts/{account.id}/tasks", token=token, data=task_data
+        )
+
+        assert status_code == 201
+        assert created_task["title"] == self.DEFAULT_TASK_TITLE
+
+        status_code, task = self.make_async_request(
+            "GET", f"/api/accounts/{account.id}/tasks/{created_task['id']}", token=token
+        )
+
+        assert status_code == 200
+        assert task == created_task
+
+    def test_create_task_missing_title(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        status_code, error = self.make_async_request(
+            "POST", f"/api/accounts/{account.id}/tasks", token=token, data={"description": "description"}
+        )
+
+        assert status_code == 400
+        assert error["code"] == TaskErrorCode.BAD_REQUEST
+        assert "Title is required" in error["message"]
+
+    def test_get_paginated_tasks_with_comment_stats(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=3)
+        self.create_multiple_test_comments(account_id=account.id, task_id=tasks[0].id, count=2)
+
+        status_code, response_data = self.make_async_request(
+            "GET", f"/api/accounts/{account.id}/tasks?size=2&include=comment_stats", token=token
+        )
+
+        assert status_code == 200
+        assert len(response_data["items"]) == 2
+        assert response_data["total_count"] == 3
+
+    def test_update_and_delete_comment(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        comment = self.create_test_comment(account_id=account.id, task_id=task.id)
+        comment_url = f"/api/accounts/{account.id}/tasks/{task.id}/comments/{comment.id}"
+
+        status_code, updated_comment = self.make_async_request(
+            "PATCH", comment_url, token=token, data={"content": "Updated comment"}
+        )
+
+        assert status_code == 200
+        assert updated_comment["content"] == "Updated comment"
+
+        status_code, _ = self.make_async_request("DELETE", comment_url, token=token)
+        assert status_code == 204
+
+        status_code, _ = self.make_async_request("GET", comment_url, token=token)
+        assert status_code == 404
+
+    def test_task_batch(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        status_code, response_data = self.make_async_request(
+            "POST",
+            f"/api/accounts/{account.id}/tasks:batch",
+            token=token,
+            data={"create": [{"title": "Task 1", "description": "Description 1"}]},
+        )
+
+        assert status_code == 200
+        assert response_data["create"][0]["success"] is True
+
+    def test_request_without_token_is_rejected(self) -> None:
+        account, _ = self.create_account_and_get_token()
+
+        status_code, error = self.make_async_request("GET", f"/api/accounts/{account.id}/tasks")
+
+        assert status_code == 401
+        assert error["code"] == AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND
+
+    def test_update_account_profile(self) -> None:
+        account, _ = self.create_account_and_get_token()
+
+        status_code, updated_account = self.make_async_request(
+            "PATCH", f"/api/accounts/{account.id}", data={"first_name": "Updated"}
+        )
+
+        assert status_code == 200
+        assert updated_account["first_name"] == "Updated"
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from modules.application.common.types import PaginationParams
+from modules.application.common.types import CountMode, PaginationParams
 from modules.task.errors import CommentNotFoundError
 from modules.task.comment_service import CommentService
 from modules.task.comment_types import (
@@ -109,6 +109,20 @@ class TestCommentService(BaseTestTask):
         assert result.total_count == 5
         assert result.total_pages == 2
 
+    def test_get_paginated_comments_without_count(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=task.id, count=2)
+        pagination_params = PaginationParams(page=1, size=10, offset=0)
+        get_params = GetPaginatedCommentsParams(
+            account_id=self.account.id, task_id=task.id, pagination_params=pagination_params, count_mode=CountMode.NONE
+        )
+
+        result = CommentService.get_paginated_comments(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count is None
+        assert result.total_pages is None
+
     def test_update_comment(self) -> None:
         task = self.create_test_task(account_id=self.account.id)
         created_comment = self.create_test_comment(account_id=self.account.id, task_id=task.id, content="Original")
@@ -1,6 +1,10 @@
+import base64
+import json
+
 from server import app
 
 from modules.authentication.types import AccessTokenErrorCode
+from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.types import TaskErrorCode
 from tests.modules.task.base_test_task import BaseTestTask
 
@@ -106,6 +110,130 @@ class TestTaskApi(BaseTestTask):
 
         assert response1.json["items"][0]["id"] != response2.json["items"][0]["id"]
 
+    def test_get_all_tasks_with_cursor_pagination(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=5)
+
+        response1 = self.make_authenticated_request("GET", account.id, token, query_params="size=2")
+        next_cursor = response1.json["next_cursor"]
+        response2 = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"size=2&after={next_cursor}"
+        )
+        offset_response = self.make_authenticated_request("GET", account.id, token, query_params="page=2&size=2")
+
+        assert response1.status_code == 200
+        assert next_cursor is not None
+        assert response2.status_code == 200
+        self.assert_pagination_response(response2.json, expected_items_count=2, expected_total_count=5)
+        assert [item["id"] for item in response2.json["items"]] == [
+            item["id"] for item in offset_response.json["items"]
+        ]
+
+        response3 = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"size=2&after={response2.json['next_cursor']}"
+        )
+
+        assert response3.status_code == 200
+        self.assert_pagination_response(response3.json, expected_items_count=1, expected_total_count=5)
+        assert response3.json["items"][0]["title"] == "Task 1"
+        assert response3.json["next_cursor"] is None
+
+    def test_get_all_tasks_with_invalid_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="after=not-a-cursor")
+        # Valid base64 and JSON, but an ObjectId bson cannot build
+        invalid_id_cursor = base64.urlsafe_b64encode(b'{"_id": {"$oid": "zzz"}}').decode("ascii")
+        invalid_id_response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"after={invalid_id_cursor}"
+        )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+        self.assert_error_response(invalid_id_response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_with_cursor_and_page(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+        next_cursor = self.make_authenticated_request("GET", account.id, token, query_params="size=2").json[
+            "next_cursor"
+        ]
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"page=2&size=2&after={next_cursor}"
+        )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_without_count(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="size=2&count=none")
+
+        assert response.status_code == 200
+        assert len(response.json["items"]) == 2
+        assert response.json["total_count"] is None
+        assert response.json["total_pages"] is None
+        assert response.json["next_cursor"] is not None
+
+    def test_get_all_tasks_with_invalid_count(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="count=approximate")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_with_comment_stats(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        self.create_test_comment(account_id=account.id, task_id=tasks[0].id, content="First comment")
+        latest_comment = self.create_test_comment(account_id=account.id, task_id=tasks[0].id, content="Latest comment")
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include=comment_stats")
+
+        assert response.status_code == 200
+        items_by_id = {item["id"]: item for item in response.json["items"]}
+        assert items_by_id[tasks[0].id]["comment_stats"]["count"] == 2
+        assert items_by_id[tasks[0].id]["comment_stats"]["latest_comment"]["id"] == latest_comment.id
+        assert items_by_id[tasks[1].id]["comment_stats"] == {"count": 0, "latest_comment": None}
+
+    def test_get_all_tasks_without_comment_stats_omits_them(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=1)
+
+        response = self.make_authenticated_request("GET", account.id, token)
+
+        assert response.status_code == 200
+        assert "comment_stats" not in response.json["items"][0]
+
+    def test_get_all_tasks_with_invalid_include(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include=everything")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_export_tasks_with_comments(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=3)
+        comment = self.create_test_comment(account_id=account.id, task_id=tasks[0].id)
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}:export?include=comments",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        exported_tasks = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert {exported_task["id"] for exported_task in exported_tasks} == {task.id for task in tasks}
+        exported_tasks_by_id = {exported_task["id"]: exported_task for exported_task in exported_tasks}
+        assert [exported_comment["id"] for exported_comment in exported_tasks_by_id[tasks[0].id]["comments"]] == [
+            comment.id
+        ]
+        assert exported_tasks_by_id[tasks[1].id]["comments"] == []
+
     def test_get_all_tasks_no_auth(self) -> None:
         account, _ = self.create_account_and_get_token()
 
@@ -232,6 +360,55 @@ class TestTaskApi(BaseTestTask):
 
         self.assert_error_response(response, 401, AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND)
 
+    def test_batch_tasks_success(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_to_update = self.create_test_task(account_id=account.id)
+        task_to_delete = self.create_test_task(account_id=account.id)
+        missing_task_id = "507f1f77bcf86cd799439011"
+        batch_data = {
+            "create": [{"title": "Batch Task", "description": "Created in a batch"}],
+            "update": [
+                {"id": task_to_update.id, "title": "Updated Task", "description": "Updated in a batch"},
+                {"id": missing_task_id, "title": "Missing Task", "description": "Does not exist"},
+            ],
+            "delete": [{"id": task_to_delete.id}],
+        }
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:batch",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps(batch_data),
+            )
+
+        assert response.status_code == 200
+        assert response.json["create"][0]["success"] is True
+        assert response.json["create"][0]["task"]["title"] == "Batch Task"
+        assert response.json["update"][0]["success"] is True
+        assert response.json["update"][1]["success"] is False
+        assert response.json["update"][1]["error_code"] == TaskErrorCode.NOT_FOUND
+        assert response.json["delete"][0]["success"] is True
+
+        updated_response = self.make_authenticated_request("GET", account.id, token, task_id=task_to_update.id)
+        assert updated_response.json.get("title") == "Updated Task"
+        deleted_response = self.make_authenticated_request("GET", account.id, token, task_id=task_to_delete.id)
+        assert deleted_response.status_code == 404
+
+    def test_batch_tasks_invalid_item(self) -> None:
+        account, token = self.create_account_and_get_token()
+        batch_data = {"create": [{"title": "Batch Task", "description": "Valid"}, {"title": "Missing description"}]}
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:batch",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps(batch_data),
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+        assert "Description is required for create item 1" in response.json.get("message")
+        assert TaskRepository.collection().count_documents({"account_id": account.id}) == 0
+
     def test_tasks_are_account_isolated_via_api(self) -> None:
         account1, token1 = self.create_account_and_get_token("user1@example.com", "password1")
         account2, token2 = self.create_account_and_get_token("user2@example.com", "password2")
@@ -1,11 +1,23 @@
 from datetime import datetime
+from unittest.mock import patch
 
-from modules.application.common.types import PaginationParams
+from pymongo.collection import Collection
+
+from modules.application.common.types import CountMode, PaginationParams
 from modules.task.errors import TaskNotFoundError
+from modules.task.internal.store.comment_repository import CommentRepository
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_reader import TaskReader
 from modules.task.task_service import TaskService
 from modules.task.types import (
+    BulkCreateTasksParams,
+    BulkDeleteTasksParams,
+    BulkUpdateTasksParams,
+    BulkWriteTasksParams,
     CreateTaskParams,
     DeleteTaskParams,
+    ExportTasksParams,
     GetPaginatedTasksParams,
     GetTaskParams,
     TaskErrorCode,
@@ -30,6 +42,16 @@ class TestTaskService(BaseTestTask):
         assert task.description == self.DEFAULT_TASK_DESCRIPTION
         assert task.id is not None
 
+    def test_insert_one_and_return_matches_stored_document(self) -> None:
+        task_bson = TaskModel(
+            account_id=self.account.id, description=self.DEFAULT_TASK_DESCRIPTION, title=self.DEFAULT_TASK_TITLE
+        ).to_bson()
+
+        inserted_task_bson = TaskRepository.insert_one_and_return(task_bson)
+        stored_task_bson = TaskRepository.collection().find_one({"_id": inserted_task_bson["_id"]})
+
+        assert inserted_task_bson == stored_task_bson
+
     def test_get_task_for_account(self) -> None:
         created_task = self.create_test_task(account_id=self.account.id)
         get_params = GetTaskParams(account_id=self.account.id, task_id=created_task.id)
@@ -83,6 +105,69 @@ class TestTaskService(BaseTestTask):
         assert result.total_count == 5
         assert result.total_pages == 2
 
+    def test_get_paginated_tasks_with_cursor(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+        pagination_params = PaginationParams(page=1, size=3, offset=0)
+        get_params = GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+
+        first_page = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(first_page.items) == 3
+        assert first_page.next_cursor is not None
+
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=pagination_params, after=first_page.next_cursor
+        )
+        second_page = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(second_page.items) == 2
+        assert second_page.total_count == 5
+        assert second_page.next_cursor is None
+        assert {task.id for task in first_page.items}.isdisjoint({task.id for task in second_page.items})
+
+    def test_get_paginated_tasks_estimated_count_uses_cache(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        pagination_params = PaginationParams(page=1, size=10, offset=0)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=pagination_params, count_mode=CountMode.ESTIMATED
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+        assert result.total_count == 2
+
+        # Written behind the writer's back, so the cached count is still served
+        TaskRepository.collection().insert_one(
+            {
+                "account_id": self.account.id,
+                "title": "Raw",
+                "description": "Raw",
+                "active": True,
+                "created_at": datetime.now(),
+                "updated_at": datetime.now(),
+            }
+        )
+        result = TaskService.get_paginated_tasks(params=get_params)
+        assert result.total_count == 2
+        assert len(result.items) == 3
+
+        self.create_test_task(account_id=self.account.id)
+        result = TaskService.get_paginated_tasks(params=get_params)
+        assert result.total_count == 4
+        assert result.total_pages == 1
+
+    def test_get_paginated_tasks_without_count(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        pagination_params = PaginationParams(page=1, size=10, offset=0)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=pagination_params, count_mode=CountMode.NONE
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count is None
+        assert result.total_pages is None
+
     def test_get_paginated_tasks_default_pagination(self) -> None:
         self.create_test_task(account_id=self.account.id)
         pagination_params = PaginationParams(page=1, size=1, offset=0)
@@ -95,6 +180,21 @@ class TestTaskService(BaseTestTask):
         assert result.pagination_params.page == 1
         assert result.pagination_params.size == 1
 
+    def test_export_tasks_with_comments_across_batches(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+        comments = [self.create_test_comment(account_id=self.account.id, task_id=task.id) for task in tasks]
+
+        with patch.object(TaskReader, "EXPORT_BATCH_SIZE", 2):
+            task_exports = list(
+                TaskService.export_tasks(params=ExportTasksParams(account_id=self.account.id, include_comments=True))
+            )
+
+        assert {task_export.task.id for task_export in task_exports} == {task.id for task in tasks}
+        for task_export in task_exports:
+            assert task_export.comments is not None
+            assert [comment.task_id for comment in task_export.comments] == [task_export.task.id]
+        assert sum(len(task_export.comments or []) for task_export in task_exports) == len(comments)
+
     def test_update_task(self) -> None:
         created_task = self.create_test_task(
             account_id=self.account.id, title="Original Title", description="Original Description"
@@ -142,6 +242,25 @@ class TestTaskService(BaseTestTask):
         with self.assertRaises(TaskNotFoundError):
             TaskService.get_task(params=get_params)
 
+    def test_delete_task_soft_deletes_comments(self) -> None:
+        created_task = self.create_test_task(account_id=self.account.id)
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=created_task.id, count=3)
+
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=created_task.id))
+
+        assert CommentRepository.collection().count_documents({"task_id": created_task.id, "active": True}) == 0
+        assert CommentRepository.collection().count_documents({"task_id": created_task.id, "active": False}) == 3
+
+    def test_delete_task_without_cascade_keeps_comments(self) -> None:
+        created_task = self.create_test_task(account_id=self.account.id)
+        self.create_test_comment(account_id=self.account.id, task_id=created_task.id)
+
+        TaskService.delete_task(
+            params=DeleteTaskParams(account_id=self.account.id, task_id=created_task.id, cascade=False)
+        )
+
+        assert CommentRepository.collection().count_documents({"task_id": created_task.id, "active": True}) == 1
+
     def test_delete_task_not_found(self) -> None:
         non_existent_task_id = "507f1f77bcf86cd799439011"
         delete_params = DeleteTaskParams(account_id=self.account.id, task_id=non_existent_task_id)
@@ -151,6 +270,99 @@ class TestTaskService(BaseTestTask):
 
         assert context.exception.code == TaskErrorCode.NOT_FOUND
 
+    def test_bulk_create_tasks(self) -> None:
+        bulk_params = BulkCreateTasksParams(
+            tasks=[
+                CreateTaskParams(account_id=self.account.id, title=f"Task {index}", description=f"Description {index}")
+                for index in range(3)
+            ]
+        )
+
+        results = TaskService.bulk_create(params=bulk_params)
+
+        assert [result.index for result in results] == [0, 1, 2]
+        assert all(result.success for result in results)
+        for index, result in enumerate(results):
+            stored_task = TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=result.task_id))
+            assert stored_task == result.task
+            assert stored_task.title == f"Task {index}"
+
+    def test_bulk_update_tasks_reports_missing_items(self) -> None:
+        created_task = self.create_test_task(account_id=self.account.id)
+        other_account = self.create_test_account(username="otheruser@example.com")
+        other_account_task = self.create_test_task(account_id=other_account.id)
+        bulk_params = BulkUpdateTasksParams(
+            tasks=[
+                UpdateTaskParams(
+                    account_id=self.account.id, task_id=created_task.id, title="Updated", description="Updated"
+                ),
+                UpdateTaskParams(
+                    account_id=self.account.id, task_id=other_account_task.id, title="Hacked", description="Hacked"
+                ),
+            ]
+        )
+
+        results = TaskService.bulk_update(params=bulk_params)
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error_code == TaskErrorCode.NOT_FOUND
+        updated_task = TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=created_task.id))
+        assert updated_task.title == "Updated"
+        untouched_task = TaskService.get_task(
+            params=GetTaskParams(account_id=other_account.id, task_id=other_account_task.id)
+        )
+        assert untouched_task.title == self.DEFAULT_TASK_TITLE
+
+    def test_bulk_delete_tasks(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        bulk_params = BulkDeleteTasksParams(
+            tasks=[DeleteTaskParams(account_id=self.account.id, task_id=task.id) for task in tasks]
+        )
+
+        results = TaskService.bulk_delete(params=bulk_params)
+
+        assert all(result.success for result in results)
+        for task in tasks:
+            with self.assertRaises(TaskNotFoundError):
+                TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task.id))
+
+    def test_bulk_write_tasks_in_one_bulk_write(self) -> None:
+        task_to_update, task_to_delete, deleted_task = self.create_multiple_test_tasks(
+            account_id=self.account.id, count=3
+        )
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=deleted_task.id))
+        bulk_write_params = BulkWriteTasksParams(
+            create=BulkCreateTasksParams(
+                tasks=[CreateTaskParams(account_id=self.account.id, title="Created", description="Created")]
+            ),
+            update=BulkUpdateTasksParams(
+                tasks=[
+                    UpdateTaskParams(
+                        account_id=self.account.id, task_id=task_to_update.id, title="Updated", description="Updated"
+                    )
+                ]
+            ),
+            delete=BulkDeleteTasksParams(
+                tasks=[
+                    DeleteTaskParams(account_id=self.account.id, task_id=task_to_delete.id),
+                    DeleteTaskParams(account_id=self.account.id, task_id=deleted_task.id),
+                ]
+            ),
+        )
+
+        with patch.object(Collection, "bulk_write", autospec=True, side_effect=Collection.bulk_write) as bulk_write:
+            bulk_write_result = TaskService.bulk_write(params=bulk_write_params)
+
+        assert bulk_write.call_count == 1
+        assert bulk_write_result.create[0].success is True
+        assert bulk_write_result.update[0].task == TaskService.get_task(
+            params=GetTaskParams(account_id=self.account.id, task_id=task_to_update.id)
+        )
+        assert bulk_write_result.delete[0].success is True
+        assert bulk_write_result.delete[1].success is False
+        assert bulk_write_result.delete[1].error_code == TaskErrorCode.NOT_FOUND
+
     def test_task_isolation_between_accounts(self) -> None:
         other_account = self.create_test_account(username="otheruser@example.com")
 